@@ -1,42 +1,32 @@
+import os
+import sys
+
 import pandas as pd
 import numpy as np
+import unidecode
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.scoring import DEFAULT_RULES, load_rules
+
+# Rules file to rescore with (default: the league rules), e.g.
+#   python3 Gamelog/fantasypts_update.py wcc/rules/bonus_example.toml
+rules = load_rules(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_RULES)
 
 df = pd.read_csv("Gamelog/gamelog.csv")
 
-POINTS_DICT_NEW = {
-    "FGM": 2,
-    "FGA": -1,
-    "FTM": 1,
-    "FTA": -1,
-    "3PM": 2,
-    "3PA": -1,
-    "OREB": 1,
-    "DREB": 1,
-    "AST": 3,
-    "STL": 3.5,
-    "BLK": 3.5,
-    "TO": -2.5,
-    "PTS": 1.5,
-    "didWin":1
-}
-
-
-
-# Ensure stats are numeric (coerce bad strings to NaN)
-for col in POINTS_DICT_NEW:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-df["NewFP"] = 0.0
-for stat, w in POINTS_DICT_NEW.items():
-    if stat in df.columns:
-        df["NewFP"] += df[stat].fillna(0) * w
-        
-df["NewFP"] = df["NewFP"].round(0)
-df["NewFP"] = df["NewFP"].astype(int)
+# Positions for [positions] multipliers come from the roster
+positions = None
+if rules.positions:
+    roster = pd.read_csv("data/wcc_concat_updated.csv")
+    pos_map = dict(zip(roster["clean_name"], roster["Pos."]))
+    positions = df["Name"].map(lambda n: unidecode.unidecode(str(n).strip().lower())).map(pos_map)
+
+df["NewFP"] = rules.score(df, positions=positions)
+if rules.decimals == 0:
+    df["NewFP"] = df["NewFP"].astype(int)
 
 df2 = pd.read_csv("Gamelog/gamelog.csv")
 df2['FantasyPts'] = df['NewFP']
 print(df2[['Name','FantasyPts']].head(3))
 
-df2.to_csv("Gamelog/gamelog_updated.csv", index=False)
\ No newline at end of file
+df2.to_csv("Gamelog/gamelog_updated.csv", index=False)
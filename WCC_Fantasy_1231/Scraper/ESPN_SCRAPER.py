@@ -1,27 +1,52 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 import pandas as pd
 import os
 import time
+import re
+import sys
 from selenium.common.exceptions import NoSuchElementException
 from datetime import datetime
 import numpy as np
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.scoring import score
+from wcc.schema import enforce_schema
+from wcc.weeks import add_week_num_from_date
+from driver_session import DriverSession
+from fixups import FixupQueue
+from sinks import GAMELOG_KEY, checkpoint_for, make_sink
+from waits import wait_for, wait_for_all, wait_for_rows, print_wait_summary
+
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium.webdriver.common.by import By
 
-def safe_get_text(driver, xpath, label="value", allow_manual=True):
-    try:
-        return driver.find_element(By.XPATH, xpath).text.strip()
-    except (NoSuchElementException, TimeoutException) as e:
-        print(f"\n⚠️ Failed to scrape {label}")
-        print(f"XPath: {xpath}")
-        print(f"Error: {type(e).__name__}")
+def safe_get_text(driver, xpaths, label="value", allow_manual=True, step="team_name",
+                  fixups=None, game_id=None, field=None):
+    """
+    Text of the first XPath in xpaths (str or list of fallbacks) that is on the page.
 
-        if allow_manual:
-            manual = input(f"➡️ Enter {label} manually (or press Enter to skip): ").strip()
-            return manual if manual else None
-        return None
+    If none match: with a FixupQueue (batch mode) the miss is queued with a page
+    snapshot and a placeholder is returned so the scrape keeps going; otherwise the
+    value is asked for with input() when allow_manual is True.
+    """
+    if isinstance(xpaths, str):
+        xpaths = [xpaths]
+    for n, xpath in enumerate(xpaths):
+        try:
+            if n == 0:
+                return wait_for(driver, step, By.XPATH, xpath).text.strip()
+            return driver.find_element(By.XPATH, xpath).text.strip()  # page is loaded by now
+        except (NoSuchElementException, TimeoutException) as e:
+            print(f"\n⚠️ Failed to scrape {label}")
+            print(f"XPath: {xpath}")
+            print(f"Error: {type(e).__name__}")
+
+    if fixups is not None:
+        return fixups.add(game_id, field or label, label, xpaths, driver)
+    if allow_manual:
+        manual = input(f"➡️ Enter {label} manually (or press Enter to skip): ").strip()
+        return manual if manual else None
+    return None
 
 
 def get_indices(rows_text):
@@ -47,9 +72,26 @@ def get_indices(rows_text):
     firststatsindex2 = lastplayerindex2 + 3
     laststatsindex2 = firststatsindex2 + (lastplayerindex2-firstplayerindex2+1) #these are the indices but if we want to graph the rows we use range(firststatsindex2,laststatsindex2+1)
     return firstplayerindex1,lastplayerindex1,firststatsindex1,laststatsindex1,firstplayerindex2,lastplayerindex2,firststatsindex2,laststatsindex2
-def process_team_data(player_rows, name_start, name_end, stats_start, stats_end):
+BOXSCORE_ROW_SELECTOR = "tr.Table__TR.Table__TR--sm.Table__even"
+
+# Text of every box score row in ONE WebDriver call. Cells are joined with "\n" and empty
+# cells dropped, which matches what WebElement.text gave us row by row.
+ROWS_TEXT_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(
+    tr => Array.from(tr.cells).map(td => td.innerText.trim()).filter(t => t).join("\\n")
+);
+"""
+
+
+def extract_rows_text(driver, selector=BOXSCORE_ROW_SELECTOR):
+    """Pull the text of every box score row with a single execute_script round-trip."""
+    return driver.execute_script(ROWS_TEXT_JS, selector)
+
+
+def process_team_data(rows_text, name_start, name_end, stats_start, stats_end):
+    # rows_text: plain strings, one per table row (see extract_rows_text)
     # Extract player name + jersey lines
-    raw_names = [player.text.replace("\n", " ") for player in player_rows[name_start:name_end]]
+    raw_names = [row.replace("\n", " ") for row in rows_text[name_start:name_end]]
     raw_names.pop(5)  # Remove element at index 5 (Totals row, usually)
 
     # Split into Name and Jersey
@@ -65,7 +107,7 @@ def process_team_data(player_rows, name_start, name_end, stats_start, stats_end)
             names.append(entry)
 
     # Extract stats rows
-    stats = [player.text.replace("\n", " ") for player in player_rows[stats_start+1:stats_end]]
+    stats = [row.replace("\n", " ") for row in rows_text[stats_start+1:stats_end]]
   
     
     # Extract column names
@@ -89,34 +131,6 @@ def process_team_data(player_rows, name_start, name_end, stats_start, stats_end)
     
     return df
 
-def calculate_fantasy_points(row):
-   
-    # Define rules for calculating fantasy points for each stat
-    points_dict = {
-        "FGM": 2,
-        "FGA": -1,
-        "FTM": 1,
-        "FTA": -1,
-        "3PM": 2,
-        "3PA": -1,
-        "OREB": 1,
-        "DREB": 1,
-        "AST": 3,
-        "STL": 3.5,
-        "BLK": 3.5,
-        "TO": -2.5,
-        "PTS": 1.5,
-        "didWin":1
-    }
-
-    fp = 0.0
-    for stat, w in points_dict.items():
-        if stat in row:
-            val = pd.to_numeric(row[stat], errors="coerce")
-            if pd.notna(val):
-                fp += w * float(val)
-    return round(fp, 0)
-
 WCC_FULLTEAMNAMES = {
     "Santa Clara Broncos",
     "Loyola Marymount Lions",
@@ -135,26 +149,6 @@ WCC_FULLTEAMNAMES = {
 def conf_from_fullteam(fullteamname: str) -> str:
     return "wcc" if fullteamname in WCC_FULLTEAMNAMES else "other"
 
-import pandas as pd
-
-# Define your season boundaries
-WEEK0_END   = pd.Timestamp("2025-12-27")   # everything <= this is week 0
-WEEK1_START = pd.Timestamp("2025-12-28")   # week 1 starts Sunday 12/28
-SEASON_END  = pd.Timestamp("2026-02-28")   # season ends Saturday 2/28
-
-def add_week_num_from_date(date_series: pd.Series) -> pd.Series:
-    d = pd.to_datetime(date_series, errors="coerce")
-
-    weeknum = pd.Series(pd.NA, index=d.index, dtype="Int64")
-
-    # Week 0
-    weeknum[d.le(WEEK0_END)] = 0
-
-    # Weeks 1+ (Sunday->Saturday blocks)
-    in_season = d.ge(WEEK1_START) & d.le(SEASON_END)
-    weeknum[in_season] = ((d[in_season] - WEEK1_START).dt.days // 7) + 1
-
-    return weeknum
 
 
 
@@ -176,171 +170,317 @@ def expand_shooting_stats(df):
         df.drop(columns=["FT"], inplace=True)
 
     return df
-def scrape_dailyboxscores(websites, csv_file_name, folder_path):
+
+
+SCOREBOARD_URL = "https://www.espn.com/womens-college-basketball/scoreboard/_/date/{date}/group/29"
+BOXSCORE_URL = "https://www.espn.com/womens-college-basketball/boxscore/_/gameId/{game_id}"
+
+# Scoreboard page: every game card is section/div/section[i], its box score button is div[2]/a[2]
+#/html/body/div[1]/div/div/div/div/main/div[2]/div[2]/div/div/div[1]/div/div/section/div/section[1]/div[2]/a[2]
+BOXSCORE_LINKS_XPATH = '/html/body/div[1]/div/div/div/div/main/div[2]/div[2]/div/div[1]/div[1]/div/div/section/div/section/div[2]/a[2]'
+SCOREBOARD_DATE_XPATH = '/html/body/div[1]/div/div/div/div/main/div[2]/div[2]/div/div/div[1]/div/div/section/header/div[1]'
+
+# Box score page
+AWAY_TEAM_XPATH = '/html/body/div[1]/div/div/div/div/main/div[2]/div/div[2]/div/div[2]/div[2]/div/div/section[1]/div/div/div/div[1]/div/div[1]/div[1]'
+HOME_TEAM_XPATH = '/html/body/div[1]/div/div/div/div/main/div[2]/div/div[2]/div/div[2]/div[2]/div/div/section[1]/div/div/div/div[2]/div/div[1]/div[1]'
+# Fallbacks tried in order when the layout shifts: box score table titles
+AWAY_TEAM_XPATHS = [AWAY_TEAM_XPATH, "(//div[contains(@class,'BoxscoreItem__TeamName')])[1]"]
+HOME_TEAM_XPATHS = [HOME_TEAM_XPATH, "(//div[contains(@class,'BoxscoreItem__TeamName')])[2]"]
+
+COLUMN_ORDER = ['Name', 'Jersey #', 'Team','Opponent','didWin', 'Date', 'MIN', 'OREB', 'DREB', 'REB', 'AST',
+                'STL', 'BLK', 'TO', 'PF', 'FGM', 'FGA', '3PM', '3PA', 'FTM','FTA', 'efg%',
+                'PTS', 'FantasyPts','isWCC', 'weeknum', 'GameId']
+
+
+def game_id_from_url(url):
+    match = re.search(r"gameId/(\d+)", url or "")
+    return match.group(1) if match else None
+
+
+def discover_games(session, website, archive=None):
     """
-    Scrape daily box scores from ESPN scoreboard pages and save the data to CSV files.
+    Load one scoreboard page and return every game on it as a unit of work.
 
     Parameters:
-    - websites (list): List of URLs for daily box score pages.
-    - csv_file_name (str): The name to use when saving the CSV file.
-    - folder_path (str): The folder path where the CSV file will be saved.
+    - session (DriverSession): Browser session to load the page with.
+    - website (str): ESPN scoreboard URL for one day.
+    - archive (PageArchive, optional): Store the raw scoreboard page here.
 
     Returns:
-    - pd.DataFrame: A DataFrame containing the scraped data.
+    - list[dict]: One {"game_id", "boxscore_url", "date", "scoreboard_url"} per game.
     """
+    driver = session.get(website)
+
+    # Get the Date from the scoreboard page
     formatted_date = 'N/A'
-    dataframes = []
+    try:
+        xpathb_ = wait_for(driver, "scoreboard_date", By.XPATH, SCOREBOARD_DATE_XPATH).text
+        date_object = datetime.strptime(xpathb_, '%A, %B %d, %Y')
+        formatted_date = date_object.strftime('%m/%d/%y')
+    except (NoSuchElementException, TimeoutException, ValueError):
+        print("Date not found with outer div class.\n")
+
+    if archive is not None:
+        archive.put("scoreboard", formatted_date, website, driver.page_source)
+
+    # All box score buttons in one lookup instead of probing section[i] until it fails
+    try:
+        links = wait_for_all(driver, "boxscore_links", By.XPATH, BOXSCORE_LINKS_XPATH)
+    except TimeoutException:
+        links = []  # no games that day
+
+    games = []
+    for link in links:
+        game_id = game_id_from_url(link.get_attribute("href"))
+        if game_id is None:
+            continue
+        games.append({
+            "game_id": game_id,
+            "boxscore_url": BOXSCORE_URL.format(game_id=game_id),
+            "date": formatted_date,
+            "scoreboard_url": website,
+        })
+
+    print(f"🔎 Found {len(games)} box score(s) on {formatted_date}")
+    return games
+
+
+def scrape_game(session, game, archive=None, fixups=None):
+    """
+    Load one box score page directly and return (away_df, home_df) in COLUMN_ORDER.
+
+    Parameters:
+    - session (DriverSession): Browser session to load the page with.
+    - game (dict): Work item from discover_games.
+    - archive (PageArchive, optional): Store the raw box score page here (keyed by game id).
+    - fixups (FixupQueue, optional): Batch mode, queue unresolved fields instead of asking.
+    """
+    driver = session.get(game["boxscore_url"])
+
+    # Extract player rows (as soon as the tables have rendered), all in one round-trip
+    wait_for_rows(driver, "boxscore_rows", By.CSS_SELECTOR, BOXSCORE_ROW_SELECTOR)
+    rows_text = extract_rows_text(driver)
+    print(rows_text[:3])
+
+    if archive is not None:
+        archive.put("boxscore", game["game_id"], game["boxscore_url"], driver.page_source, meta=game)
+
+    fullteamname1 = safe_get_text(driver, AWAY_TEAM_XPATHS, label="Full Team Name (Away)",
+                                  fixups=fixups, game_id=game["game_id"], field="away_team")
+    fullteamname2 = safe_get_text(driver, HOME_TEAM_XPATHS, label="Full Team Name (Home)",
+                                  fixups=fixups, game_id=game["game_id"], field="home_team")
+
+    return build_game_frames(rows_text, fullteamname1, fullteamname2, game)
 
-    for website in websites:
-        i = 1
-        while True:
-            driver = webdriver.Chrome()
-            driver.get(website)
-                    #/html/body/div[1]/div/div/div/div/main/div[2]/div[2]/div/div/div[1]/div/div/section/div/section/div[2]/a[2]
-                    #/html/body/div[1]/div/div/div/div/main/div[2]/div[2]/div/div/div[1]/div/div/section/div/section[1]/div[2]/a[2]
-                    # change section 5 to section[{i}]
-            xpatha = f'/html/body/div[1]/div/div/div/div/main/div[2]/div[2]/div/div[1]/div[1]/div/div/section/div/section[{i}]/div[2]/a[2]'
-                
-            xpathb = '/html/body/div[1]/div/div/div/div/main/div[2]/div[2]/div/div/div[1]/div/div/section/header/div[1]'
-                    
+
+def build_game_frames(rows_text, fullteamname1, fullteamname2, game):
+    """
+    Turn box score row text + team names into (away_df, home_df) in COLUMN_ORDER.
+
+    Shared by the Selenium path (scrape_game) and the HTTP path (http_ingest.py).
+    """
+    formatted_date = game["date"]
+
+    # Split into team 1 and team 2
+    namestart1, nameend1, statstart1, statend1, namestart2, nameend2, statstart2, statend2 = get_indices(rows_text)
+
+    team1_df = process_team_data(rows_text, namestart1, nameend1 + 1, statstart1, statend1 + 1)
+    team1_df = expand_shooting_stats(team1_df)
+    team2_df = process_team_data(rows_text, namestart2, nameend2 + 1, statstart2, statend2 + 1)
+    team2_df = expand_shooting_stats(team2_df)
+    #team1_df['Name'] = team1_df['Name'].str.rstrip('#')
+    #team2_df['Name'] = team2_df['Name'].str.rstrip('#') 
+
+    # Insert columns
+    for df, team, opp in [(team1_df, fullteamname1, fullteamname2),
+                          (team2_df, fullteamname2, fullteamname1)]:
+        df.insert(2, "Team", team)
+        df.insert(3, "Date", formatted_date)
+        df.insert(len(df.columns) - 1, "Opponent", opp)
+
+    # Cast to the gamelog schema once, here; everything below works on typed columns
+    team1_df = enforce_schema(team1_df, label=f"game {game['game_id']}")
+    team2_df = enforce_schema(team2_df, label=f"game {game['game_id']}")
+
+    score1 = team1_df["PTS"].sum()
+    score2 = team2_df["PTS"].sum()
+
+    if score1 > score2:
+        team1_win, team2_win = 1, 0
+    else:
+        team1_win, team2_win = 0, 1
+
+    team1_df["didWin"] = np.int8(team1_win)
+    team2_df["didWin"] = np.int8(team2_win)
+
+    team1_conf = conf_from_fullteam(fullteamname1)
+    team2_conf = conf_from_fullteam(fullteamname2)
+
+    team1_df["conf"] = team1_conf
+    team2_df["conf"] = team2_conf
+
+    team1_df["isWCC"] = team1_df["conf"].eq("wcc")
+    team2_df["isWCC"] = team2_df["conf"].eq("wcc")
+
+    for df in (team1_df, team2_df):
+
+        df["efg%"] = np.where(
+            df["FGA"] > 0,
+            (df["FGM"] + 0.5 * df["3PM"]) / df["FGA"],
+            np.nan
+        )
+
+        df["efg%"] = df["efg%"].round(3).astype("float32")
+
+    # Apply Fantasy Points
+    team1_df["FantasyPts"] = score(team1_df).astype("float32")  # league rules: wcc/rules/default.toml
+    team2_df["FantasyPts"] = score(team2_df).astype("float32")
+
+    # ESPN game id: tells doubleheaders apart and keys the gamelog upsert (see sinks.py)
+    team1_df["GameId"] = game["game_id"]
+    team2_df["GameId"] = game["game_id"]
+
+    # Fantasy week from the game date, so every sink (CSV, SQLite, week partitions) files the rows under it
+    team1_df["weeknum"] = add_week_num_from_date(team1_df["Date"])
+    team2_df["weeknum"] = add_week_num_from_date(team2_df["Date"])
+
+    print(f"✅ Scraped: {fullteamname1} vs {fullteamname2} on {formatted_date} (game {game['game_id']})")
+    team1_df = enforce_schema(team1_df[COLUMN_ORDER])  # only the columns added above still need a cast
+    team2_df = enforce_schema(team2_df[COLUMN_ORDER])
+    print(team1_df[['Name','FantasyPts']].sort_values(by='FantasyPts', ascending=False).head(3))
+    print(team2_df[['Name','FantasyPts']].sort_values(by='FantasyPts', ascending=False).head(3))
+    return team1_df, team2_df
+
+
+def iter_scraped_games(session, games, retries=1, archive=None, fixups=None, failed=None):
+    """
+    Scrape games one at a time and yield (game, team1_df, team2_df) as each one finishes.
+
+    A game that still fails after retries is skipped and its id appended to failed.
+    The browser is restarted if it dies mid-game.
+    """
+    for game in games:
+        for attempt in range(retries + 1):
             try:
-                # Find the box score button
-                try:
-                    xpatha_ = driver.find_element(By.XPATH, xpatha)
-                except (NoSuchElementException, ValueError):
-                    print("No more box scores found.\n")
-                    driver.quit()
-                    break
-
-                # Get the Date from the scoreboard page
-                try:
-                    xpathb_ = driver.find_element(By.XPATH, xpathb).text
-                    time.sleep(1.8)
-                    date_object = datetime.strptime(xpathb_, '%A, %B %d, %Y')
-                    formatted_date = date_object.strftime('%m/%d/%y')
-                except (NoSuchElementException, ValueError):
-                    print("Date not found with outer div class.\n")
-
-                # Click box score
-                xpatha_.click()
-                time.sleep(2.5)
-
-                # Extract player rows
-                player_rows = driver.find_elements(By.CLASS_NAME, "Table__TR.Table__TR--sm.Table__even")
-                time.sleep(3.9)
-                rows_text = [player.text for player in player_rows]
-                print(rows_text[:3])
-
-                # Split into team 1 and team 2
-                namestart1, nameend1, statstart1, statend1, namestart2, nameend2, statstart2, statend2 = get_indices(rows_text)
-
-                team1_df = process_team_data(player_rows, namestart1, nameend1 + 1, statstart1, statend1 + 1)
-                team1_df = expand_shooting_stats(team1_df)
-                team2_df = process_team_data(player_rows, namestart2, nameend2 + 1, statstart2, statend2 + 1)
-                team2_df = expand_shooting_stats(team2_df)
-                #team1_df['Name'] = team1_df['Name'].str.rstrip('#')
-                #team2_df['Name'] = team2_df['Name'].str.rstrip('#') 
-                
-                fullteamname1 = safe_get_text(
-                    driver,
-                    '/html/body/div[1]/div/div/div/div/main/div[2]/div/div[2]/div/div[2]/div[2]/div/div/section[1]/div/div/div/div[1]/div/div[1]/div[1]',
-                    label="Full Team Name (Away)"
-                )
-
-                fullteamname2 = safe_get_text(
-                    driver,
-                    '/html/body/div[1]/div/div/div/div/main/div[2]/div/div[2]/div/div[2]/div[2]/div/div/section[1]/div/div/div/div[2]/div/div[1]/div[1]',
-                    label="Full Team Name (Home)"
-            )
-                # Insert columns
-                for df, team, opp in [(team1_df, fullteamname1, fullteamname2),
-                                      (team2_df, fullteamname2, fullteamname1)]:
-                    df.insert(2, "Team", team)
-                    df.insert(3, "Date", formatted_date)
-                    df.insert(len(df.columns) - 1, "Opponent", opp)
-                
-                score1 = team1_df["PTS"].astype(int).sum()
-                score2 = team2_df["PTS"].astype(int).sum()
-
-                if score1 > score2:
-                    team1_win, team2_win = 1, 0
-                else:
-                    team1_win, team2_win = 0, 1
-
-                team1_df["didWin"] = team1_win
-                team2_df["didWin"] = team2_win
-
-                team1_conf = conf_from_fullteam(fullteamname1)
-                team2_conf = conf_from_fullteam(fullteamname2)
-
-                team1_df["conf"] = team1_conf
-                team2_df["conf"] = team2_conf
-
-                team1_df["isWCC"] = team1_df["conf"].eq("wcc")
-                team2_df["isWCC"] = team2_df["conf"].eq("wcc")
-
-                for df in (team1_df, team2_df):
-
-                    df["FGM"] = pd.to_numeric(df["FGM"], errors="coerce")
-                    df["3PM"] = pd.to_numeric(df["3PM"], errors="coerce")
-                    df["FGA"] = pd.to_numeric(df["FGA"], errors="coerce")
-
-                    df["efg%"] = np.where(
-                        df["FGA"] > 0,
-                        (df["FGM"] + 0.5 * df["3PM"]) / df["FGA"],
-                        np.nan
-                    )
-
-                    df["efg%"] = df["efg%"].round(3)
-                
-                # Apply Fantasy Points
-                team1_df["FantasyPts"] = team1_df.apply(calculate_fantasy_points, axis=1)
-                team2_df["FantasyPts"] = team2_df.apply(calculate_fantasy_points, axis=1)
-                
-                print(f"✅ Scraped: {fullteamname1} vs {fullteamname2} on {formatted_date}")
-                column_order = ['Name', 'Jersey #', 'Team','Opponent','didWin', 'Date', 'MIN', 'OREB', 'DREB', 'REB', 'AST',
-                                'STL', 'BLK', 'TO', 'PF', 'FGM', 'FGA', '3PM', '3PA', 'FTM','FTA', 'efg%',
-                                'PTS', 'FantasyPts','isWCC']
-                team1_df = team1_df[column_order]
-                team2_df = team2_df[column_order]
-                print(team1_df[['Name','FantasyPts']].sort_values(by='FantasyPts', ascending=False).head(3))
-                print(team2_df[['Name','FantasyPts']].sort_values(by='FantasyPts', ascending=False).head(3))
-                time.sleep(1.5)
-                dataframes.append(team1_df)
-                dataframes.append(team2_df)
-                
+                team1_df, team2_df = scrape_game(session, game, archive, fixups)
             except Exception as e:
-                print(f"An error occurred: {str(e)}")
+                print(f"An error occurred on game {game['game_id']} (attempt {attempt + 1}): {str(e)}")
+                if not session.is_alive():
+                    # Browser died mid-game: start a fresh one before retrying
+                    print("⚠️ Browser session lost, restarting")
+                    session.restart()
+            else:
+                yield game, team1_df, team2_df
+                break
+        else:
+            if failed is not None:
+                failed.append(game["game_id"])
 
-            driver.quit()
-            i += 1
 
-        print(f"-----\nEnd of Day {formatted_date}\n-----")
+def scrape_dailyboxscores(websites, csv_file_name, folder_path, session=None, recycle_after=40, retries=1,
+                          archive=None, fixups=None, sink=None, resume=False, collect=True):
+    """
+    Scrape daily box scores from ESPN scoreboard pages and save the data to CSV files.
+
+    Works in two stages: each scoreboard page is loaded once to collect every game's
+    box score URL and ESPN game id, then the box scores are loaded directly. Games are
+    deduped and retried by game id. One browser session is reused for the whole run,
+    and elapsed time per stage is printed so backfills can be timed.
 
-    # Write the concatenated data to a CSV file
+    Each game is written to the sink as soon as it is scraped and its id is added to
+    the sink's checkpoint file (<sink path>.done), so a crash loses at most one game.
+
+    Parameters:
+    - websites (list): List of URLs for daily box score pages.
+    - csv_file_name (str): The name to use when saving the CSV file.
+    - folder_path (str): The folder path where the CSV file will be saved.
+    - session (DriverSession, optional): Browser session to reuse. If None, one is
+      created for this run and closed at the end.
+    - recycle_after (int): Page loads before the browser is restarted (when session is None).
+    - retries (int): Extra attempts for a game that fails to scrape.
+    - archive (PageArchive, optional): Record every fetched page for offline replay.
+    - fixups (FixupQueue, optional): Batch mode for unattended runs. Fields that can't
+      be scraped are queued (see fixups.py) instead of stopping at input().
+    - sink (optional): Where each game is written (see sinks.py). Defaults to
+      make_sink("csv", folder_path/csv_file_name): an UpsertCsvSink, so re-running a day never
+      duplicates rows, wrapped in a CubeSink when that is the league gamelog.
+    - resume (bool): Skip games already recorded in the sink's checkpoint.
+    - collect (bool): Also keep the rows in memory and return them. Turn off for long
+      runs so memory stays flat.
+
+    Returns:
+    - pd.DataFrame: A DataFrame containing the scraped data (empty when collect is False).
+    """
+    dataframes = []
+    if sink is None:
+        sink = make_sink("csv", os.path.join(folder_path, csv_file_name))  # the league gamelog also feeds the cube
+    checkpoint = checkpoint_for(sink)
+
+    own_session = session is None
+    if own_session:
+        session = DriverSession(recycle_after=recycle_after)
+    run_start = time.perf_counter()
+
+    try:
+        # --- Stage 1: discover games, one scoreboard load per day ---
+        games = []
+        seen_ids = set()
+        for website in websites:
+            for game in discover_games(session, website, archive):
+                if game["game_id"] not in seen_ids:
+                    seen_ids.add(game["game_id"])
+                    games.append(game)
+        discover_done = time.perf_counter()
+        print(f"📋 {len(games)} game(s) to scrape from {len(websites)} day(s) ({discover_done - run_start:.1f}s)")
+        if resume:
+            skipped = len(games)
+            games = checkpoint.remaining(games)
+            print(f"⏩ Resuming: {skipped - len(games)} game(s) already in {checkpoint.path}")
+
+        # --- Stage 2: fetch each box score directly, writing each game as it finishes ---
+        failed = []
+        for game, team1_df, team2_df in iter_scraped_games(session, games, retries, archive, fixups, failed):
+            game_df = pd.concat([team1_df, team2_df], ignore_index=True)
+            sink.write(game_df, game["game_id"])
+            checkpoint.mark(game["game_id"])
+            if collect:
+                dataframes.append(game_df)
+
+        if failed:
+            print(f"❌ Failed game ids: {', '.join(failed)}")
+    finally:
+        sink.close()
+        if own_session:
+            session.quit()
+
+    print(f"⏱️ Scraped {len(games) - len(failed)}/{len(games)} game(s) in {time.perf_counter() - run_start:.1f}s "
+          f"({session.total_pages} page loads, {session.starts} browser start(s))")
+    print_wait_summary()
+
+    if not dataframes:
+        return pd.DataFrame()
     concatenated_df = pd.concat(dataframes, ignore_index=True)
-    os.makedirs(folder_path, exist_ok=True)
-    csv_file_path = os.path.join(folder_path, csv_file_name)
-    
-        # --- Append or write logic ---
-    if os.path.exists(csv_file_path):
-        # Append without headers
-        concatenated_df.to_csv(csv_file_path, index=False, mode='a', header=False)
-    else:
-        # Write new file with headers
-        concatenated_df.to_csv(csv_file_path, index=False, mode='w', header=True)
-    concatenated_df = concatenated_df.drop_duplicates(subset=['Name','Team','Date'])
-    # usage
-    concatenated_df["weeknum"] = add_week_num_from_date(concatenated_df["Date"])
-    
+    concatenated_df = concatenated_df.drop_duplicates(subset=list(GAMELOG_KEY), keep="last")
     return concatenated_df
 
-website = [
-    f"https://www.espn.com/womens-college-basketball/scoreboard/_/date/202601{d:02d}/group/29"
-    for d in range(4,5)
-]
 
-csv_file_name = f'gamelog-0104.csv'
-folder_path = 'Gamelog'
-df_result = scrape_dailyboxscores(websites=website,csv_file_name=csv_file_name,folder_path=folder_path)
-time.sleep(3)
\ No newline at end of file
+def scoreboard_url(day):
+    """ESPN WCC (group 29) scoreboard URL for a date."""
+    return SCOREBOARD_URL.format(date=day.strftime("%Y%m%d"))
+
+
+if __name__ == "__main__":
+    website = [
+        f"https://www.espn.com/womens-college-basketball/scoreboard/_/date/202601{d:02d}/group/29"
+        for d in range(4,5)
+    ]
+
+    csv_file_name = f'gamelog-0104.csv'
+    folder_path = 'Gamelog'
+    # --batch: unattended run, queue fixups instead of stopping at input()
+    fixups = FixupQueue() if "--batch" in sys.argv else None
+    # --resume: skip games already written by an interrupted run
+    resume = "--resume" in sys.argv
+    df_result = scrape_dailyboxscores(websites=website,csv_file_name=csv_file_name,folder_path=folder_path,fixups=fixups,
+                                      resume=resume)
+    time.sleep(3)
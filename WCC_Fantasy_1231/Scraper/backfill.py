@@ -0,0 +1,220 @@
+"""
+Backfill a date range of WCC box scores with a pool of headless scrapers.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 Scraper/backfill.py --start 2025-11-03 --end 2026-02-28 --workers 4
+
+Stage 1 shards the dates across the pool and collects every game from the
+scoreboards. Stage 2 shards the games (deduped by ESPN game id) across the pool.
+Every worker appends each game to its own part file as soon as it is scraped, and
+the parts are streamed into one gamelog (CSV, Parquet or SQLite) at the end. All
+workers share one rate limiter, so the pool as a whole never loads pages faster
+than --min-interval allows.
+
+Part files and their checkpoints live in Gamelog/backfill/<start>_<end>/, so an
+interrupted backfill picks up where it stopped when re-run with --resume.
+"""
+import argparse
+import multiprocessing as mp
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from driver_session import DriverSession
+from page_archive import PageArchive
+from fixups import FixupQueue, FIXUPS_DIR
+from waits import print_wait_summary
+from sinks import CsvSink, Checkpoint, checkpoint_for, make_sink, sink_path
+from wcc.schema import read_gamelog
+from ESPN_SCRAPER import discover_games, iter_scraped_games, scoreboard_url
+
+
+class RateLimiter:
+    """Global politeness limit: at most one page load per min_interval seconds across all processes."""
+
+    def __init__(self, min_interval, ctx=mp):
+        self.min_interval = min_interval
+        self._next_slot = ctx.Value("d", 0.0, lock=False)
+        self._lock = ctx.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_limiter = None
+
+
+def _init_worker(limiter):
+    global _limiter
+    _limiter = limiter
+
+
+def _new_session(recycle_after):
+    return DriverSession(recycle_after=recycle_after, headless=True, before_get=_limiter.wait)
+
+
+def discover_shard(days, recycle_after, archive_dir=None):
+    """Worker task: discover the games on a list of days."""
+    archive = PageArchive(archive_dir) if archive_dir else None
+    games = []
+    with _new_session(recycle_after) as session:
+        for day in days:
+            try:
+                games.extend(discover_games(session, scoreboard_url(day), archive))
+            except Exception as e:
+                print(f"An error occurred discovering {day:%m/%d/%y}: {str(e)}")
+                if not session.is_alive():
+                    session.restart()
+    return games
+
+
+def scrape_shard(shard_id, games, part_dir, recycle_after, retries, archive_dir=None, fixups_dir=FIXUPS_DIR):
+    """Worker task: scrape a list of games, appending each one to this worker's part file."""
+    archive = PageArchive(archive_dir) if archive_dir else None
+    fixups = FixupQueue(fixups_dir)  # workers have no terminal, so always batch mode
+    sink = CsvSink(os.path.join(part_dir, f"part-{shard_id:02d}.csv"))
+    checkpoint = checkpoint_for(sink)
+    failed = []
+    with _new_session(recycle_after) as session:
+        for game, team1_df, team2_df in iter_scraped_games(session, games, retries, archive, fixups, failed):
+            sink.write(pd.concat([team1_df, team2_df], ignore_index=True), game["game_id"])
+            checkpoint.mark(game["game_id"])
+    print_wait_summary()
+    return failed
+
+
+def date_range(start, end):
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+def shard(items, n):
+    """Round-robin items into n lists (drops empty ones)."""
+    shards = [items[i::n] for i in range(n)]
+    return [s for s in shards if s]
+
+
+def completed_games(part_dir):
+    """Game ids already written by earlier runs into this part folder."""
+    done = set()
+    if os.path.isdir(part_dir):
+        for name in os.listdir(part_dir):
+            if name.endswith(".done"):
+                done |= Checkpoint(os.path.join(part_dir, name)).done
+    return done
+
+
+def merge_parts(part_dir, sink, chunksize=50_000):
+    """Stream every part file into sink in chunks (memory stays flat). Returns rows written."""
+    sink.clear()
+    rows = 0
+    for name in sorted(os.listdir(part_dir)):
+        if name.startswith("part-") and name.endswith(".csv"):
+            for chunk in read_gamelog(os.path.join(part_dir, name), chunksize=chunksize):
+                sink.write(chunk)
+                rows += len(chunk)
+    sink.close()
+    return rows
+
+
+def backfill(start, end, csv_file_name, folder_path, workers=4, min_interval=1.0, recycle_after=40, retries=1,
+             archive_dir=None, sink_kind="csv", resume=False):
+    """
+    Scrape every WCC game between start and end (inclusive) with a pool of headless browsers.
+
+    Parameters:
+    - start, end (datetime.date): Date range to backfill.
+    - csv_file_name (str): Name of the merged gamelog (extension swapped for Parquet/SQLite).
+    - folder_path (str): Folder for the merged gamelog (part files go in folder_path/backfill/).
+    - workers (int): Number of browser processes.
+    - min_interval (float): Minimum seconds between page loads across the whole pool.
+    - recycle_after (int): Page loads before a worker restarts its browser.
+    - retries (int): Extra attempts for a game that fails to scrape.
+    - archive_dir (str, optional): Record every fetched page into this PageArchive folder.
+    - sink_kind (str): "csv", "parquet", "store" or "sqlite" (the league database) for the merged gamelog.
+    - resume (bool): Skip games already in this date range's part files.
+
+    Returns:
+    - str: Path of the merged gamelog.
+    """
+    run_start = time.perf_counter()
+    days = list(date_range(start, end))
+    part_dir = os.path.join(folder_path, "backfill", f"{start:%Y%m%d}_{end:%Y%m%d}")
+    done = completed_games(part_dir) if resume else set()
+    if done:
+        print(f"⏩ Resuming: {len(done)} game(s) already in {part_dir}")
+    elif os.path.isdir(part_dir) and os.listdir(part_dir):
+        raise FileExistsError(f"{part_dir} has parts from an earlier run; use resume=True or remove it")
+
+    ctx = mp.get_context()
+    limiter = RateLimiter(min_interval, ctx)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                             initializer=_init_worker, initargs=(limiter,)) as pool:
+        # --- Stage 1: discover games, dates sharded across the pool ---
+        futures = [pool.submit(discover_shard, days_shard, recycle_after, archive_dir) for days_shard in shard(days, workers)]
+        games = {}
+        for future in futures:
+            for game in future.result():
+                games.setdefault(game["game_id"], game)
+        games = sorted(games.values(), key=lambda g: (g["date"][6:], g["date"], g["game_id"]))  # mm/dd/yy -> year first
+        print(f"📋 {len(games)} game(s) on {len(days)} day(s) ({time.perf_counter() - run_start:.1f}s)")
+        todo = [game for game in games if game["game_id"] not in done]
+
+        # --- Stage 2: scrape games, games sharded across the pool ---
+        # Resumed runs use fresh shard numbers so earlier part files are never rewritten
+        first_shard = len([name for name in os.listdir(part_dir) if name.endswith(".csv")]) if os.path.isdir(part_dir) else 0
+        futures = [pool.submit(scrape_shard, first_shard + i, games_shard, part_dir, recycle_after, retries, archive_dir)
+                   for i, games_shard in enumerate(shard(todo, workers))]
+        failed = [game_id for future in futures for game_id in future.result()]
+
+    # --- Merge per-worker parts ---
+    if not os.path.isdir(part_dir):
+        print("No games scraped.")
+        return None
+    out_path = sink_path(sink_kind, folder_path, csv_file_name)
+    rows = merge_parts(part_dir, make_sink(sink_kind, out_path))
+
+    if failed:
+        print(f"❌ Failed game ids: {', '.join(failed)}")
+    print(f"⏱️ Backfilled {len(games) - len(failed)}/{len(games)} game(s), {rows} rows to {out_path} "
+          f"in {time.perf_counter() - run_start:.1f}s with {workers} worker(s)")
+    return out_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill WCC box scores for a date range.")
+    parser.add_argument("--start", required=True, help="First date, YYYY-MM-DD")
+    parser.add_argument("--end", required=True, help="Last date (inclusive), YYYY-MM-DD")
+    parser.add_argument("--workers", type=int, default=4, help="Headless browsers to run in parallel")
+    parser.add_argument("--min-interval", type=float, default=1.0,
+                        help="Minimum seconds between page loads across all workers")
+    parser.add_argument("--recycle-after", type=int, default=40, help="Page loads before a browser is restarted")
+    parser.add_argument("--retries", type=int, default=1, help="Extra attempts per failed game")
+    parser.add_argument("--csv", default="gamelog-backfill.csv", help="Output CSV name")
+    parser.add_argument("--folder", default="Gamelog", help="Output folder")
+    parser.add_argument("--archive", default=None, help="Record raw pages into this archive folder (e.g. Gamelog/pages)")
+    parser.add_argument("--sink", default="csv", choices=["csv", "parquet", "sqlite", "store"], help="Merged gamelog format")
+    parser.add_argument("--resume", action="store_true", help="Continue an interrupted backfill of the same dates")
+    args = parser.parse_args()
+
+    start = datetime.strptime(args.start, "%Y-%m-%d").date()
+    end = datetime.strptime(args.end, "%Y-%m-%d").date()
+    backfill(start, end, args.csv, args.folder, workers=args.workers, min_interval=args.min_interval,
+             recycle_after=args.recycle_after, retries=args.retries, archive_dir=args.archive,
+             sink_kind=args.sink, resume=args.resume)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Parse ESPN scoreboard / box score HTML without a browser.
+
+parse_boxscore_html returns the same row strings extract_rows_text() gets out of
+Chrome (cells joined with "\\n", empty cells dropped), so get_indices and
+process_team_data work unchanged on either source.
+"""
+import re
+from datetime import datetime
+from html.parser import HTMLParser
+
+ROW_CLASSES = {"Table__TR", "Table__TR--sm", "Table__even"}
+TEAM_NAME_CLASS = "BoxscoreItem__TeamName"
+
+# Elements the browser hides with CSS, so innerText never sees them
+# (ESPN renders a long and a short athlete name and shows one per screen size).
+HIDDEN_CLASS_SUFFIXES = ("--short",)
+HIDDEN_CLASSES = {"sr-only"}
+
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+BOXSCORE_LINK_RE = re.compile(r'href="[^"]*?/boxscore/_/gameId/(\d+)')
+SCOREBOARD_DATE_RE = re.compile(r"/date/(\d{8})")
+
+
+def _is_hidden(classes):
+    return bool(classes & HIDDEN_CLASSES) or any(c.endswith(HIDDEN_CLASS_SUFFIXES) for c in classes)
+
+
+class _BoxscoreParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []          # list of list-of-cell-text
+        self.team_names = []
+        self._row = None        # cells of the box score row being read
+        self._cell = None       # text parts of the current cell
+        self._hidden_depth = 0  # >0 while inside a CSS-hidden element
+        self._team_depth = 0    # >0 while inside a team-name element
+        self._team_parts = []
+        self._stack = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            return
+        classes = set((dict(attrs).get("class") or "").split())
+        flags = []
+        if tag == "tr" and ROW_CLASSES <= classes:
+            self._row = []
+            flags.append("row")
+        elif tag in ("td", "th") and self._row is not None:
+            self._cell = []
+            flags.append("cell")
+        if _is_hidden(classes) or self._hidden_depth:
+            self._hidden_depth += 1
+            flags.append("hidden")
+        if TEAM_NAME_CLASS in classes or self._team_depth:
+            self._team_depth += 1
+            flags.append("team")
+        self._stack.append((tag, flags))
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        # Pop back to the matching start tag (tolerates unclosed children)
+        while self._stack:
+            open_tag, flags = self._stack.pop()
+            self._close(flags)
+            if open_tag == tag:
+                break
+
+    def _close(self, flags):
+        if "team" in flags:
+            self._team_depth -= 1
+            if self._team_depth == 0:
+                self.team_names.append(" ".join(" ".join(self._team_parts).split()))
+                self._team_parts = []
+        if "hidden" in flags:
+            self._hidden_depth -= 1
+        if "cell" in flags and self._cell is not None:
+            self._row.append(" ".join(" ".join(self._cell).split()))
+            self._cell = None
+        if "row" in flags and self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+
+    def handle_data(self, data):
+        if self._hidden_depth:
+            return
+        if self._cell is not None:
+            self._cell.append(data)
+        if self._team_depth:
+            self._team_parts.append(data)
+
+
+def parse_boxscore_html(html):
+    """
+    Parse a box score page.
+
+    Returns:
+    - (rows_text, team_names): rows_text is a list of row strings in page order,
+      team_names is [away, home] (or fewer if the names weren't found).
+    """
+    parser = _BoxscoreParser()
+    parser.feed(html)
+    parser.close()
+    rows_text = ["\n".join(cell for cell in row if cell) for row in parser.rows]
+    return rows_text, parser.team_names[:2]
+
+
+def parse_scoreboard_html(html):
+    """Return the ESPN game ids of every box score link on a scoreboard page, in page order."""
+    game_ids = []
+    for game_id in BOXSCORE_LINK_RE.findall(html):
+        if game_id not in game_ids:
+            game_ids.append(game_id)
+    return game_ids
+
+
+def date_from_scoreboard_url(url):
+    """'.../date/20260104/...' -> '01/04/26' (the gamelog Date format), or 'N/A'."""
+    match = SCOREBOARD_DATE_RE.search(url)
+    if not match:
+        return "N/A"
+    return datetime.strptime(match.group(1), "%Y%m%d").strftime("%m/%d/%y")
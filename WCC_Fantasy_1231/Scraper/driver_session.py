@@ -0,0 +1,90 @@
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+
+class DriverSession:
+    """
+    One Chrome driver that is reused for every page of a scrape run.
+
+    Starting Chrome is the slowest part of scraping a box score, so instead of a
+    fresh webdriver.Chrome() per game we keep one open and navigate it.
+
+    Parameters:
+    - recycle_after (int): Restart the browser after this many page loads (Chrome's
+      memory keeps growing on long backfills).
+    - max_restarts (int): How many times a single page load is retried on a fresh
+      browser after the driver crashes.
+    - headless (bool): Run Chrome without a window.
+    - before_get (callable, optional): Called before every page load, e.g. a rate
+      limiter shared between backfill workers.
+    """
+
+    def __init__(self, recycle_after=40, max_restarts=2, headless=False, before_get=None):
+        self.recycle_after = recycle_after
+        self.max_restarts = max_restarts
+        self.headless = headless
+        self.before_get = before_get
+        self.driver = None
+        self.pages = 0      # page loads on the current browser
+        self.starts = 0     # browsers launched over the whole run
+        self.total_pages = 0
+
+    def start(self):
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1400,1000")
+        self.driver = webdriver.Chrome(options=options)
+        self.pages = 0
+        self.starts += 1
+        return self.driver
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass  # already dead, nothing to clean up
+        self.driver = None
+
+    def is_alive(self):
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def restart(self):
+        self.quit()
+        return self.start()
+
+    def get(self, url):
+        """Load url on the shared driver (recycling/restarting it as needed) and return the driver."""
+        if self.driver is None:
+            self.start()
+        elif self.recycle_after and self.pages >= self.recycle_after:
+            print(f"♻️ Recycling browser after {self.pages} pages")
+            self.restart()
+
+        for attempt in range(self.max_restarts + 1):
+            try:
+                if self.before_get is not None:
+                    self.before_get()
+                self.driver.get(url)
+                self.pages += 1
+                self.total_pages += 1
+                return self.driver
+            except WebDriverException as e:
+                if attempt == self.max_restarts:
+                    raise
+                print(f"⚠️ Browser crashed loading {url} ({type(e).__name__}), restarting...")
+                self.restart()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.quit()
+        return False
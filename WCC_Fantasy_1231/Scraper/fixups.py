@@ -0,0 +1,213 @@
+"""
+Deferred manual fixups for unattended scrapes.
+
+In batch mode safe_get_text doesn't stop at input() when a field can't be scraped.
+It writes a placeholder value into the rows and queues a fixup with the game id, the
+candidates it tried, and an HTML snapshot + screenshot of the page. Afterwards the
+fixups are resolved and patched into the stored gamelog without re-scraping: the
+CSV is read in its schema dtypes, patched rows get their PlayerId re-stamped, and it
+is rewritten through UpsertCsvSink so its .idx stays in step. Patching the league
+gamelog also rebuilds the stat cube, whose games were applied with the placeholders.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 Scraper/fixups.py list
+    python3 Scraper/fixups.py resolve 401234567:away_team "Gonzaga Bulldogs"
+    python3 Scraper/fixups.py apply Gamelog/gamelog.csv
+"""
+import argparse
+import json
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from sinks import UpsertCsvSink
+from wcc.gamelog_store import GAMELOG_CSV
+from wcc.players import with_player_ids
+from wcc.schema import read_gamelog
+from wcc.season_agg import STATE_PATH, rebuild
+
+FIXUPS_DIR = "Gamelog/fixups"
+WCC_TEAM_FIELDS = ("Team",)  # columns whose fix also changes conf / isWCC
+PLAYER_FIELDS = ("Name", "Team")  # columns whose fix changes the row's PlayerId
+
+
+def placeholder_for(game_id, field):
+    return f"UNRESOLVED[{game_id}:{field}]"
+
+
+class FixupQueue:
+    """
+    Layout:
+    - <root>/fixups.jsonl            one JSON record per unresolved field (latest record per id wins)
+    - <root>/snapshots/<game id>.*   page HTML and screenshot taken when the field was missed
+    """
+
+    def __init__(self, root=FIXUPS_DIR):
+        self.root = root
+        self.path = os.path.join(root, "fixups.jsonl")
+        self.snapshot_dir = os.path.join(root, "snapshots")
+
+    def add(self, game_id, field, label, candidates, driver=None, html=None):
+        """Queue a fixup and return the placeholder to store in its place."""
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        snapshot_html = screenshot = None
+        if html is not None:
+            snapshot_html = os.path.join(self.snapshot_dir, f"{game_id}.html")
+            with open(snapshot_html, "w", encoding="utf-8") as f:
+                f.write(html)
+        elif driver is not None:
+            snapshot_html = os.path.join(self.snapshot_dir, f"{game_id}.html")
+            screenshot = os.path.join(self.snapshot_dir, f"{game_id}.png")
+            try:
+                with open(snapshot_html, "w", encoding="utf-8") as f:
+                    f.write(driver.page_source)
+                driver.save_screenshot(screenshot)
+            except Exception as e:
+                print(f"⚠️ Could not snapshot game {game_id}: {type(e).__name__}")
+
+        placeholder = placeholder_for(game_id, field)
+        self._append({
+            "id": f"{game_id}:{field}",
+            "game_id": str(game_id),
+            "field": field,
+            "label": label,
+            "candidates": list(candidates),
+            "placeholder": placeholder,
+            "snapshot_html": snapshot_html,
+            "screenshot": screenshot,
+            "status": "open",
+            "value": None,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+        })
+        print(f"📝 Queued fixup {game_id}:{field} ({label})")
+        return placeholder
+
+    def _append(self, record):
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def records(self):
+        """id -> latest record."""
+        latest = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        latest[record["id"]] = record
+        return latest
+
+    def resolve(self, fixup_id, value):
+        record = self.records().get(fixup_id)
+        if record is None:
+            raise KeyError(f"No fixup {fixup_id}")
+        self._append({**record, "status": "resolved", "value": value,
+                      "resolved_at": datetime.now().isoformat(timespec="seconds")})
+
+    def mark_applied(self, fixup_ids):
+        records = self.records()
+        for fixup_id in fixup_ids:
+            self._append({**records[fixup_id], "status": "applied",
+                          "applied_at": datetime.now().isoformat(timespec="seconds")})
+
+
+def apply_fixups(df, resolved, conf_from_fullteam=None, players=None):
+    """
+    Replace placeholders with resolved values in every text column of a gamelog frame.
+
+    Parameters:
+    - df (pd.DataFrame): Stored gamelog rows (typed, e.g. from wcc.schema.read_gamelog).
+    - resolved (dict): placeholder -> resolved value.
+    - conf_from_fullteam (callable, optional): Recompute isWCC for rows whose Team was fixed.
+    - players (Players, optional): Player dimension to re-stamp PlayerId on rows whose Name or Team was fixed.
+
+    Returns:
+    - (pd.DataFrame, int): Patched frame and number of cells changed.
+    """
+    if not resolved:
+        return df, 0
+    changed = 0
+    restamp = pd.Series(False, index=df.index)
+    for col in df.columns:
+        dtype = df[col].dtype
+        category = isinstance(dtype, pd.CategoricalDtype)
+        if dtype != object and not category and not pd.api.types.is_string_dtype(df[col]):
+            continue
+        hit = df[col].isin(resolved.keys())
+        if not hit.any():
+            continue
+        changed += int(hit.sum())
+        if col in WCC_TEAM_FIELDS and conf_from_fullteam is not None and "isWCC" in df.columns:
+            df.loc[hit, "isWCC"] = df.loc[hit, col].astype(object).map(resolved).map(conf_from_fullteam).eq("wcc")
+        values = df[col].astype("string") if category else df[col]
+        values = values.where(~hit, values.map(resolved))
+        df[col] = values.astype("category") if category else values
+        if col in PLAYER_FIELDS:
+            restamp |= hit
+    if restamp.any() and "PlayerId" in df.columns:
+        df.loc[restamp, "PlayerId"] = pd.NA
+        df = with_player_ids(df, players)
+    return df, changed
+
+
+def apply_to_csv(path, resolved, conf_from_fullteam=None, players=None):
+    """
+    Patch resolved fixups into a gamelog CSV in place (dtypes, GameId and the .idx index kept intact).
+
+    Returns:
+    - int: Number of cells changed (the file is only rewritten when > 0).
+    """
+    df, changed = apply_fixups(read_gamelog(path), resolved, conf_from_fullteam, players)
+    if changed:
+        UpsertCsvSink(path).rewrite(df)
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deferred scrape fixups.")
+    parser.add_argument("--fixups", default=FIXUPS_DIR, help="Fixups folder")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="Show open fixups")
+    resolve = sub.add_parser("resolve", help="Set the value for a fixup")
+    resolve.add_argument("id", help="<game id>:<field>")
+    resolve.add_argument("value")
+    apply = sub.add_parser("apply", help="Patch resolved fixups into stored gamelog CSVs")
+    apply.add_argument("csv", nargs="+", help="Gamelog CSV files to patch in place")
+    args = parser.parse_args()
+
+    queue = FixupQueue(args.fixups)
+
+    if args.command == "list":
+        for record in queue.records().values():
+            if record["status"] != "applied":
+                print(f"{record['id']:<28} {record['status']:<9} {record['label']:<24} "
+                      f"value={record['value']!r} snapshot={record['snapshot_html']}")
+        return
+
+    if args.command == "resolve":
+        queue.resolve(args.id, args.value)
+        print(f"✅ {args.id} -> {args.value}")
+        return
+
+    from ESPN_SCRAPER import conf_from_fullteam
+
+    resolved = {r["placeholder"]: r["value"] for r in queue.records().values() if r["status"] == "resolved"}
+    if not resolved:
+        print("No resolved fixups to apply.")
+        return
+    for path in args.csv:
+        changed = apply_to_csv(path, resolved, conf_from_fullteam)
+        print(f"🩹 {path}: {changed} cell(s) patched")
+        if changed and os.path.normpath(path) == os.path.normpath(GAMELOG_CSV) and os.path.exists(STATE_PATH):
+            rebuild().save()
+            print(f"🧊 Stat cube rebuilt ({STATE_PATH})")
+    queue.mark_applied([r["id"] for r in queue.records().values() if r["status"] == "resolved"])
+
+
+if __name__ == "__main__":
+    main()
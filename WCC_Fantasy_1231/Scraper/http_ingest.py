@@ -0,0 +1,243 @@
+"""
+Browser-free box score ingest.
+
+Box score pages are static table markup, so this path fetches the HTML with a pooled
+HTTP client and parses it locally (boxscore_html.py) into the same COLUMN_ORDER
+DataFrame that scrape_dailyboxscores produces. A game whose HTML can't be parsed is
+handed to the Selenium scraper instead.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    # scrape a date range over HTTP
+    python3 Scraper/http_ingest.py scrape --start 2026-01-04 --end 2026-01-04
+
+    # parse saved pages offline (no network)
+    python3 Scraper/http_ingest.py parse saved/401234567.html --date 01/04/26
+
+    # point at a local stand-in server (python3 -m http.server) that mirrors ESPN paths
+    python3 Scraper/http_ingest.py scrape --start 2026-01-04 --end 2026-01-04 --base-url http://localhost:8000
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlparse
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from boxscore_html import TEAM_NAME_CLASS, parse_boxscore_html, parse_scoreboard_html, date_from_scoreboard_url
+from driver_session import DriverSession
+from page_archive import PageArchive
+from fixups import FixupQueue
+from sinks import GAMELOG_KEY, checkpoint_for, make_sink, sink_path
+from ESPN_SCRAPER import BOXSCORE_URL, build_game_frames, scrape_game, scoreboard_url
+
+ESPN_BASE_URL = "https://www.espn.com"
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+
+
+def make_http_session(pool_size=8, retries=2):
+    """requests.Session with a keep-alive connection pool and retry/backoff on 429/5xx."""
+    http = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    http.mount("https://", adapter)
+    http.mount("http://", adapter)
+    http.headers["User-Agent"] = USER_AGENT
+    return http
+
+
+def rebase_url(url, base_url):
+    """Swap the ESPN host for base_url (e.g. a local stand-in server)."""
+    if not base_url or base_url == ESPN_BASE_URL:
+        return url
+    return base_url.rstrip("/") + urlparse(url).path
+
+
+def fetch_html(http, url, timeout=15, before_get=None):
+    """GET a page and return its HTML. Local file paths are read from disk."""
+    if os.path.exists(url):
+        with open(url, encoding="utf-8") as f:
+            return f.read()
+    if before_get is not None:
+        before_get()
+    response = http.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.text
+
+
+def discover_games_http(http, website, base_url=ESPN_BASE_URL, before_get=None, archive=None):
+    """HTTP version of discover_games: one scoreboard fetch -> list of game work items."""
+    html = fetch_html(http, rebase_url(website, base_url), before_get=before_get)
+    formatted_date = date_from_scoreboard_url(website)
+    if archive is not None:
+        archive.put("scoreboard", formatted_date, website, html)
+    games = [{
+        "game_id": game_id,
+        "boxscore_url": BOXSCORE_URL.format(game_id=game_id),
+        "date": formatted_date,
+        "scoreboard_url": website,
+    } for game_id in parse_scoreboard_html(html)]
+    print(f"🔎 Found {len(games)} box score(s) on {formatted_date}")
+    return games
+
+
+def parse_game_html(html, game, fixups=None):
+    """
+    Parse a saved/fetched box score page into (away_df, home_df).
+
+    Missing team names raise ValueError, or are queued as fixups when a FixupQueue is given.
+    """
+    rows_text, team_names = parse_boxscore_html(html)
+    if len(team_names) < 2:
+        if fixups is None:
+            raise ValueError(f"team names not found in box score HTML for game {game['game_id']}")
+        # With only one name found we can't tell home from away, so both get queued
+        candidates = [f".{TEAM_NAME_CLASS}"]
+        team_names = [fixups.add(game["game_id"], field, label, candidates, html=html)
+                      for field, label in [("away_team", "Full Team Name (Away)"),
+                                           ("home_team", "Full Team Name (Home)")]]
+    return build_game_frames(rows_text, team_names[0], team_names[1], game)
+
+
+def scrape_game_http(http, game, base_url=ESPN_BASE_URL, before_get=None, archive=None, fixups=None):
+    html = fetch_html(http, rebase_url(game["boxscore_url"], base_url), before_get=before_get)
+    if archive is not None:
+        archive.put("boxscore", game["game_id"], game["boxscore_url"], html, meta=game)
+    return parse_game_html(html, game, fixups)
+
+
+def scrape_dailyboxscores_http(websites, csv_file_name, folder_path, workers=8, base_url=ESPN_BASE_URL,
+                               before_get=None, selenium_fallback=True, archive=None, fixups=None,
+                               sink=None, resume=False, collect=True):
+    """
+    HTTP version of scrape_dailyboxscores: same inputs, same CSV, same return value.
+
+    Box scores are fetched concurrently over one pooled HTTP session. Games that fail
+    over HTTP are retried once with the Selenium scraper when selenium_fallback is True.
+    Pass a PageArchive to record every fetched page for offline replay, and a
+    FixupQueue to run the Selenium fallback in batch mode. Each game is written to the
+    sink (and its checkpoint) as it completes; sink, resume and collect work as in
+    scrape_dailyboxscores.
+    """
+    run_start = time.perf_counter()
+    http = make_http_session(pool_size=workers)
+    if sink is None:
+        sink = make_sink("csv", os.path.join(folder_path, csv_file_name))  # the league gamelog also feeds the cube
+    checkpoint = checkpoint_for(sink)
+
+    games = {}
+    for website in websites:
+        for game in discover_games_http(http, website, base_url, before_get, archive):
+            games.setdefault(game["game_id"], game)
+    games = list(games.values())
+    if resume:
+        skipped = len(games)
+        games = checkpoint.remaining(games)
+        print(f"⏩ Resuming: {skipped - len(games)} game(s) already in {checkpoint.path}")
+
+    dataframes = []
+
+    def write(game, frames):
+        game_df = pd.concat(frames, ignore_index=True)
+        sink.write(game_df, game["game_id"])
+        checkpoint.mark(game["game_id"])
+        if collect:
+            dataframes.append(game_df)
+
+    def fetch(game):
+        try:
+            return game, scrape_game_http(http, game, base_url, before_get, archive,
+                                               None if selenium_fallback else fixups), None
+        except Exception as e:
+            return game, None, e
+
+    fallback = []
+    try:
+        # Results come back in game order; each one is written as soon as it's ready
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for game, frames, error in pool.map(fetch, games):
+                if frames is None:
+                    print(f"An error occurred on game {game['game_id']} over HTTP: {error}")
+                    fallback.append(game)
+                else:
+                    write(game, frames)
+
+        failed = []
+        if fallback and selenium_fallback:
+            print(f"🌐 Falling back to Selenium for {len(fallback)} game(s)")
+            with DriverSession() as session:
+                for game in fallback:
+                    try:
+                        frames = scrape_game(session, game, archive, fixups)
+                    except Exception as e:
+                        print(f"An error occurred on game {game['game_id']}: {str(e)}")
+                        failed.append(game["game_id"])
+                    else:
+                        write(game, frames)
+        else:
+            failed = [game["game_id"] for game in fallback]
+    finally:
+        sink.close()
+
+    elapsed = time.perf_counter() - run_start
+    done = len(games) - len(failed)
+    print(f"⏱️ Scraped {done}/{len(games)} game(s) over HTTP in {elapsed:.1f}s "
+          f"({done / elapsed if elapsed else 0:.2f} games/s)")
+    if failed:
+        print(f"❌ Failed game ids: {', '.join(failed)}")
+    if not dataframes:
+        return pd.DataFrame()
+
+    concatenated_df = pd.concat(dataframes, ignore_index=True)
+    concatenated_df = concatenated_df.drop_duplicates(subset=list(GAMELOG_KEY), keep="last")
+    return concatenated_df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest ESPN box scores over HTTP (no browser).")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    scrape = sub.add_parser("scrape", help="Scrape a date range")
+    scrape.add_argument("--start", required=True, help="First date, YYYY-MM-DD")
+    scrape.add_argument("--end", required=True, help="Last date (inclusive), YYYY-MM-DD")
+    scrape.add_argument("--workers", type=int, default=8, help="Concurrent HTTP fetches")
+    scrape.add_argument("--base-url", default=ESPN_BASE_URL, help="Host to fetch from (local stand-in server)")
+    scrape.add_argument("--no-selenium", action="store_true", help="Don't fall back to Selenium")
+    scrape.add_argument("--batch", action="store_true", help="Queue unresolved fields as fixups instead of asking")
+    scrape.add_argument("--csv", default="gamelog-http.csv", help="Output CSV name")
+    scrape.add_argument("--folder", default="Gamelog", help="Output folder")
+    scrape.add_argument("--archive", default=None, help="Record raw pages into this archive folder (e.g. Gamelog/pages)")
+    scrape.add_argument("--sink", default="csv", choices=["csv", "parquet", "sqlite", "store"], help="Output format")
+    scrape.add_argument("--resume", action="store_true", help="Skip games already written by an earlier run")
+
+    parse = sub.add_parser("parse", help="Parse saved box score HTML files offline")
+    parse.add_argument("files", nargs="+", help="Saved box score .html files (named <game id>.html)")
+    parse.add_argument("--date", default="N/A", help="Game date as mm/dd/yy")
+
+    args = parser.parse_args()
+
+    if args.command == "parse":
+        for path in args.files:
+            game_id = os.path.splitext(os.path.basename(path))[0]
+            team1_df, team2_df = parse_game_html(fetch_html(None, path), {"game_id": game_id, "date": args.date})
+            print(pd.concat([team1_df, team2_df], ignore_index=True).to_string())
+        return
+
+    start = datetime.strptime(args.start, "%Y-%m-%d").date()
+    end = datetime.strptime(args.end, "%Y-%m-%d").date()
+    websites = [scoreboard_url(day) for day in pd.date_range(start, end)]
+    scrape_dailyboxscores_http(websites, args.csv, args.folder, workers=args.workers,
+                               base_url=args.base_url, selenium_fallback=not args.no_selenium,
+                               archive=PageArchive(args.archive) if args.archive else None,
+                               fixups=FixupQueue() if args.batch else None,
+                               sink=make_sink(args.sink, sink_path(args.sink, args.folder, args.csv)),
+                               resume=args.resume, collect=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Record/replay archive of raw ESPN pages.
+
+Every scoreboard and box score page the scrapers fetch can be stored here, gzipped
+and content-addressed (sha256), with an index keyed by game id. When the parsing or
+points logic changes, the whole season can be re-parsed from the archive offline
+instead of re-scraping ESPN. The archive doubles as a parser benchmark corpus.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 Scraper/page_archive.py stats
+    python3 Scraper/page_archive.py replay --csv gamelog-replay.csv
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+
+ARCHIVE_DIR = "Gamelog/pages"
+
+
+class PageArchive:
+    """
+    Layout:
+    - <root>/objects/ab/cdef....html.gz   one gzip blob per distinct page content
+    - <root>/index.jsonl                  one line per stored page: kind, key, url, sha256, meta
+    """
+
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.jsonl")
+
+    def _object_path(self, sha):
+        return os.path.join(self.objects_dir, sha[:2], sha[2:] + ".html.gz")
+
+    def put(self, kind, key, url, html, meta=None):
+        """Store a page ("scoreboard" keyed by date, "boxscore" keyed by game id) and return its sha256."""
+        data = html.encode("utf-8")
+        sha = hashlib.sha256(data).hexdigest()
+        path = self._object_path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+                f.write(data)
+            os.replace(tmp_path, path)  # atomic, safe with several backfill workers
+
+        entry = {
+            "kind": kind,
+            "key": str(key),
+            "url": url,
+            "sha256": sha,
+            "fetched_at": datetime.now().isoformat(timespec="seconds"),
+            "meta": meta or {},
+        }
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return sha
+
+    def get(self, sha):
+        with gzip.open(self._object_path(sha), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def entries(self, kind=None):
+        if not os.path.exists(self.index_path):
+            return []
+        with open(self.index_path, encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f if line.strip()]
+        return [e for e in entries if kind is None or e["kind"] == kind]
+
+    def latest(self, kind):
+        """key -> most recently stored entry of that kind."""
+        latest = {}
+        for entry in self.entries(kind):
+            latest[entry["key"]] = entry
+        return latest
+
+
+def replay_archive(archive, csv_file_name, folder_path, sink=None):
+    """
+    Re-parse every archived box score (latest copy per game id) into a gamelog CSV.
+
+    Uses the current parser and points rules, so history can be rebuilt offline.
+    Games are written to the sink one at a time, so memory stays flat.
+
+    Parameters:
+    - sink (optional): Where rows go (see sinks.py). Defaults to CsvSink(folder_path/csv_file_name).
+
+    Returns:
+    - int: Number of rows written.
+    """
+    # Imported here so `stats` works without the scraper's dependencies
+    import pandas as pd
+    from http_ingest import parse_game_html
+    from sinks import CsvSink
+
+    run_start = time.perf_counter()
+    boxscores = sorted(archive.latest("boxscore").values(),
+                       key=lambda e: (e["meta"].get("date", "N/A")[6:], e["meta"].get("date", ""), e["key"]))
+
+    if sink is None:
+        sink = CsvSink(os.path.join(folder_path, csv_file_name))
+    rows = 0
+    failed = []
+    read_time = parse_time = 0.0
+    for entry in boxscores:
+        t0 = time.perf_counter()
+        html = archive.get(entry["sha256"])
+        t1 = time.perf_counter()
+        game = {"game_id": entry["key"], "date": entry["meta"].get("date", "N/A"),
+                "boxscore_url": entry["url"], "scoreboard_url": entry["meta"].get("scoreboard_url")}
+        try:
+            game_df = pd.concat(parse_game_html(html, game), ignore_index=True)
+        except Exception as e:
+            print(f"An error occurred re-parsing game {entry['key']}: {str(e)}")
+            failed.append(entry["key"])
+        else:
+            sink.write(game_df, entry["key"])
+            rows += len(game_df)
+        parse_time += time.perf_counter() - t1
+        read_time += t1 - t0
+    sink.close()
+
+    print(f"⏱️ Replayed {len(boxscores) - len(failed)}/{len(boxscores)} game(s) in "
+          f"{time.perf_counter() - run_start:.2f}s (read {read_time:.2f}s, parse {parse_time:.2f}s)")
+    if failed:
+        print(f"❌ Failed game ids: {', '.join(failed)}")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Raw ESPN page archive.")
+    parser.add_argument("--archive", default=ARCHIVE_DIR, help="Archive folder")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="Show what's in the archive")
+    replay = sub.add_parser("replay", help="Re-parse every archived box score into a gamelog CSV")
+    replay.add_argument("--csv", default="gamelog-replay.csv", help="Output CSV name")
+    replay.add_argument("--folder", default="Gamelog", help="Output folder")
+    replay.add_argument("--sink", default="csv", choices=["csv", "parquet", "sqlite", "store"], help="Output format")
+    args = parser.parse_args()
+
+    archive = PageArchive(args.archive)
+    if args.command == "stats":
+        for kind in ("scoreboard", "boxscore"):
+            print(f"{kind}: {len(archive.latest(kind))} distinct, {len(archive.entries(kind))} stored")
+        return
+
+    from sinks import make_sink, sink_path
+
+    out_path = sink_path(args.sink, args.folder, args.csv)
+    if os.path.exists(out_path):
+        parser.error(f"{out_path} already exists; replay writes a fresh file")
+    replay_archive(archive, args.csv, args.folder, sink=make_sink(args.sink, out_path))
+
+
+if __name__ == "__main__":
+    main()
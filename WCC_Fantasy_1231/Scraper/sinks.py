@@ -0,0 +1,393 @@
+"""
+Gamelog sinks: where scraped games are written as soon as each one finishes.
+
+Every sink takes one game's rows at a time, so a crash loses at most the game in
+flight and memory stays flat however long the run is. A Checkpoint next to the sink
+records finished game ids so an interrupted run can resume where it stopped.
+
+The gamelog sinks upsert on GAMELOG_KEY (ESPN game id + team + player + jersey), so
+re-ingesting a day never duplicates rows. Doubleheaders differ by game id, and two
+players with the same name differ by team or jersey. Every gamelog sink also stamps
+each row's PlayerId from the player dimension (wcc/players.py) as it is written;
+the plain CsvSink (backfill part files) leaves that to the final merge.
+
+clear() empties a file sink's output before a full re-merge (backfill.merge_parts).
+SqliteSink.clear() is a no-op: the league database is shared with other writers,
+so rows from an earlier run stay there and are replaced only where the new run
+has the same key.
+
+Sinks writing the league gamelog (Gamelog/gamelog.csv or its Parquet store) are
+wrapped in a CubeSink, which also applies each new game to the player x week stat
+cube (wcc/season_agg.py) once the cube has been built.
+
+Merge an old gamelog copy into the main one (run from the WCC_Fantasy_1231 folder):
+
+    python3 Scraper/sinks.py upsert "Gamelog/gamelog copy_0105.csv" --into Gamelog/gamelog.csv
+"""
+import argparse
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.db import DB_PATH, FantasyDB
+from wcc.gamelog_store import GAMELOG_CSV, STORE_PATH, write_gamelog
+from wcc.players import with_player_ids
+from wcc.schema import CSV_WRITE_OPTIONS, DATE_FORMAT, GAMELOG_KEY, enforce_schema, schema_path, write_schema
+from wcc.season_agg import GAMES_PATH, STATE_PATH, SeasonAgg
+
+
+class CsvSink:
+    """Append each game to one CSV (header and schema sidecar written when the file is new)."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, df, game_id=None):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        new_file = not os.path.exists(self.path)
+        df.to_csv(self.path, index=False, mode="w" if new_file else "a", header=new_file, **CSV_WRITE_OPTIONS)
+        if new_file or not os.path.exists(schema_path(self.path)):
+            write_schema(self.path, df)
+
+    def clear(self):
+        for path in (self.path, schema_path(self.path)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def close(self):
+        pass
+
+
+def _as_text(series):
+    """Column values as they read back from the CSV, so typed and text rows key the same."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.strftime(DATE_FORMAT).fillna("")
+    return series.astype("string").fillna("").astype(object)
+
+
+def gamelog_keys(df, by_date=False):
+    """
+    uint64 hash of GAMELOG_KEY for every row.
+
+    Rows stored before GameId was recorded have no game id; they (and every row, when
+    by_date is True) are keyed by Date instead.
+    """
+    key = pd.DataFrame({col: _as_text(df[col]) if col in df.columns else ""
+                        for col in GAMELOG_KEY}, index=df.index)
+    dated = "date:" + _as_text(df["Date"])
+    key["GameId"] = dated if by_date else key["GameId"].where(key["GameId"] != "", dated)
+    return pd.util.hash_pandas_object(key, index=False).to_numpy()
+
+
+def row_hashes(df):
+    """uint64 hash of each row as it is written to CSV (detects changed rows without re-reading)."""
+    lines = df.to_csv(index=False, header=False, lineterminator="\n", **CSV_WRITE_OPTIONS).splitlines()
+    return pd.util.hash_pandas_object(pd.Series(lines, dtype=object), index=False).to_numpy()
+
+
+def _read_gamelog(path):
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+class UpsertCsvSink(CsvSink):
+    """
+    Gamelog CSV that upserts on GAMELOG_KEY instead of blindly appending.
+
+    A hash index (<path>.idx: key hash -> row hash) is kept next to the CSV, so
+    ingesting a game only touches the new rows: identical rows are skipped, new rows
+    appended, and changed rows are replaced with one rewrite in close(). Rows from
+    before GameId was stored are matched by Date and upgraded in place the first
+    time their game is ingested again. The index is rebuilt from the CSV whenever
+    the CSV was changed by something else.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.index_path = path + ".idx"
+        self._index = None      # key hash -> row hash
+        self._columns = None    # CSV header
+        self._replaced = []     # DataFrames of rows that replace existing keys
+        self._drop = set()      # key hashes whose old rows are dropped on close()
+
+    # --- index ---
+    def _load(self):
+        if self._index is not None:
+            return
+        self._index = {}
+        if not os.path.exists(self.path):
+            if os.path.exists(self.index_path):
+                os.remove(self.index_path)  # left over from a deleted CSV
+            return
+        self._columns = list(pd.read_csv(self.path, nrows=0).columns)
+        size = None
+        if os.path.exists(self.index_path):
+            index = {}
+            with open(self.index_path, encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("#size "):
+                        size = int(line.split()[1])
+                    elif line.strip():
+                        key, row = line.split()
+                        index[int(key, 16)] = int(row, 16)
+            if size == os.path.getsize(self.path):
+                self._index = index
+                return
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        df = _read_gamelog(self.path)
+        self._columns = list(df.columns)
+        keys = gamelog_keys(df)
+        self._index = dict(zip(keys.tolist(), row_hashes(df).tolist()))
+        if len(self._index) < len(df):
+            print(f"⚠️ {self.path}: {len(df) - len(self._index)} duplicate row(s) already on disk "
+                  f"(the latest copy of each key is kept by the index)")
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{k:x} {r:x}\n" for k, r in self._index.items())
+            f.write(f"#size {os.path.getsize(self.path)}\n")
+
+    def _add_columns(self, columns):
+        """One-time rewrite when rows arrive with new columns (e.g. GameId on an old gamelog)."""
+        print(f"🧱 Adding column(s) {', '.join(columns)} to {self.path}")
+        df = _read_gamelog(self.path)
+        for col in columns:
+            df[col] = ""
+        tmp_path = self.path + ".tmp"
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, self.path)
+        write_schema(self.path, df)
+        self._rebuild_index()
+
+    # --- writes ---
+    def write(self, df, game_id=None):
+        df = with_player_ids(df)
+        self._load()
+        if self._columns is None:
+            self._columns = list(df.columns)
+        new_columns = [col for col in df.columns if col not in self._columns]
+        if new_columns and os.path.exists(self.path):
+            self._add_columns(new_columns)
+        elif new_columns:
+            self._columns += new_columns
+        df = df.reindex(columns=self._columns)
+
+        keys = gamelog_keys(df)
+        last = ~pd.Series(keys).duplicated(keep="last").to_numpy()  # repeated key in one batch: last wins
+        df, keys = df[last], keys[last]
+        rows = row_hashes(df)
+        legacy = gamelog_keys(df, by_date=True)
+
+        new = []
+        replaced = []
+        for i, (key, row, old_key) in enumerate(zip(keys.tolist(), rows.tolist(), legacy.tolist())):
+            if key in self._index:
+                if self._index[key] != row:
+                    replaced.append(i)
+                    self._drop.add(key)
+            elif old_key in self._index:
+                # Row stored before GameId was recorded: swap it for the keyed one
+                replaced.append(i)
+                self._drop.add(old_key)
+                self._index.pop(old_key)
+            else:
+                new.append(i)
+            self._index[key] = row
+
+        if new:
+            super().write(df.iloc[new])
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.writelines(f"{keys[i]:x} {rows[i]:x}\n" for i in new)
+                f.write(f"#size {os.path.getsize(self.path)}\n")
+        if replaced:
+            self._replaced.append(df.iloc[replaced])
+
+    def close(self):
+        """Apply pending replacements: drop the old rows and write the new ones in one rewrite."""
+        if not self._replaced:
+            return
+        stored = _read_gamelog(self.path)
+        stored = stored[~pd.Series(gamelog_keys(stored)).isin(self._drop).to_numpy()]
+        replaced = pd.concat(self._replaced, ignore_index=True)
+        print(f"♻️ Replacing {len(replaced)} changed row(s) in {self.path}")
+        tmp_path = self.path + ".tmp"
+        stored.to_csv(tmp_path, index=False)
+        replaced.to_csv(tmp_path, index=False, mode="a", header=False, **CSV_WRITE_OPTIONS)
+        os.replace(tmp_path, self.path)
+        self._replaced = []
+        self._drop = set()
+        self._rebuild_index()
+
+    def rewrite(self, df):
+        """Replace the whole CSV with df (typed rows patched in place, e.g. by Scraper/fixups.py) and re-index it."""
+        self.close()
+        tmp_path = self.path + ".tmp"
+        df.to_csv(tmp_path, index=False, **CSV_WRITE_OPTIONS)
+        os.replace(tmp_path, self.path)
+        write_schema(self.path, df)
+        self._rebuild_index()
+
+    def clear(self):
+        super().clear()
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+        self._index = self._columns = None
+
+
+class ParquetSink:
+    """
+    One Parquet file per game in a folder (needs pyarrow). Read back with pd.read_parquet(folder).
+
+    Re-writing a game overwrites its file, so re-ingesting a day never duplicates rows.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, df, game_id=None):
+        df = with_player_ids(df)
+        os.makedirs(self.path, exist_ok=True)
+        name = f"game-{game_id}.parquet" if game_id is not None else f"part-{len(os.listdir(self.path)):05d}.parquet"
+        df.to_parquet(os.path.join(self.path, name), index=False)
+
+    def clear(self):
+        if os.path.isdir(self.path):
+            for name in os.listdir(self.path):
+                if name.endswith(".parquet"):
+                    os.remove(os.path.join(self.path, name))
+
+    def close(self):
+        pass
+
+
+class SqliteSink:
+    """Upsert each game into the league database's gamelog table (wcc/db.py) in its own transaction."""
+
+    def __init__(self, path):
+        self.path = path
+        self._db = None
+
+    def write(self, df, game_id=None):
+        if self._db is None:
+            self._db = FantasyDB(self.path)
+        self._db.upsert_gamelog(with_player_ids(df))
+
+    def clear(self):
+        pass  # the league database is shared, and upserts already make re-merging a run idempotent
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class StoreSink:
+    """Upsert each game into the season/week partitioned Parquet store (wcc/gamelog_store.py, needs pyarrow)."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, df, game_id=None):
+        write_gamelog(with_player_ids(df), self.path)
+
+    def clear(self):
+        if os.path.isdir(self.path):
+            shutil.rmtree(self.path)
+
+    def close(self):
+        pass
+
+
+class CubeSink:
+    """
+    Wraps a league gamelog sink and applies each game it writes to the stat cube.
+
+    Games already in the cube (a re-ingested day) are skipped. Nothing is done until
+    the cube exists (`python3 wcc/season_agg.py rebuild`); it is saved on close().
+    """
+
+    def __init__(self, sink):
+        self.sink = sink
+        self.path = sink.path
+        self._cube = None
+
+    def write(self, df, game_id=None):
+        self.sink.write(df, game_id)
+        if self._cube is None:
+            if not (os.path.exists(STATE_PATH) and os.path.exists(GAMES_PATH)):
+                return
+            self._cube = SeasonAgg.load()
+        rows = enforce_schema(with_player_ids(df))
+        self._cube.apply(self._cube.new_rows(rows))
+
+    def clear(self):
+        self.sink.clear()
+
+    def close(self):
+        self.sink.close()
+        if self._cube is not None:
+            self._cube.save()
+
+
+SINKS = {"csv": UpsertCsvSink, "parquet": ParquetSink, "sqlite": SqliteSink, "store": StoreSink}
+CUBE_PATHS = {os.path.normpath(GAMELOG_CSV), os.path.normpath(STORE_PATH)}
+
+
+def make_sink(kind, path):
+    """make_sink("csv" | "parquet" | "sqlite" | "store", path); the league gamelog comes wrapped in a CubeSink."""
+    sink = SINKS[kind](path)
+    return CubeSink(sink) if os.path.normpath(path) in CUBE_PATHS else sink
+
+
+def sink_path(kind, folder_path, csv_file_name):
+    """Output path for a sink kind: gamelog.csv -> gamelog.csv / gamelog/ / gamelog_store/, or the league database"""
+    base = os.path.join(folder_path, os.path.splitext(csv_file_name)[0])
+    return {"csv": os.path.join(folder_path, csv_file_name), "parquet": base, "sqlite": DB_PATH,
+            "store": base + "_store"}[kind]
+
+
+class Checkpoint:
+    """Append-only list of finished game ids (one per line) for resuming a run."""
+
+    def __init__(self, path):
+        self.path = path
+        self.done = set()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.done = {line.strip() for line in f if line.strip()}
+
+    def mark(self, game_id):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(f"{game_id}\n")
+        self.done.add(str(game_id))
+
+    def remaining(self, games):
+        return [game for game in games if str(game["game_id"]) not in self.done]
+
+
+def checkpoint_for(sink):
+    return Checkpoint(sink.path.rstrip("/\\") + ".done")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gamelog sinks.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    upsert = sub.add_parser("upsert", help="Upsert gamelog CSV(s) into another without duplicating rows")
+    upsert.add_argument("csv", nargs="+", help="Source gamelog CSVs")
+    upsert.add_argument("--into", required=True, help="Target gamelog CSV (created if missing)")
+    args = parser.parse_args()
+
+    sink = make_sink("csv", args.into)
+    for path in args.csv:
+        df = _read_gamelog(path)
+        before = os.path.getsize(args.into) if os.path.exists(args.into) else 0
+        sink.write(df)
+        print(f"📥 {path}: {len(df)} row(s), {os.path.getsize(args.into) - before} byte(s) appended")
+    sink.close()
+
+
+if __name__ == "__main__":
+    main()
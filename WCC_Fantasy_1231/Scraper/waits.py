@@ -0,0 +1,71 @@
+import time
+from collections import defaultdict
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+# Seconds each scrape step may wait for the page before giving up
+STEP_TIMEOUTS = {
+    "scoreboard_date": 10,
+    "boxscore_links": 6,
+    "boxscore_rows": 15,
+    "team_name": 5,
+}
+
+POLL_SECONDS = 0.1
+
+# step -> list of wait latencies (seconds) for this process
+WAIT_LATENCIES = defaultdict(list)
+
+
+def _timed_wait(driver, step, condition, timeout):
+    timeout = STEP_TIMEOUTS.get(step, 10) if timeout is None else timeout
+    start = time.perf_counter()
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=POLL_SECONDS).until(condition)
+    finally:
+        WAIT_LATENCIES[step].append(time.perf_counter() - start)
+
+
+def wait_for(driver, step, by, locator, timeout=None):
+    """
+    Return the element as soon as it is present, instead of sleeping a fixed time.
+
+    Raises selenium's TimeoutException if it doesn't show up within the step's timeout.
+    """
+    return _timed_wait(driver, step, EC.presence_of_element_located((by, locator)), timeout)
+
+
+def wait_for_all(driver, step, by, locator, timeout=None):
+    """Return every matching element once at least one is present."""
+    return _timed_wait(driver, step, EC.presence_of_all_elements_located((by, locator)), timeout)
+
+
+def wait_for_rows(driver, step, by, locator, timeout=None, settle=0.5):
+    """
+    Return table rows once they have finished rendering.
+
+    ESPN fills the box score tables in over a few frames, so "present" isn't enough:
+    we wait until the row count is non-zero and hasn't changed for `settle` seconds.
+    """
+    state = {"count": -1, "since": time.perf_counter()}
+
+    def rows_settled(d):
+        rows = d.find_elements(by, locator)
+        now = time.perf_counter()
+        if len(rows) != state["count"]:
+            state["count"], state["since"] = len(rows), now
+            return False
+        return rows if rows and now - state["since"] >= settle else False
+
+    return _timed_wait(driver, step, rows_settled, timeout)
+
+
+def print_wait_summary():
+    """Print count / mean / max wait latency per step, slowest step first."""
+    if not WAIT_LATENCIES:
+        return
+    print("⏳ Wait latency by step:")
+    for step, times in sorted(WAIT_LATENCIES.items(), key=lambda kv: -sum(kv[1])):
+        print(f"   {step:<16} n={len(times):<4} mean={sum(times) / len(times):.2f}s "
+              f"max={max(times):.2f}s total={sum(times):.1f}s")
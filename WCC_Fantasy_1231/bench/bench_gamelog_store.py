@@ -0,0 +1,105 @@
+"""
+Benchmark: reading the gamelog from CSV vs the partitioned Parquet store.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 bench/bench_gamelog_store.py
+    python3 bench/bench_gamelog_store.py --scale 1 100 1000
+
+At each --scale the real gamelog is tiled into that many seasons (dates shifted back
+one year per copy), written once as a CSV and once as a store in a temp folder, and
+each read is timed best of --repeat. The reads mirror the app: everything (update_fantasy_stats.py,
+pages 3 and 5), a few columns (pages 6 and 7) and a few columns of one week.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.gamelog_store import list_partitions, read_store, season_of, write_gamelog
+from wcc.schema import CSV_WRITE_OPTIONS, read_gamelog, write_schema
+
+COLUMNS = ["Name", "FantasyPts", "weeknum"]  # what page 6 reads
+
+
+def timed(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def tile(gamelog, copies):
+    """copies seasons of the gamelog, each one year earlier than the last."""
+    frames = []
+    for i in range(copies):
+        frame = gamelog.copy()
+        frame["Date"] = frame["Date"] - pd.DateOffset(years=i)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def folder_mb(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path) / 1e6
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(path) for f in files) / 1e6
+
+
+def bench(gamelog, copies, tmp, repeat):
+    df = tile(gamelog, copies)
+    csv = os.path.join(tmp, f"gamelog-x{copies}.csv")
+    store = os.path.join(tmp, f"store-x{copies}")
+    df.to_csv(csv, index=False, **CSV_WRITE_OPTIONS)
+    write_schema(csv, df)
+    t0 = time.perf_counter()
+    write_gamelog(df, store)
+    write_s = time.perf_counter() - t0
+
+    season = int(season_of(df["Date"]).max())
+    week = int(df["weeknum"].dropna().max())
+    print(f"\n{copies}x: {len(df):,} rows | CSV {folder_mb(csv):.1f} MB | store {folder_mb(store):.1f} MB in "
+          f"{len(list_partitions(store))} partition(s), written in {write_s:.2f}s")
+
+    def csv_week():
+        part = read_gamelog(csv, columns=COLUMNS + ["Date"])
+        return part[(season_of(part["Date"]) == season).to_numpy() & (part["weeknum"] == week).to_numpy()]
+
+    cases = [
+        ("all columns", lambda: pd.read_csv(csv), lambda: read_gamelog(csv), lambda: read_store(store)),
+        ("3 columns", lambda: pd.read_csv(csv, usecols=COLUMNS), lambda: read_gamelog(csv, columns=COLUMNS),
+         lambda: read_store(store, columns=COLUMNS)),
+        ("3 columns, one week", None, csv_week,
+         lambda: read_store(store, columns=COLUMNS, seasons=[season], weeks=[week])),
+    ]
+    print(f"{'read':<22} {'pd.read_csv':>12} {'typed CSV':>12} {'store':>10} {'speedup':>8}  rows")
+    for name, raw, typed, stored in cases:
+        raw_s = timed(raw, repeat)[1] if raw else None
+        typed_rows, typed_s = timed(typed, repeat)
+        store_rows, store_s = timed(stored, repeat)
+        assert len(typed_rows) == len(store_rows), (name, len(typed_rows), len(store_rows))
+        raw_txt = f"{raw_s:>11.3f}s" if raw_s is not None else f"{'-':>12}"
+        print(f"{name:<22} {raw_txt} {typed_s:>11.3f}s {store_s:>9.3f}s {typed_s / store_s:>7.1f}x  {len(store_rows):,}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark gamelog CSV vs Parquet store reads.")
+    parser.add_argument("--gamelog", default="Gamelog/gamelog.csv")
+    parser.add_argument("--scale", nargs="+", type=int, default=[1, 100], help="Seasons of data to bench")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    gamelog = read_gamelog(args.gamelog)
+    with tempfile.TemporaryDirectory() as tmp:
+        for copies in args.scale:
+            bench(gamelog, copies, tmp, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: fantasy points via wcc.scoring.score (the league rules, one matrix
+multiply) vs the old row-by-row DataFrame.apply path.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 bench/bench_scoring.py
+    python3 bench/bench_scoring.py --rows 1000000 --full-apply   # time apply on all 1M rows too (slow)
+
+The synthetic log is the real gamelog tiled up to --rows. Without --full-apply, the
+apply path is timed on the first --apply-sample rows and extrapolated.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.scoring import DEFAULT, RULES_DIR, load_rules, score
+
+
+def calculate_fantasy_points(row):
+    """The old per-row scorer from ESPN_SCRAPER.py, kept here as the baseline."""
+    fp = 0.0
+    for stat, w in DEFAULT.weights.items():
+        if stat in row:
+            val = pd.to_numeric(row[stat], errors="coerce")
+            if pd.notna(val):
+                fp += w * float(val)
+    return round(fp, 0)
+
+
+def timed(fn, repeat=1):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def bench(name, df, apply_sample=None):
+    vec, vec_s = timed(lambda: score(df), repeat=3)
+    sample = df if apply_sample is None or apply_sample >= len(df) else df.iloc[:apply_sample]
+    old, old_s = timed(lambda: sample.apply(calculate_fantasy_points, axis=1))
+    if len(sample) < len(df):
+        old_s *= len(df) / len(sample)
+    mismatches = int((old.to_numpy() != vec.iloc[:len(sample)].to_numpy()).sum())
+    est = " (est.)" if len(sample) < len(df) else ""
+    print(f"{name:<24} {len(df):>9,} rows | apply {old_s:>9.3f}s{est:<7} | matmul {vec_s:>8.4f}s | "
+          f"{old_s / vec_s:>8.0f}x | mismatches {mismatches}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fantasy points scoring.")
+    parser.add_argument("--gamelog", default="Gamelog/gamelog.csv")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic log size")
+    parser.add_argument("--apply-sample", type=int, default=20_000, help="Rows to time apply on for the synthetic log")
+    parser.add_argument("--full-apply", action="store_true", help="Time apply on every synthetic row")
+    args = parser.parse_args()
+
+    gamelog = pd.read_csv(args.gamelog)
+    bench("gamelog.csv", gamelog)
+
+    reps = int(np.ceil(args.rows / len(gamelog)))
+    synthetic = pd.concat([gamelog] * reps, ignore_index=True).iloc[:args.rows]
+    bench("synthetic", synthetic, None if args.full_apply else args.apply_sample)
+
+    # Full rules spec: weights + threshold bonuses + Pos. multipliers + rounding, still one pass
+    rules = load_rules(os.path.join(RULES_DIR, "bonus_example.toml"))
+    positions = pd.Series(np.random.default_rng(0).choice(["G", "F", "C"], len(synthetic)), index=synthetic.index)
+    _, rules_s = timed(lambda: rules.score(synthetic, positions=positions), repeat=3)
+    print(f"{'rules: bonus_example':<24} {len(synthetic):>9,} rows | {rules_s:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,16 @@
+import os
+import sys
+
 import pandas as pd
 import numpy as np
 
-df = pd.read_csv("Gamelog/copies/fantasy_stats_latest2.csv")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # WCC_Fantasy_1231, for wcc/
+from wcc.scoring import DEFAULT_RULES, load_rules
 
-POINTS_DICT_NEW = {
-    "FGM_sum": 2,
-    "FGA_sum": -1,
-    "FTM_sum": 1,
-    "FTA_sum": -1,
-    "3PM_sum": 2,
-    "3PA_sum": -1,
-    "OREB_sum": 1,
-    "DREB_sum": 1,
-    "AST_sum": 3,
-    "STL_sum": 3.5,
-    "BLK_sum": 3.5,
-    "TO_sum": -2.5,
-    "PTS_sum": 1.5,
-}
+# Rules file to rescore with (default: the league rules)
+rules = load_rules(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_RULES)
 
+df = pd.read_csv("Gamelog/copies/fantasy_stats_latest2.csv")
 
 '''
 print(
@@ -28,16 +20,10 @@ print(
     .round({"FantasyPts_sum":1,"FantasyPts_mean":2})
 )
 '''
-# Ensure stats are numeric (coerce bad strings to NaN)
-for col in POINTS_DICT_NEW:
-    if col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-df["NewFP_sum"] = 0.0
-for stat, w in POINTS_DICT_NEW.items():
-    if stat in df.columns:
-        df["NewFP_sum"] += df[stat].fillna(0) * w
-        df["NewFP_sum"] = df["NewFP_sum"].round(0)
+# Rescore the season sums with the rules' weights and Pos. multipliers.
+# didWin has no _sum column here, so it scores 0 like before; per-game bonuses
+# can't be recovered from sums (rescore the gamelog for those).
+df["NewFP_sum"] = rules.score(df, suffix="_sum")
 
 df["NewFP_mean"] = np.where(df["GP"].fillna(0) > 0, df["NewFP_sum"] / df["GP"], np.nan)
 
@@ -0,0 +1,8 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # WCC_Fantasy_1231
+sys.path.insert(0, ROOT)  # for wcc/
+sys.path.insert(0, os.path.join(ROOT, "Scraper"))  # the scraper modules import each other by bare name
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
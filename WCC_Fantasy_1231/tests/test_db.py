@@ -0,0 +1,83 @@
+import os
+import sqlite3
+import time
+
+import pandas as pd
+
+from wcc.db import GAMELOG_COLUMNS, FantasyDB, is_current
+from wcc.players import Players
+
+
+def open_db(tmp_path):
+    db = FantasyDB(str(tmp_path / "league.db"))
+    db._players = Players(str(tmp_path / "players.csv"), str(tmp_path / "player_aliases.csv"))
+    return db
+
+
+def game(game_id, pts, date="2026-01-04"):
+    return pd.DataFrame({"Name": ["Ella Brubaker"], "Jersey #": ["#3"], "Team": ["Seattle U Redhawks"],
+                         "Opponent": ["Portland Pilots"], "didWin": [0], "Date": [pd.Timestamp(date)],
+                         "PTS": [pts], "FantasyPts": [float(pts)], "isWCC": [True], "weeknum": [2],
+                         "GameId": [game_id]})
+
+
+def test_doubleheader_keeps_both_games(tmp_path):
+    db = open_db(tmp_path)
+    db.upsert_gamelog(game(401000001, 20))
+    db.upsert_gamelog(game(401000002, 12))  # same day, same opponent, second game
+    db.upsert_gamelog(game(401000001, 21))  # stat correction: replaces game 1, not a new row
+    games = db.gamelog()
+    assert sorted(zip(games["GameId"], games["PTS"])) == [(401000001, 21), (401000002, 12)]
+    db.close()
+
+
+def test_keyed_row_replaces_row_stored_without_game_id(tmp_path):
+    db = open_db(tmp_path)
+    db.upsert_gamelog(game(None, 20))
+    db.upsert_gamelog(game(None, 20))  # legacy rows are keyed by Date
+    assert len(db.gamelog()) == 1
+    db.upsert_gamelog(game(401000001, 20))
+    assert db.gamelog()["GameId"].tolist() == [401000001]
+    db.close()
+
+
+def test_old_primary_key_is_migrated(tmp_path):
+    path = str(tmp_path / "league.db")
+    con = sqlite3.connect(path)
+    columns = ", ".join(f'"{col}" {sql_type}' for col, sql_type in GAMELOG_COLUMNS.items() if col != "Opponent")
+    con.execute(f'CREATE TABLE gamelog ({columns}, "Opponent" TEXT NOT NULL, '
+                'PRIMARY KEY ("Name", "Team", "Opponent", "Date"))')
+    con.execute('INSERT INTO gamelog ("Name", "Jersey #", "Team", "Opponent", "didWin", "Date", "PTS", "isWCC") '
+                "VALUES ('Ella Brubaker', '#3', 'Seattle U Redhawks', '', 0, '2026-01-04', 20, 1)")
+    con.commit()
+    con.close()
+
+    db = open_db(tmp_path)
+    games = db.gamelog()
+    assert games["PTS"].tolist() == [20] and games["Opponent"].isna().all()  # "" only fit the old key
+    indexes = {row[1] for row in db.con.execute("PRAGMA index_list(gamelog)")}
+    assert {"gamelog_key", "gamelog_player", "gamelog_team_week", "gamelog_week"} <= indexes
+    db.upsert_gamelog(game(401000002, 12))
+    assert db.gamelog()["GameId"].tolist() == [401000002]
+    db.close()
+
+
+def test_player_games_by_id(tmp_path):
+    db = open_db(tmp_path)
+    db.upsert_gamelog(pd.concat([game(401000001, 20), game(401000002, 12, date="2026-01-08")], ignore_index=True))
+    player_id = db.players.lookup("Ella Brubaker")
+    assert db.player_games_by_id(player_id)["PTS"].tolist() == [12, 20]  # newest first
+    assert db.player_games_by_id(player_id + 1).empty
+    db.close()
+
+
+def test_is_current(tmp_path):
+    csv_path = tmp_path / "gamelog.csv"
+    csv_path.write_text("Name\n")
+    db = open_db(tmp_path)
+    db.upsert_gamelog(game(401000001, 20))
+    db.close()
+    assert is_current(db.path, (str(csv_path), str(tmp_path / "missing")))
+    os.utime(csv_path, (time.time() + 60, time.time() + 60))  # gamelog changed after the last database write
+    assert not is_current(db.path, (str(csv_path),))
+    assert not is_current(str(tmp_path / "none.db"))
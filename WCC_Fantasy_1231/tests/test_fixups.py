@@ -0,0 +1,56 @@
+import pandas as pd
+
+from fixups import apply_to_csv, placeholder_for
+from sinks import UpsertCsvSink, gamelog_keys
+from wcc.players import Players
+from wcc.schema import read_gamelog
+
+PLACEHOLDER = placeholder_for("401000001", "away_team")
+
+
+def stored_gamelog(path):
+    """Two rows of game 401000001 as an unattended scrape stored them: the away team left as a placeholder."""
+    df = pd.DataFrame({"Name": ["Ella Brubaker", "Allie Turner"], "Jersey #": ["#3", "#1"],
+                       "Team": [PLACEHOLDER, "Portland Pilots"], "Opponent": ["Portland Pilots", PLACEHOLDER],
+                       "didWin": [0, 1], "Date": pd.to_datetime(["2026-01-04"] * 2), "PTS": [20, 26],
+                       "FantasyPts": [48.0, 62.0], "isWCC": [False, True], "weeknum": [2, 2],
+                       "GameId": [401000001, 401000001], "PlayerId": [900, 2]})
+    sink = UpsertCsvSink(str(path))
+    sink.write(df)
+    sink.close()
+    return read_gamelog(str(path))
+
+
+def test_apply_keeps_dtypes_and_game_id(tmp_path):
+    path = tmp_path / "gamelog.csv"
+    before = stored_gamelog(path)
+    players = Players(str(tmp_path / "players.csv"), str(tmp_path / "player_aliases.csv"))
+
+    changed = apply_to_csv(str(path), {PLACEHOLDER: "Seattle U Redhawks"}, lambda team: "wcc", players)
+
+    assert changed == 2
+    after = read_gamelog(str(path))
+    assert after.dtypes.astype(str).to_dict() == before.dtypes.astype(str).to_dict()
+    assert after["GameId"].tolist() == [401000001, 401000001]
+    assert "401000001" in path.read_text() and "401000001.0" not in path.read_text()
+    assert after["Team"].tolist() == ["Seattle U Redhawks", "Portland Pilots"]
+    assert after["Opponent"].tolist() == ["Portland Pilots", "Seattle U Redhawks"]
+    assert after["isWCC"].tolist() == [True, True]
+    # The patched row gets the id of its real team; untouched rows keep theirs
+    assert after["PlayerId"].tolist() == [players.lookup("Ella Brubaker", "Seattle U Redhawks"), 2]
+
+
+def test_apply_rebuilds_the_upsert_index(tmp_path):
+    path = tmp_path / "gamelog.csv"
+    stored_gamelog(path)
+    players = Players(str(tmp_path / "players.csv"), str(tmp_path / "player_aliases.csv"))
+    apply_to_csv(str(path), {PLACEHOLDER: "Seattle U Redhawks"}, players=players)
+
+    # Re-ingesting the fixed game is a no-op: the index knows the patched rows
+    sink = UpsertCsvSink(str(path))
+    sink._load()
+    assert set(gamelog_keys(read_gamelog(str(path))).tolist()) == set(sink._index)
+    size = path.stat().st_size
+    sink.write(read_gamelog(str(path)))
+    sink.close()
+    assert path.stat().st_size == size
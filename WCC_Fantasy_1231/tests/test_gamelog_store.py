@@ -0,0 +1,25 @@
+import os
+
+import pandas as pd
+
+from conftest import FIXTURES
+from http_ingest import fetch_html, parse_game_html
+from wcc.gamelog_store import list_partitions, read_store, write_gamelog
+
+
+def scraped_game():
+    """Rows as the scraper hands them to a sink: nobody set weeknum."""
+    html = fetch_html(None, os.path.join(FIXTURES, "401000001.html"))
+    return pd.concat(parse_game_html(html, {"game_id": "401000001", "date": "01/04/26"}), ignore_index=True)
+
+
+def test_scraped_game_lands_in_its_week_partition(tmp_path):
+    root = str(tmp_path / "gamelog_store")
+    write_gamelog(scraped_game(), root=root)
+
+    # Sunday 01/04/26 is in week 2 (week 1 starts Sunday 12/28)
+    assert [(season, week) for season, week, _ in list_partitions(root)] == [(2026, 2)]
+    assert os.path.exists(os.path.join(root, "season=2026", "weeknum=2", "part.parquet"))
+    week = read_store(root, weeks=[2])
+    assert len(week) == 12
+    assert (week["weeknum"] == 2).all()
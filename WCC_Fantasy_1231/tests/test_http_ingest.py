@@ -0,0 +1,36 @@
+import os
+
+from conftest import FIXTURES
+from ESPN_SCRAPER import COLUMN_ORDER
+from http_ingest import fetch_html, parse_game_html
+
+GAME = {"game_id": "401000001", "date": "01/04/26"}
+
+
+def parse_fixture():
+    return parse_game_html(fetch_html(None, os.path.join(FIXTURES, "401000001.html")), GAME)
+
+
+def test_both_teams_come_out_in_column_order():
+    away, home = parse_fixture()
+    assert list(away.columns) == COLUMN_ORDER
+    assert list(home.columns) == COLUMN_ORDER
+    assert len(away) == len(home) == 6  # 5 starters + 1 off the bench, the TEAM totals row dropped
+    assert set(away["Team"]) == {"Seattle U Redhawks"} and set(away["Opponent"]) == {"Portland Pilots"}
+    assert set(home["Team"]) == {"Portland Pilots"} and set(home["Opponent"]) == {"Seattle U Redhawks"}
+    assert (away["didWin"] == 0).all() and (home["didWin"] == 1).all()
+    assert (away["GameId"] == 401000001).all()
+
+
+def test_stat_values():
+    away, home = parse_fixture()
+    starter = away.iloc[0]
+    assert (starter["Name"], starter["Jersey #"]) == ("Ella Brubaker", "#3")
+    assert [starter[c] for c in ["MIN", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "OREB", "DREB", "REB", "AST",
+                                 "STL", "BLK", "TO", "PF", "PTS"]] == [32, 7, 12, 2, 5, 4, 4, 1, 5, 6, 4, 2, 0, 3, 2, 20]
+    assert starter["efg%"] == 0.667
+    assert starter["FantasyPts"] == 48.0
+
+    bench = home.iloc[5]
+    assert (bench["Name"], bench["Jersey #"], bench["PTS"], bench["MIN"]) == ("Lucy Larson", "#30", 2, 18)
+    assert away["PTS"].sum() == 54 and home["PTS"].sum() == 58
@@ -0,0 +1,37 @@
+import os
+
+import pandas as pd
+
+from conftest import FIXTURES
+from http_ingest import fetch_html, parse_game_html
+from sinks import UpsertCsvSink
+from wcc.name_resolver import accept_matches, match_report
+from wcc.players import Players, with_player_ids
+from wcc.schema import read_gamelog
+from wcc.season_agg import SeasonAgg, rebuild
+
+
+def test_accept_restamps_gamelog_and_cube(tmp_path, monkeypatch):
+    html = fetch_html(None, os.path.join(FIXTURES, "401000001.html"))
+    monkeypatch.chdir(tmp_path)  # the league gamelog and cube paths are relative to WCC_Fantasy_1231
+    players = Players("data/players.csv", "data/player_aliases.csv")
+    roster_id = int(players.sync_roster(pd.DataFrame({"Full Name": ["Ella Brubacker"],
+                                                      "FullTeamName": ["Seattle U Redhawks"]})).iloc[0])
+    game = pd.concat(parse_game_html(html, {"game_id": "401000001", "date": "01/04/26"}), ignore_index=True)
+    sink = UpsertCsvSink("Gamelog/gamelog.csv")
+    sink.write(with_player_ids(game, players))  # ESPN's spelling gets an id of its own
+    sink.close()
+    rebuild(players=players).save()
+    old_id = int(read_gamelog("Gamelog/gamelog.csv").set_index("Name").loc["Ella Brubaker", "PlayerId"])
+
+    report = match_report(read_gamelog("Gamelog/gamelog.csv"), players)
+    match = report[report["name"] == "Ella Brubaker"]
+    assert match["candidate_id"].tolist() == [roster_id]
+    assert match["status"].tolist() == ["review"]  # one letter off: shown for review, not pre-accepted
+    report.loc[match.index, "accept"] = "y"
+
+    assert accept_matches(report, players) == {old_id: roster_id}
+    gamelog = read_gamelog("Gamelog/gamelog.csv")
+    assert gamelog.loc[gamelog["Name"] == "Ella Brubaker", "PlayerId"].tolist() == [roster_id]
+    cube_ids = set(SeasonAgg.load().sums.index.get_level_values("PlayerId"))
+    assert roster_id in cube_ids and old_id not in cube_ids
@@ -0,0 +1 @@
+"""Shared WCC fantasy data code used by the scraper, the Gamelog/data scripts and the web app."""
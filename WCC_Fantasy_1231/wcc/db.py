@@ -0,0 +1,367 @@
+"""
+League SQLite database: gamelog, rosters, draft results and weekly rosters.
+
+The gamelog table keeps the CSV column names and is unique on the same key as the
+CSV sinks, GAMELOG_KEY (GameId, Team, Name, Jersey #), so re-ingesting a day replaces
+rows instead of duplicating them while both games of a doubleheader are kept. Rows
+stored before GameId was recorded are keyed by Date instead, and are replaced by the
+keyed row the first time their game is ingested again. It is indexed on player,
+team + week and week. The database runs in WAL mode, so the scraper (`--sink sqlite`)
+can write while the Streamlit pages read.
+
+Pages go through FantasyDB instead of loading whole CSVs:
+
+    db = FantasyDB(readonly=True)
+    db.player_games("Ella Brubaker")        # one player's games (index on PlayerId)
+    db.player_games_by_id(17)               # the same, by PlayerId
+    db.team_week("Seattle U Redhawks", 3)   # one team's week (index on Team, weeknum)
+    db.userteam_week("UserTeam1", 3)        # a fantasy team's rostered games that week
+
+Load the CSVs, run from the WCC_Fantasy_1231 folder:
+
+    python3 wcc/db.py import
+    python3 wcc/db.py import --week 3    # also snapshot draft results as week 3's rosters
+    python3 wcc/db.py plans              # show each query's index use and timing
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.players import load_players, with_player_ids
+from wcc.schema import GAMELOG_KEY, GAMELOG_SCHEMA, enforce_schema, read_gamelog
+
+DB_PATH = "data/wcc_fantasy.db"
+GAMELOG_CSV = "Gamelog/gamelog.csv"
+ROSTERS_CSV = "data/wcc_concat_updated.csv"
+DRAFT_CSV = "data/draft_results.csv"
+
+SQL_TYPES = {"string": "TEXT", "category": "TEXT", "date": "TEXT", "bool": "INTEGER",
+             "float32": "REAL", "float64": "REAL"}  # everything else is an int
+
+ROSTER_COLUMNS = {"#": "INTEGER", "Full Name": "TEXT NOT NULL", "FullTeamName": "TEXT NOT NULL", "Team": "TEXT",
+                  "Pos.": "TEXT", "Ht.": "TEXT", "Year": "TEXT", "Hometown": "TEXT", "Previous School": "TEXT",
+                  "ImageURL": "TEXT", "clean_name": "TEXT", "ADP": "REAL", "player_id": "INTEGER"}
+
+
+def _q(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _columns_sql(columns):
+    return ",\n    ".join(f"{_q(col)} {sql_type}" for col, sql_type in columns.items())
+
+
+GAMELOG_COLUMNS = {col: SQL_TYPES.get(dtype, "INTEGER") + (" NOT NULL" if col in ("Team", "Name") else "")
+                   for col, dtype in GAMELOG_SCHEMA.items()}
+
+# GAMELOG_KEY as SQL, keyed like Scraper/sinks.gamelog_keys(): no GameId -> Date, no jersey -> ""
+# (a plain key would let NULLs through as distinct values)
+_KEY_SQL = {"GameId": """COALESCE("GameId", 'date:' || "Date")""", "Jersey #": """COALESCE("Jersey #", '')"""}
+GAMELOG_KEY_SQL = ", ".join(_KEY_SQL.get(col, _q(col)) for col in GAMELOG_KEY)
+
+SCHEMA_SQL = f"""
+CREATE TABLE IF NOT EXISTS gamelog (
+    {_columns_sql(GAMELOG_COLUMNS)}
+);
+CREATE UNIQUE INDEX IF NOT EXISTS gamelog_key ON gamelog ({GAMELOG_KEY_SQL});
+CREATE INDEX IF NOT EXISTS gamelog_player ON gamelog ("PlayerId", weeknum);
+CREATE INDEX IF NOT EXISTS gamelog_team_week ON gamelog ("Team", weeknum);
+CREATE INDEX IF NOT EXISTS gamelog_week ON gamelog (weeknum);
+
+CREATE TABLE IF NOT EXISTS rosters (
+    {_columns_sql(ROSTER_COLUMNS)},
+    PRIMARY KEY ("Full Name", "FullTeamName")
+);
+CREATE INDEX IF NOT EXISTS rosters_player ON rosters (player_id);
+CREATE INDEX IF NOT EXISTS rosters_team ON rosters ("FullTeamName");
+
+CREATE TABLE IF NOT EXISTS draft_results (
+    "Player" TEXT PRIMARY KEY,
+    "Team" TEXT NOT NULL,
+    player_id INTEGER
+);
+CREATE INDEX IF NOT EXISTS draft_results_team ON draft_results ("Team");
+
+CREATE TABLE IF NOT EXISTS weekly_rosters (
+    weeknum INTEGER NOT NULL,
+    userteam TEXT NOT NULL,
+    "Player" TEXT NOT NULL,
+    player_id INTEGER,
+    PRIMARY KEY (weeknum, "Player")
+);
+CREATE INDEX IF NOT EXISTS weekly_rosters_team ON weekly_rosters (weeknum, userteam);
+"""
+
+
+def connect(path=DB_PATH, readonly=False):
+    """
+    Open the league database (WAL mode, waits up to 5s for a writer's lock).
+
+    Parameters:
+    - path (str): Database file.
+    - readonly (bool): Open read-only (what the pages use).
+
+    Returns:
+    - sqlite3.Connection
+    """
+    if readonly:
+        con = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+    else:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        con = sqlite3.connect(path, check_same_thread=False)
+        con.execute("PRAGMA journal_mode=WAL")  # readers don't block the writer or each other
+        con.execute("PRAGMA synchronous=NORMAL")
+        _migrate_gamelog_key(con)
+        con.executescript(SCHEMA_SQL)
+    con.execute("PRAGMA busy_timeout=5000")
+    return con
+
+
+def _migrate_gamelog_key(con):
+    """Re-key a gamelog table created with the old PRIMARY KEY (Name, Team, Opponent, Date), keeping its rows."""
+    if not any(row[5] for row in con.execute("PRAGMA table_info(gamelog)")):
+        return
+    with con:
+        con.execute("ALTER TABLE gamelog RENAME TO gamelog_old")
+        for index in ("gamelog_player", "gamelog_team_week", "gamelog_week"):
+            con.execute(f"DROP INDEX IF EXISTS {index}")  # they moved with the rename
+    con.executescript(SCHEMA_SQL)
+    old = [row[1] for row in con.execute("PRAGMA table_info(gamelog_old)")]
+    cols = [c for c in GAMELOG_COLUMNS if c in old]
+    values = ["""NULLIF("Opponent", '')""" if c == "Opponent" else _q(c) for c in cols]  # was "" to fit the old key
+    with con:
+        con.execute(f"INSERT OR REPLACE INTO gamelog ({', '.join(_q(c) for c in cols)}) "
+                    f"SELECT {', '.join(values)} FROM gamelog_old")
+        con.execute("DROP TABLE gamelog_old")
+
+
+def is_current(path=DB_PATH, sources=(GAMELOG_CSV,)):
+    """True when the database exists and was written after every existing source last changed."""
+    if not os.path.exists(path):
+        return False
+    # In WAL mode recent writes sit in <path>-wal until a checkpoint
+    written = max(os.path.getmtime(p) for p in (path, path + "-wal") if os.path.exists(p))
+    return all(written >= os.path.getmtime(src) for src in sources if os.path.exists(src))
+
+
+def _sql_rows(df, columns):
+    """df[columns] as a list of tuples of plain Python values (NA -> NULL, dates as ISO text)."""
+    out = {}
+    for col in columns:
+        series = df[col] if col in df.columns else pd.Series(None, index=df.index, dtype=object)
+        if pd.api.types.is_datetime64_any_dtype(series):
+            series = series.dt.strftime("%Y-%m-%d")
+        elif pd.api.types.is_float_dtype(series):
+            series = series.astype("float64")
+        out[col] = series.astype(object).where(series.notna(), None)
+    return list(zip(*out.values())) if out else []
+
+
+def _insert(con, table, df, columns, replace=True):
+    cols = ", ".join(_q(c) for c in columns)
+    marks = ", ".join("?" * len(columns))
+    verb = "INSERT OR REPLACE" if replace else "INSERT"
+    con.executemany(f"{verb} INTO {table} ({cols}) VALUES ({marks})", _sql_rows(df, columns))
+
+
+def _typed_gamelog(df):
+    """Gamelog rows read back from SQL in the schema dtypes."""
+    if "Date" in df.columns:
+        df["Date"] = pd.to_datetime(df["Date"], format="ISO8601")
+    # SQLite already hands back numbers, so a plain astype is enough for all but bools
+    plain = {c: t for c, t in GAMELOG_SCHEMA.items() if c in df.columns and t not in ("date", "bool")}
+    df = df.astype(plain)
+    return enforce_schema(df, {c: t for c, t in GAMELOG_SCHEMA.items() if c in df.columns}, label="gamelog table")
+
+
+class FantasyDB:
+    """Repository over the league database: every read is an indexed query, every write one transaction."""
+
+    def __init__(self, path=DB_PATH, readonly=False):
+        self.path = path
+        self.con = connect(path, readonly)
+        self._players = None
+
+    @property
+    def players(self):
+        if self._players is None:
+            self._players = load_players()
+        return self._players
+
+    def close(self):
+        self.con.close()
+
+    def query(self, sql, params=()):
+        return pd.read_sql_query(sql, self.con, params=params)
+
+    # --- gamelog ---
+
+    def upsert_gamelog(self, df):
+        """Insert or replace gamelog rows on GAMELOG_KEY (GameId, Team, Name, Jersey #). Returns rows written."""
+        df = with_player_ids(enforce_schema(df), self.players)
+        keyed = df[df["GameId"].notna()] if "GameId" in df.columns else df.iloc[:0]
+        with self.con:
+            # Rows stored before GameId was recorded give way to the keyed rows of their game
+            self.con.executemany(
+                f"DELETE FROM gamelog WHERE ({GAMELOG_KEY_SQL}) = ('date:' || ?, ?, ?, COALESCE(?, ''))",
+                _sql_rows(keyed.assign(GameId=keyed["Date"]), list(GAMELOG_KEY)))
+            _insert(self.con, "gamelog", df, list(GAMELOG_COLUMNS))
+        return len(df)
+
+    def clear_gamelog(self):
+        with self.con:
+            self.con.execute("DELETE FROM gamelog")
+
+    def gamelog(self, columns=None, weeks=None):
+        cols = "*" if columns is None else ", ".join(_q(c) for c in columns)
+        sql = f"SELECT {cols} FROM gamelog"
+        params = ()
+        if weeks is not None:
+            sql += f" WHERE weeknum IN ({', '.join('?' * len(weeks))})"
+            params = tuple(int(w) for w in weeks)
+        return _typed_gamelog(self.query(sql + ' ORDER BY "Date"', params))
+
+    def player_games(self, name):
+        """Every game for a player, newest first (name resolved to a PlayerId through the player dimension)."""
+        player_id = self.players.lookup(name)
+        return self.player_games_by_id(-1 if player_id is None else player_id)
+
+    def player_games_by_id(self, player_id):
+        """Every game for a PlayerId, newest first."""
+        return _typed_gamelog(self.query(
+            'SELECT * FROM gamelog WHERE "PlayerId" = ? ORDER BY "Date" DESC', (int(player_id),)))
+
+    def team_week(self, team, weeknum):
+        """Every player row for one WCC team in one week."""
+        return _typed_gamelog(self.query(
+            'SELECT * FROM gamelog WHERE "Team" = ? AND weeknum = ? ORDER BY "Date", "Name"', (team, int(weeknum))))
+
+    def week(self, weeknum):
+        return _typed_gamelog(self.query('SELECT * FROM gamelog WHERE weeknum = ? ORDER BY "Date"', (int(weeknum),)))
+
+    def userteam_week(self, userteam, weeknum):
+        """Games that week by the players a fantasy team had rostered that week."""
+        return _typed_gamelog(self.query(
+            'SELECT g.*, w.userteam FROM weekly_rosters w '
+            'JOIN gamelog g ON g."PlayerId" = w.player_id AND g.weeknum = w.weeknum '
+            'WHERE w.weeknum = ? AND w.userteam = ? ORDER BY g."Date"', (int(weeknum), userteam)))
+
+    # --- rosters, draft results, weekly rosters ---
+
+    def replace_rosters(self, df):
+        """Replace the WCC rosters (columns outside ROSTER_COLUMNS are not stored)."""
+        df = df.assign(player_id=self.players.sync_roster(df))
+        with self.con:
+            self.con.execute("DELETE FROM rosters")
+            _insert(self.con, "rosters", df, list(ROSTER_COLUMNS))
+        return len(df)
+
+    def rosters(self, team=None):
+        if team is None:
+            return self.query("SELECT * FROM rosters")
+        return self.query('SELECT * FROM rosters WHERE "FullTeamName" = ?', (team,))
+
+    def replace_draft_results(self, df):
+        df = df.assign(player_id=self.players.ids(df["Player"], create=False))
+        with self.con:
+            self.con.execute("DELETE FROM draft_results")
+            _insert(self.con, "draft_results", df, ["Player", "Team", "player_id"])
+        return len(df)
+
+    def draft_results(self, team=None):
+        if team is None:
+            return self.query("SELECT * FROM draft_results")
+        return self.query('SELECT * FROM draft_results WHERE "Team" = ?', (team,))
+
+    def set_weekly_rosters(self, weeknum, df):
+        """
+        Replace one week's fantasy rosters.
+
+        Parameters:
+        - weeknum (int): League week.
+        - df (pd.DataFrame): Team (fantasy team) and Player columns, like draft_results.csv.
+        """
+        df = pd.DataFrame({"weeknum": int(weeknum), "userteam": df["Team"], "Player": df["Player"],
+                           "player_id": self.players.ids(df["Player"], create=False)})
+        with self.con:
+            self.con.execute("DELETE FROM weekly_rosters WHERE weeknum = ?", (int(weeknum),))
+            _insert(self.con, "weekly_rosters", df, list(df.columns))
+        return len(df)
+
+    def snapshot_rosters(self, weeknum):
+        """Record the current draft results as the fantasy rosters for weeknum."""
+        return self.set_weekly_rosters(weeknum, self.draft_results())
+
+    def weekly_rosters(self, weeknum=None):
+        if weeknum is None:
+            return self.query("SELECT * FROM weekly_rosters ORDER BY weeknum, userteam")
+        return self.query("SELECT * FROM weekly_rosters WHERE weeknum = ? ORDER BY userteam", (int(weeknum),))
+
+
+def import_csvs(db, gamelog_csv=GAMELOG_CSV, rosters_csv=ROSTERS_CSV, draft_csv=DRAFT_CSV):
+    """Load the league CSVs into db. Returns {table: rows}."""
+    counts = {}
+    if gamelog_csv and os.path.exists(gamelog_csv):
+        counts["gamelog"] = db.upsert_gamelog(read_gamelog(gamelog_csv))
+    if rosters_csv and os.path.exists(rosters_csv):
+        counts["rosters"] = db.replace_rosters(pd.read_csv(rosters_csv))
+    if draft_csv and os.path.exists(draft_csv):
+        counts["draft_results"] = db.replace_draft_results(pd.read_csv(draft_csv))
+    return counts
+
+
+def show_plans(db):
+    """Print the query plan and timing of each repository read."""
+    name = db.query("SELECT Name FROM gamelog LIMIT 1")["Name"].iloc[0]
+    team, week = db.query('SELECT "Team", weeknum FROM gamelog WHERE weeknum IS NOT NULL LIMIT 1').iloc[0]
+    userteam = db.query("SELECT userteam FROM weekly_rosters LIMIT 1")
+    checks = [
+        ("player_games", 'SELECT * FROM gamelog WHERE "PlayerId" = ? ORDER BY "Date" DESC', (db.players.lookup(name),),
+         lambda: db.player_games(name)),
+        ("team_week", 'SELECT * FROM gamelog WHERE "Team" = ? AND weeknum = ?', (team, int(week)),
+         lambda: db.team_week(team, week)),
+        ("week", "SELECT * FROM gamelog WHERE weeknum = ?", (int(week),), lambda: db.week(week)),
+    ]
+    if len(userteam):
+        ut = userteam["userteam"].iloc[0]
+        checks.append(("userteam_week",
+                       'SELECT g.* FROM weekly_rosters w JOIN gamelog g ON g."PlayerId" = w.player_id '
+                       "AND g.weeknum = w.weeknum WHERE w.weeknum = ? AND w.userteam = ?", (int(week), ut),
+                       lambda: db.userteam_week(ut, week)))
+    for label, sql, params, run in checks:
+        plan = " | ".join(row[-1] for row in db.con.execute("EXPLAIN QUERY PLAN " + sql, params))
+        t0 = time.perf_counter()
+        rows = len(run())
+        print(f"{label:<14} {rows:>5} row(s) {1000 * (time.perf_counter() - t0):7.2f} ms   {plan}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="League SQLite database.")
+    parser.add_argument("--db", default=DB_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="Load the gamelog, rosters and draft results CSVs")
+    imp.add_argument("--gamelog", default=GAMELOG_CSV)
+    imp.add_argument("--rosters", default=ROSTERS_CSV)
+    imp.add_argument("--draft", default=DRAFT_CSV)
+    imp.add_argument("--week", type=int, default=None, help="Also snapshot the draft results as this week's rosters")
+    sub.add_parser("plans", help="Show how each repository query uses the indexes")
+    args = parser.parse_args()
+
+    db = FantasyDB(args.db)
+    if args.command == "import":
+        for table, rows in import_csvs(db, args.gamelog, args.rosters, args.draft).items():
+            print(f"✅ {table}: {rows} row(s)")
+        if args.week is not None:
+            print(f"✅ weekly_rosters: week {args.week}, {db.snapshot_rosters(args.week)} row(s)")
+    else:
+        show_plans(db)
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
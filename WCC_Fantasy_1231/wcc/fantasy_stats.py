@@ -0,0 +1,126 @@
+"""
+fantasy_stats: the roster joined to each player's aggregated gamelog stats, fantasy
+team, rankings and efg%.
+
+build_fantasy_stats() works on frames already in memory, so the Streamlit pages can
+compute any week window in-process. web_app/update_fantasy_stats.py is the CLI that
+writes the season table to data/fantasy/fantasy_stats_latest.csv.
+
+    from wcc.fantasy_stats import build_fantasy_stats
+    week_3 = build_fantasy_stats(gamelog, roster, draft_results, weeks=[3])
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.players import ROSTER_PATH, load_players
+from wcc.rosters_ledger import DRAFT_RESULTS_PATH, FREE_AGENT, LEDGER_PATH, load_ledger, rosters_as_of
+from wcc.season_agg import aggregate
+
+OUTPUT_PATH = "data/fantasy/fantasy_stats_latest.csv"
+
+FANTASY_STATS_COLUMNS = [
+    '#', 'Full Name', 'FullTeamName', 'Pos.', 'Ht.', 'Year', 'Hometown',
+    'userteam', 'FantasyPts_sum', 'FantasyPts_mean', 'rank_pos', 'rank_global',
+    'GP', 'MIN_mean', 'PTS_mean', 'efg%', 'REB_mean', 'AST_mean', 'STL_mean',
+    'BLK_mean', '3PM_mean', '3PA_mean', 'FTM_mean', 'TO_mean', 'FGM_mean', 'FGA_mean',
+    'OREB_sum', 'OREB_mean', 'DREB_sum', 'DREB_mean', 'MIN_sum', 'PTS_sum', 'REB_sum',
+    'AST_sum', 'STL_sum', 'BLK_sum', 'TO_sum', 'FGM_sum', 'FGA_sum', '3PM_sum', '3PA_sum',
+    'FTM_sum', 'FTA_sum', 'FTA_mean', 'didWin_sum', 'Previous School', 'clean_name', 'player_id', 'ImageURL'
+]
+
+
+def userteams(roster, draft_results, players):
+    """Fantasy team per roster row ("FreeAgent" when not rostered)."""
+    if 'player_id' in draft_results.columns:
+        ids = draft_results['player_id']
+    else:
+        ids = players.ids(draft_results['Player'], create=False)
+    userteam_map = dict(zip(ids, draft_results['Team']))
+    return roster['player_id'].map(userteam_map).fillna(FREE_AGENT)
+
+
+def team_week_points(gamelog, userteam):
+    """
+    Fantasy points per userteam and week.
+
+    Parameters:
+    - gamelog (pd.DataFrame): Rows with FantasyPts and weeknum.
+    - userteam (pd.Series): userteam per row (rosters_ledger.credit()); FreeAgent rows are left out.
+
+    Returns:
+    - (pd.DataFrame, pd.Series): userteam x weeknum points (0.0 where a team scored nothing),
+      and each userteam's season total (rows without a weeknum included).
+    """
+    rostered = (userteam != FREE_AGENT).to_numpy()
+    rows = pd.DataFrame({"userteam": userteam[rostered].to_numpy(),
+                         "weeknum": gamelog["weeknum"][rostered].astype("Int64").to_numpy(),
+                         "FantasyPts": gamelog["FantasyPts"][rostered].astype("float64").to_numpy()})
+    season = rows.groupby("userteam")["FantasyPts"].sum()
+    weekly = rows.dropna(subset=["weeknum"]).pivot_table(index="userteam", columns="weeknum", values="FantasyPts",
+                                                         aggfunc="sum", fill_value=0.0)
+    weekly.columns = weekly.columns.astype("int64")
+    return weekly.reindex(season.index, fill_value=0.0), season
+
+
+def build_fantasy_stats(gamelog, roster, draft_results, weeks=None, players=None, agg=None):
+    """
+    fantasy_stats for the roster from gamelog rows.
+
+    Parameters:
+    - gamelog (pd.DataFrame): Typed gamelog (wcc/schema.py). Unused when agg is given.
+    - roster (pd.DataFrame): WCC rosters (data/wcc_concat_updated.csv).
+    - draft_results (pd.DataFrame): Player -> fantasy Team (data/draft_results.csv, or rosters_as_of()).
+    - weeks (list, optional): Only count games in these weeknums.
+    - players (Players, optional): Player dimension. Defaults to load_players().
+    - agg (pd.DataFrame, optional): Per-player aggregates already computed (SeasonAgg.table()).
+
+    Returns:
+    - pd.DataFrame: FANTASY_STATS_COLUMNS, one row per roster player, in roster order.
+    """
+    players = players or load_players()
+    roster = roster.copy()
+    if 'player_id' not in roster.columns:
+        roster['player_id'] = players.ids(roster['Full Name'], roster['FullTeamName'], create=False)
+    roster['userteam'] = userteams(roster, draft_results, players)
+
+    if agg is None:
+        if weeks is not None:
+            gamelog = gamelog[gamelog['weeknum'].isin(weeks).to_numpy()]
+        agg = aggregate(gamelog, players)
+    agg = agg.rename(columns={'PlayerId': 'player_id'})
+
+    # --- Merge aggregated data into the roster ---
+    fantasy_stats = roster.merge(agg, how='left', on='player_id')
+    num_cols = fantasy_stats.select_dtypes(include='number').columns
+    fantasy_stats[num_cols] = fantasy_stats[num_cols].fillna(0)
+
+    fantasy_stats["efg%"] = np.where(
+        fantasy_stats["FGA_sum"] > 0,
+        (fantasy_stats["FGM_sum"] + 0.5 * fantasy_stats["3PM_sum"]) / fantasy_stats["FGA_sum"],
+        np.nan
+    )
+    fantasy_stats["efg%"] = fantasy_stats["efg%"].round(3)
+
+    # --- Rankings ---
+    fantasy_stats['rank_pos'] = fantasy_stats.groupby('Pos.')['FantasyPts_sum'].rank(ascending=False)
+    fantasy_stats['rank_global'] = fantasy_stats['FantasyPts_sum'].rank(ascending=False)
+    fantasy_stats['GP'] = fantasy_stats['FantasyPts_count']
+
+    # --- Column order, rounding ---
+    fantasy_stats = fantasy_stats[FANTASY_STATS_COLUMNS]
+    cols_to_round = fantasy_stats.columns.difference(['efg%'])
+    fantasy_stats[cols_to_round] = fantasy_stats[cols_to_round].round(2)
+    return fantasy_stats
+
+
+def load_sources(roster_path=ROSTER_PATH, draft_results_path=DRAFT_RESULTS_PATH, ledger_path=LEDGER_PATH, date=None):
+    """
+    (roster, draft_results): the roster CSV, and the fantasy rosters on date (default today)
+    from the draft plus the roster transactions (wcc/rosters_ledger.py).
+    """
+    ledger = load_ledger(ledger_path, draft_results_path)
+    return pd.read_csv(roster_path), rosters_as_of(ledger, date)
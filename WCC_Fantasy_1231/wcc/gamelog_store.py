@@ -0,0 +1,227 @@
+"""
+Columnar gamelog store: Parquet files partitioned by season and week (needs pyarrow).
+
+    Gamelog/gamelog_store/season=2026/weeknum=3/part.parquet
+
+Files keep the schema dtypes (wcc/schema.py), so nothing is re-parsed from text.
+read_store() only opens the partitions that match seasons= / weeks= and only
+decodes the requested columns. write_gamelog() upserts rows into their partitions
+on GAMELOG_KEY, rewriting just the weeks it touches; the scraper writes through it
+with `--sink store` (StoreSink in Scraper/sinks.py).
+
+One-time migration from the CSVs, run from the WCC_Fantasy_1231 folder:
+
+    python3 wcc/gamelog_store.py migrate Gamelog/gamelog.csv
+"""
+import argparse
+import os
+import shutil
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.schema import GAMELOG_KEY, GAMELOG_SCHEMA, enforce_schema, read_gamelog
+
+GAMELOG_CSV = "Gamelog/gamelog.csv"
+STORE_PATH = "Gamelog/gamelog_store"
+PART_FILE = "part.parquet"
+NO_WEEK = "none"  # partition name for rows without a weeknum
+
+
+def season_of(dates):
+    """Season a game belongs to, named for the year it ends in (Nov 2025 - Mar 2026 -> 2026)."""
+    return (dates.dt.year + (dates.dt.month >= 7)).astype("Int16")
+
+
+def _partition_dir(root, season, week):
+    return os.path.join(root, f"season={season}", f"weeknum={NO_WEEK if pd.isna(week) else int(week)}")
+
+
+def list_partitions(root=STORE_PATH):
+    """[(season, weeknum, file)] for every partition in the store, oldest first (weeknum None = no week)."""
+    parts = []
+    if not os.path.isdir(root):
+        return parts
+    for season_dir in os.listdir(root):
+        if not season_dir.startswith("season="):
+            continue
+        for week_dir in os.listdir(os.path.join(root, season_dir)):
+            path = os.path.join(root, season_dir, week_dir, PART_FILE)
+            if week_dir.startswith("weeknum=") and os.path.exists(path):
+                week = week_dir.split("=", 1)[1]
+                parts.append((int(season_dir.split("=", 1)[1]), None if week == NO_WEEK else int(week), path))
+    return sorted(parts, key=lambda p: (p[0], -1 if p[1] is None else p[1]))
+
+
+def _upsert(old, new):
+    """old + new with new winning on GAMELOG_KEY (+ Date, for rows stored before GameId existed)."""
+    both = pd.concat([old, new], ignore_index=True)
+    both = enforce_schema(both, {c: t for c, t in GAMELOG_SCHEMA.items() if c in both.columns})
+    key = [c for c in GAMELOG_KEY + ("Date",) if c in both.columns]
+    both = both.drop_duplicates(key, keep="last")
+    if "GameId" in both.columns:
+        # A re-scraped game replaces the same player's legacy row from that day
+        legacy = both["GameId"].isna()
+        if legacy.any() and not legacy.all():
+            dated = pd.MultiIndex.from_frame(both[[c for c in key if c != "GameId"]].astype("string"))
+            both = both[~(legacy.to_numpy() & dated.isin(dated[~legacy.to_numpy()]))]
+    return both.reset_index(drop=True)
+
+
+def write_gamelog(df, root=STORE_PATH):
+    """
+    Upsert gamelog rows into the store, one partition rewrite per (season, week) touched.
+
+    Parameters:
+    - df (pd.DataFrame): Gamelog rows (typed or straight from a CSV).
+    - root (str): Store folder.
+
+    Returns:
+    - int: Number of partitions written.
+    """
+    if df.empty:
+        return 0
+    df = enforce_schema(df)
+    seasons = season_of(df["Date"])
+    weeks = df["weeknum"] if "weeknum" in df.columns else pd.Series(pd.NA, index=df.index)
+    written = 0
+    for (season, week), rows in df.groupby([seasons, weeks], dropna=False, sort=True):
+        folder = _partition_dir(root, season, week)
+        path = os.path.join(folder, PART_FILE)
+        os.makedirs(folder, exist_ok=True)
+        if os.path.exists(path):
+            rows = _upsert(pd.read_parquet(path), rows)
+        rows.to_parquet(path + ".tmp", index=False)
+        os.replace(path + ".tmp", path)  # readers never see a half-written partition
+        written += 1
+    os.utime(root)  # the store's last write, compared against the CSV in load_gamelog()
+    return written
+
+
+def read_store(root=STORE_PATH, columns=None, seasons=None, weeks=None, since=None):
+    """
+    Read the store, opening only the partitions and columns asked for.
+
+    Parameters:
+    - root (str): Store folder.
+    - columns (list, optional): Only decode these columns ("season" adds the partition's season).
+    - seasons (list, optional): Only these seasons.
+    - weeks (list, optional): Only these weeknums.
+    - since (Timestamp, optional): Only games on or after this date (earlier seasons aren't opened).
+
+    Returns:
+    - pd.DataFrame: Typed gamelog rows, oldest partition first.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    first = None if since is None else int(season_of(pd.Series([pd.Timestamp(since)])).iloc[0])
+    parts = [p for p in list_partitions(root)
+             if (seasons is None or p[0] in seasons) and (weeks is None or p[1] in weeks)
+             and (first is None or p[0] >= first)]
+    if not parts:
+        return pd.DataFrame(columns=columns) if columns else pd.DataFrame()
+
+    files = [p[2] for p in parts]
+    schemas = [pq.read_schema(f) for f in files]
+    # Partitions written before a column existed just read it as missing
+    schema = pa.unify_schemas(schemas).with_metadata(schemas[-1].metadata)
+    names = schema.names if columns is None else [c for c in columns if c in schema.names]
+    if since is not None and "Date" not in names:
+        names = names + ["Date"]
+    table = ds.dataset(files, schema=schema, format="parquet").to_table(columns=names)
+    out = table.to_pandas()
+    if columns is not None and "season" in columns:
+        out["season"] = pd.array([p[0] for p in parts], dtype="Int16").repeat(
+            [pq.ParquetFile(f).metadata.num_rows for f in files])
+    if since is not None:
+        out = out[(out["Date"] >= pd.Timestamp(since)).to_numpy()].reset_index(drop=True)
+        if columns is not None and "Date" not in columns:
+            out = out.drop(columns="Date")
+    return enforce_schema(out, {c: t for c, t in GAMELOG_SCHEMA.items() if c in out.columns}, label=root)
+
+
+def store_is_current(root=STORE_PATH, csv_path=GAMELOG_CSV):
+    """True when the store exists and was written after the CSV last changed."""
+    if not list_partitions(root):
+        return False
+    return not os.path.exists(csv_path) or os.path.getmtime(root) >= os.path.getmtime(csv_path)
+
+
+def load_gamelog(columns=None, seasons=None, weeks=None, root=STORE_PATH, csv_path=GAMELOG_CSV, since=None):
+    """
+    Typed gamelog from the store when it is current, else from the CSV (same filters either way).
+
+    Parameters:
+    - columns (list, optional): Only these columns.
+    - seasons (list, optional): Only these seasons.
+    - weeks (list, optional): Only these weeknums.
+    - since (Timestamp, optional): Only games on or after this date.
+
+    Returns:
+    - pd.DataFrame
+    """
+    if store_is_current(root, csv_path):
+        return read_store(root, columns, seasons, weeks, since)
+    wanted = None if columns is None else list(dict.fromkeys([c for c in columns if c != "season"] +
+                                                             (["Date"] if seasons or since is not None
+                                                              or "season" in columns else []) +
+                                                             (["weeknum"] if weeks else [])))
+    df = read_gamelog(csv_path, columns=wanted)
+    if seasons is not None:
+        df = df[season_of(df["Date"]).isin(seasons).to_numpy()]
+    if weeks is not None:
+        df = df[df["weeknum"].isin(weeks).to_numpy()]
+    if since is not None:
+        df = df[(df["Date"] >= pd.Timestamp(since)).to_numpy()]
+    if columns is not None:
+        if "season" in columns:
+            df = df.assign(season=season_of(df["Date"]))
+        df = df[[c for c in columns if c in df.columns]]
+    return df.reset_index(drop=True)
+
+
+def migrate(csv_paths, root=STORE_PATH, replace=False):
+    """
+    Load gamelog CSVs into the store (later files win on the same key).
+
+    Parameters:
+    - csv_paths (list): Gamelog CSVs, oldest first.
+    - root (str): Store folder.
+    - replace (bool): Delete the existing store first.
+
+    Returns:
+    - int: Rows read from the CSVs.
+    """
+    if replace and os.path.isdir(root):
+        shutil.rmtree(root)
+    rows = 0
+    for path in csv_paths:
+        df = read_gamelog(path)
+        write_gamelog(df, root)
+        rows += len(df)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partitioned Parquet gamelog store.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    mig = sub.add_parser("migrate", help="Load gamelog CSVs into the store")
+    mig.add_argument("csv", nargs="*", default=[GAMELOG_CSV])
+    mig.add_argument("--store", default=STORE_PATH)
+    mig.add_argument("--replace", action="store_true", help="Rebuild the store from scratch")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    rows = migrate(args.csv, args.store, args.replace)
+    parts = list_partitions(args.store)
+    stored = sum(len(pd.read_parquet(p[2], columns=["Name"])) for p in parts)
+    print(f"✅ {rows} CSV row(s) -> {stored} stored row(s) in {len(parts)} partition(s) "
+          f"under {args.store} ({time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
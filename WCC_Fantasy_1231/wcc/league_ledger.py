@@ -0,0 +1,245 @@
+"""
+League event log and standings snapshots: standings as of any week.
+
+The event log is append-only and made of two files:
+
+    data/roster_transactions.csv   draft (from data/draft_results.csv), add, drop, trade   (wcc/rosters_ledger.py)
+    data/scoring_changes.csv       date, rules   (games from that date on are scored with that rules TOML)
+
+Standings for week N are every game through week N, credited to the userteam that
+rostered the player that day and scored with the rules in effect that day. Games
+before the first scoring change keep the FantasyPts they were scraped with.
+
+Replaying the season for every request would re-read the whole gamelog, so the
+cumulative standings after each finished week are saved as snapshots:
+
+    data/fantasy/standings_snapshots.csv   weeknum, events, userteam, FantasyPts, GP
+
+standings_as_of(N) starts from the latest snapshot at or before week N and replays
+only the weeks after it (those partitions are all that is read). Each snapshot keeps
+a digest of the events dated up to its week's end. A backdated add or rule change
+changes the digest, so the stale snapshots are skipped and retaken on the next
+`snapshot`. A backfill of old games is not detected: run `snapshot --rebuild`.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 wcc/league_ledger.py rules wcc/rules/bonus_example.toml --date 2026-01-11
+    python3 wcc/league_ledger.py snapshot
+    python3 wcc/league_ledger.py standings --week 1
+"""
+import argparse
+import hashlib
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.gamelog_store import load_gamelog
+from wcc.players import ROSTER_PATH, load_players, with_player_ids
+from wcc.rosters_ledger import FREE_AGENT, credit, load_ledger
+from wcc.scoring import load_rules
+from wcc.weeks import week_end
+
+SCORING_PATH = "data/scoring_changes.csv"
+SNAPSHOTS_PATH = "data/fantasy/standings_snapshots.csv"
+SNAPSHOT_COLUMNS = ["weeknum", "events", "userteam", "FantasyPts", "GP"]
+GAMELOG_COLUMNS = ["Name", "Team", "Date", "weeknum", "PlayerId", "FantasyPts"]
+
+
+# --- events ---
+
+def scoring_changes(path=SCORING_PATH):
+    """Scoring rule changes (date, rules), oldest first."""
+    if not os.path.exists(path):
+        return pd.DataFrame({"date": pd.Series(dtype="datetime64[ns]"), "rules": pd.Series(dtype=object)})
+    changes = pd.read_csv(path, dtype={"rules": object}, parse_dates=["date"])
+    changes["date"] = changes["date"].astype("datetime64[ns]")
+    return changes.sort_values("date", kind="stable", ignore_index=True)
+
+
+def record_rules(rules, date=None, path=SCORING_PATH):
+    """Append a scoring rule change: games from date (default today) on are scored with the rules TOML."""
+    load_rules(rules)  # fail now on a bad file, not when standings are replayed
+    row = {"date": pd.Timestamp(date or "today").strftime("%Y-%m-%d"), "rules": rules}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    new_file = not os.path.exists(path)
+    pd.DataFrame([row]).to_csv(path, index=False, mode="w" if new_file else "a", header=new_file)
+    return row
+
+
+def league_events(ledger=None, changes=None):
+    """The whole event log in the order it applies: date, event, Player, player_id, userteam, rules."""
+    ledger = load_ledger() if ledger is None else ledger
+    changes = scoring_changes() if changes is None else changes
+    events = pd.concat([ledger.rename(columns={"action": "event"}),
+                        changes.assign(event="scoring")], ignore_index=True)
+    return events[["date", "event", "Player", "player_id", "userteam", "rules"]].sort_values(
+        "date", kind="stable", ignore_index=True)
+
+
+def events_digest(events, weeknum):
+    """Digest of the events dated up to the end of weeknum (what a snapshot of that week depends on)."""
+    through = events[events["date"] <= week_end(weeknum)]
+    return hashlib.sha1(through.to_csv(index=False).encode("utf-8")).hexdigest()[:16]
+
+
+# --- replay ---
+
+def _positions(players):
+    """player_id -> Pos. from the roster (for [positions] multipliers)."""
+    roster = pd.read_csv(ROSTER_PATH)
+    return dict(zip(players.ids(roster["Full Name"], roster["FullTeamName"], create=False), roster["Pos."]))
+
+
+def score_games(gamelog, changes, players=None):
+    """
+    FantasyPts of every row under the rules in effect on its Date.
+
+    Parameters:
+    - gamelog (pd.DataFrame): Rows with Date, PlayerId and the stat columns.
+    - changes (pd.DataFrame): From scoring_changes().
+    - players (Players, optional): Player dimension (for position multipliers).
+
+    Returns:
+    - pd.Series: Points aligned to gamelog (as scraped before the first change).
+    """
+    points = gamelog["FantasyPts"].astype("float64")
+    if changes.empty or gamelog.empty:
+        return points
+    dates = pd.to_datetime(gamelog["Date"]).astype("datetime64[ns]")
+    # Index of the change in effect for each row (-1: none yet), one vectorized search
+    in_effect = changes["date"].searchsorted(dates, side="right") - 1
+    positions = None
+    for i in sorted(set(in_effect) - {-1}):
+        rules = load_rules(changes["rules"].iloc[i])
+        rows = gamelog[in_effect == i]
+        if rules.positions and positions is None:
+            positions = _positions(players or load_players())
+        pos = rows["PlayerId"].map(positions) if rules.positions else None
+        points[in_effect == i] = rules.score(rows, positions=pos).to_numpy()
+    return points
+
+
+def week_points(gamelog, ledger, changes, players=None):
+    """Per (weeknum, userteam) FantasyPts and GP of gamelog rows (FreeAgent and weekless rows left out)."""
+    userteam = credit(gamelog, ledger)
+    rows = pd.DataFrame({"weeknum": gamelog["weeknum"].astype("Int64").to_numpy(), "userteam": userteam.to_numpy(),
+                         "FantasyPts": score_games(gamelog, changes, players).to_numpy()})
+    rows = rows[(rows["userteam"] != FREE_AGENT).to_numpy() & rows["weeknum"].notna().to_numpy()]
+    return (rows.groupby(["weeknum", "userteam"])["FantasyPts"].agg(FantasyPts="sum", GP="count")
+            .reset_index().astype({"weeknum": "int64", "GP": "int64"}))
+
+
+# --- snapshots ---
+
+def load_snapshots(path=SNAPSHOTS_PATH):
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=SNAPSHOT_COLUMNS).astype({"weeknum": "int64", "FantasyPts": "float64",
+                                                             "GP": "int64"})
+    return pd.read_csv(path, dtype={"events": str, "userteam": str})
+
+
+def _latest_valid(snapshots, events, week):
+    """(weeknum, standings) of the newest snapshot at or before week whose events still match, or (None, None)."""
+    for weeknum in sorted(snapshots["weeknum"].unique(), reverse=True):
+        if weeknum > week:
+            continue
+        snap = snapshots[snapshots["weeknum"] == weeknum]
+        if snap["events"].iloc[0] == events_digest(events, weeknum):
+            return int(weeknum), snap[["userteam", "FantasyPts", "GP"]]
+    return None, None
+
+
+def _accumulate(base, weekly):
+    """base standings plus the per-week rows in weekly, as cumulative standings."""
+    parts = [weekly[["userteam", "FantasyPts", "GP"]]] + ([base] if base is not None else [])
+    return pd.concat(parts, ignore_index=True).groupby("userteam", as_index=False)[["FantasyPts", "GP"]].sum()
+
+
+def standings_as_of(week, ledger=None, changes=None, snapshots=None, players=None):
+    """
+    Cumulative standings through week (newest valid snapshot plus a replay of the weeks after it).
+
+    Parameters:
+    - week (int): Last week counted.
+    - ledger, changes, snapshots (pd.DataFrame, optional): Loaded from disk by default.
+    - players (Players, optional): Player dimension.
+
+    Returns:
+    - pd.DataFrame: userteam, FantasyPts, GP, FP/G, best first.
+    """
+    ledger = load_ledger() if ledger is None else ledger
+    changes = scoring_changes() if changes is None else changes
+    snapshots = load_snapshots() if snapshots is None else snapshots
+    start, base = _latest_valid(snapshots, league_events(ledger, changes), week)
+    weeks = list(range(0 if start is None else start + 1, int(week) + 1))
+    weekly = week_points(_read_weeks(weeks, players), ledger, changes, players) if weeks else None
+    standings = _accumulate(base, weekly) if weekly is not None else base.reset_index(drop=True)
+    standings["FP/G"] = (standings["FantasyPts"] / standings["GP"]).where(standings["GP"] > 0, 0.0)
+    return standings.sort_values("FantasyPts", ascending=False, ignore_index=True)
+
+
+def _read_weeks(weeks, players=None):
+    """Gamelog rows of those weeks, with the stats the scoring rules read."""
+    return with_player_ids(load_gamelog(weeks=weeks), players, create=False)
+
+
+def take_snapshots(rebuild=False, path=SNAPSHOTS_PATH, players=None):
+    """
+    Snapshot the standings after every finished week that has no valid snapshot yet.
+
+    A week is finished once the gamelog has games dated after its last day.
+
+    Returns:
+    - list: Weeknums snapshotted.
+    """
+    ledger, changes = load_ledger(), scoring_changes()
+    events = league_events(ledger, changes)
+    snapshots = pd.DataFrame(columns=SNAPSHOT_COLUMNS) if rebuild else load_snapshots(path)
+    dates = load_gamelog(columns=["Date", "weeknum"])
+    finished = sorted(int(w) for w in dates["weeknum"].dropna().unique() if week_end(w) < dates["Date"].max())
+    if not finished:
+        return []
+    start, base = _latest_valid(snapshots, events, finished[-1])
+    todo = [w for w in finished if start is None or w > start]
+    if not todo:
+        return []
+    weekly = week_points(_read_weeks(todo, players), ledger, changes, players)
+    keep = snapshots[snapshots["weeknum"] <= (start if start is not None else -1)]
+    taken = []
+    for weeknum in todo:
+        base = _accumulate(base, weekly[weekly["weeknum"] == weeknum])
+        taken.append(base.assign(weeknum=weeknum, events=events_digest(events, weeknum)))
+    out = pd.concat([keep] + taken, ignore_index=True)[SNAPSHOT_COLUMNS]
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    out.to_csv(path + ".tmp", index=False)
+    os.replace(path + ".tmp", path)
+    return todo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="League event log and standings snapshots.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rules = sub.add_parser("rules", help="Record a scoring rule change")
+    rules.add_argument("rules", help="Rules TOML, e.g. wcc/rules/default.toml")
+    rules.add_argument("--date", help="First game date it applies to (YYYY-MM-DD), default today")
+    snap = sub.add_parser("snapshot", help="Snapshot the standings of finished weeks")
+    snap.add_argument("--rebuild", action="store_true", help="Drop every snapshot and replay the season")
+    show = sub.add_parser("standings", help="Print the standings as of a week")
+    show.add_argument("--week", type=int, required=True)
+    args = parser.parse_args()
+
+    if args.command == "rules":
+        row = record_rules(args.rules, args.date)
+        print(f"✅ {row['date']}: scoring -> {row['rules']} ({SCORING_PATH}). Retake snapshots: "
+              "python3 wcc/league_ledger.py snapshot")
+    elif args.command == "snapshot":
+        weeks = take_snapshots(rebuild=args.rebuild)
+        print(f"📸 {len(weeks)} week(s) snapshotted{': ' + ', '.join(map(str, weeks)) if weeks else ''} -> {SNAPSHOTS_PATH}")
+    else:
+        print(standings_as_of(args.week).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
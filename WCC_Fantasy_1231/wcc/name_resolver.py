@@ -0,0 +1,249 @@
+"""
+Fuzzy name resolution: find gamelog players that should be a roster player.
+
+A gamelog row only counts for a roster player when its (clean_name, team) is one of
+that player's aliases (wcc/players.py). ESPN spellings ("Mourio" for "Mouriño"),
+nicknames, "Jr." and team typos miss, and their games silently drop out of
+fantasy_stats. This module finds them:
+
+- Roster players are indexed under two blocking keys: team + last-name initial,
+  and the Soundex code of the last name (catches misspelled or changed teams).
+- Each gamelog player without a roster id is looked up under its own keys, so it is
+  only compared with the few players in those blocks, never the whole universe.
+- Candidates are ranked by edit distance on the name (and on the team).
+
+`report` writes the candidates to a CSV for review (confident matches are pre-accepted);
+`accept` persists the accepted rows as aliases, so later ingests resolve them with a
+plain lookup, re-stamps PlayerId in the gamelog CSV and rebuilds the stat cube
+(wcc/season_agg.py, keyed on PlayerId) so the matched games count right away.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 wcc/name_resolver.py report
+    python3 wcc/name_resolver.py accept
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Scraper"))  # sinks.py
+from sinks import UpsertCsvSink
+from wcc.gamelog_store import GAMELOG_CSV
+from wcc.players import GAMELOG_PATH, clean_name, load_players, with_player_ids
+from wcc.schema import read_gamelog
+from wcc.season_agg import STATE_PATH, rebuild
+
+REPORT_PATH = "data/name_matches.csv"
+REPORT_COLUMNS = ["name", "team", "player_id", "games", "candidate", "candidate_team", "candidate_id",
+                  "name_score", "team_score", "score", "status", "accept"]
+
+AUTO_SCORE = 0.95    # name and team both at least this similar: pre-accepted
+REVIEW_SCORE = 0.85  # overall score needed to show up in the report at all
+TOP_N = 3            # candidates kept per unmatched player
+
+SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+SOUNDEX_CODES = {**dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"), **dict.fromkeys("dt", "3"),
+                 "l": "4", **dict.fromkeys("mn", "5"), "r": "6"}
+
+
+# --- name keys ---
+
+def name_tokens(name):
+    """clean_name split into tokens, punctuation and generational suffixes dropped."""
+    tokens = re.sub(r"[^a-z ]", " ", clean_name(name).replace("'", "")).split()
+    return [t for t in tokens if t not in SUFFIXES]
+
+
+def soundex(word):
+    """American Soundex code of a word ("" for an empty word)."""
+    if not word:
+        return ""
+    code = word[0].upper()
+    last = SOUNDEX_CODES.get(word[0], "")
+    for ch in word[1:]:
+        digit = SOUNDEX_CODES.get(ch, "")
+        if digit and digit != last:
+            code += digit
+        if ch not in "hw":  # h and w don't separate letters with the same code
+            last = digit
+    return (code + "000")[:4]
+
+
+def blocking_keys(name, team):
+    """Keys a player is indexed and looked up under."""
+    tokens = name_tokens(name)
+    if not tokens:
+        return []
+    last = tokens[-1]
+    return [("team", (team or "").lower(), last[0]), ("sound", soundex(last))]
+
+
+def edit_distance(a, b):
+    """Levenshtein distance between two strings."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def similarity(a, b):
+    """1 - edit distance / longer length (1.0 = identical)."""
+    if not a and not b:
+        return 1.0
+    return 1 - edit_distance(a, b) / max(len(a), len(b))
+
+
+# --- index ---
+
+class NameIndex:
+    """Blocking index over candidate players (by default the roster)."""
+
+    def __init__(self, players):
+        """players: DataFrame with player_id, name, team."""
+        self.blocks = {}
+        self.players = {}
+        for pid, name, team in zip(players["player_id"], players["name"], players["team"]):
+            self.players[int(pid)] = (name, team, " ".join(name_tokens(name)))
+            for key in blocking_keys(name, team):
+                self.blocks.setdefault(key, []).append(int(pid))
+
+    def candidates(self, name, team, top=TOP_N):
+        """
+        Best-scoring indexed players for a name.
+
+        Parameters:
+        - name (str): Name as spelled in the gamelog.
+        - team (str): Its team in the gamelog.
+        - top (int): How many candidates to return.
+
+        Returns:
+        - list: (player_id, name_score, team_score, score) tuples, best first.
+        """
+        key = " ".join(name_tokens(name))
+        ids = {pid for block in blocking_keys(name, team) for pid in self.blocks.get(block, ())}
+        scored = []
+        for pid in ids:
+            _, cand_team, cand_key = self.players[pid]
+            name_score = similarity(key, cand_key)
+            team_score = similarity((team or "").lower(), (cand_team or "").lower())
+            scored.append((pid, name_score, team_score, 0.75 * name_score + 0.25 * team_score))
+        return sorted(scored, key=lambda s: -s[3])[:top]
+
+
+# --- report / accept ---
+
+def unmatched_players(gamelog, roster_ids):
+    """Gamelog (Name, Team, PlayerId) groups whose id isn't a roster player, with their game counts."""
+    rows = gamelog[~gamelog["PlayerId"].isin(roster_ids)]
+    return (rows.groupby(["Name", "Team", "PlayerId"], observed=True).size()
+            .reset_index(name="games").sort_values("games", ascending=False))
+
+
+def match_report(gamelog, players=None, min_score=REVIEW_SCORE, auto_score=AUTO_SCORE):
+    """
+    Candidate roster matches for every gamelog player that has no roster id.
+
+    Parameters:
+    - gamelog (pd.DataFrame): Gamelog with Name and Team (PlayerId is filled in if missing).
+    - players (Players, optional): Player dimension. Defaults to load_players().
+    - min_score (float): Drop candidates scoring below this.
+    - auto_score (float): Pre-accept the best candidate when both name and team are this similar.
+
+    Returns:
+    - pd.DataFrame: REPORT_COLUMNS, best candidate first per player.
+    """
+    players = players or load_players()
+    gamelog = with_player_ids(gamelog, players, create=False)
+    roster = players.players[players.players["source"] == "roster"]
+    index = NameIndex(roster)
+    rows = []
+    for name, team, pid, games in unmatched_players(gamelog, set(roster["player_id"])).itertuples(index=False):
+        for rank, (cid, name_score, team_score, score) in enumerate(index.candidates(name, team)):
+            if score < min_score:
+                continue
+            auto = rank == 0 and name_score >= auto_score and team_score >= auto_score
+            cand_name, cand_team, _ = index.players[cid]
+            rows.append({"name": name, "team": team, "player_id": pid, "games": games,
+                         "candidate": cand_name, "candidate_team": cand_team, "candidate_id": cid,
+                         "name_score": round(name_score, 3), "team_score": round(team_score, 3),
+                         "score": round(score, 3), "status": "auto" if auto else "review",
+                         "accept": "y" if auto else ""})
+    return pd.DataFrame(rows, columns=REPORT_COLUMNS)
+
+
+def accept_matches(report, players=None, gamelog_paths=(GAMELOG_PATH,)):
+    """
+    Persist the accepted report rows as aliases and re-stamp PlayerId in the gamelog CSVs.
+
+    Re-stamping the league gamelog also rebuilds the stat cube (when it exists), which
+    still has the matched games under their old ids.
+
+    Parameters:
+    - report (pd.DataFrame): A match report with its accept column filled in (y / yes / 1 / true).
+    - players (Players, optional): Player dimension. Defaults to load_players().
+    - gamelog_paths (list): Gamelog CSVs to re-stamp.
+
+    Returns:
+    - dict: Old player_id -> roster player_id for every accepted row.
+    """
+    players = players or load_players()
+    accepted = report[report["accept"].astype("string").str.strip().str.lower().isin(["y", "yes", "1", "true"])]
+    accepted = accepted.drop_duplicates("player_id")  # one target per gamelog player
+    remap = {}
+    for row in accepted.itertuples(index=False):
+        players.add_alias(row.name, row.team, row.candidate_id, source="resolver")
+        remap[int(row.player_id)] = int(row.candidate_id)
+    if remap:
+        for path in gamelog_paths:
+            df = read_gamelog(path)
+            df["PlayerId"] = df["PlayerId"].replace(remap).astype("Int32")
+            UpsertCsvSink(path).rewrite(df)
+        league = os.path.normpath(GAMELOG_CSV) in {os.path.normpath(p) for p in gamelog_paths}
+        if league and os.path.exists(STATE_PATH):
+            rebuild(players=players).save()
+            print(f"🧊 Stat cube rebuilt ({STATE_PATH})")
+    return remap
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzzy name resolution for unmatched gamelog players.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rep = sub.add_parser("report", help="Write candidate roster matches for review")
+    rep.add_argument("--gamelog", default=GAMELOG_PATH)
+    rep.add_argument("--out", default=REPORT_PATH)
+    rep.add_argument("--min-score", type=float, default=REVIEW_SCORE)
+    acc = sub.add_parser("accept", help="Save accepted matches as aliases and re-stamp the gamelog")
+    acc.add_argument("--report", default=REPORT_PATH)
+    acc.add_argument("--gamelog", nargs="*", default=[GAMELOG_PATH])
+    args = parser.parse_args()
+
+    if args.command == "report":
+        t0 = time.perf_counter()
+        report = match_report(read_gamelog(args.gamelog), min_score=args.min_score)
+        report.to_csv(args.out, index=False)
+        auto = int((report["status"] == "auto").sum())
+        print(f"📝 {report['player_id'].nunique()} unmatched player(s) with candidates: {auto} auto, "
+              f"{len(report) - auto} to review ({time.perf_counter() - t0:.2f}s) -> {args.out}")
+        if len(report):
+            print(report[["name", "team", "games", "candidate", "candidate_team", "score", "status"]].to_string(index=False))
+        print("Set accept=y on the rows to keep, then run: python3 wcc/name_resolver.py accept")
+    else:
+        remap = accept_matches(pd.read_csv(args.report, keep_default_na=False), gamelog_paths=args.gamelog)
+        print(f"✅ {len(remap)} alias(es) saved; PlayerId re-stamped in {', '.join(args.gamelog)}")
+        if remap:
+            print("Re-run web_app/update_fantasy_stats.py (and `wcc/db.py import` / "
+                  "`wcc/gamelog_store.py migrate --replace` if you use them).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Batch search for scoring weights that balance positions.
+
+Every candidate weight vector is scored at once: per-player stat means are one
+(players x stats) matrix and the candidates one (stats x candidates) matrix, so a
+single product gives every player's FP/G under every candidate. For each candidate
+it reports:
+
+- G/F/C share of the top-N players by FP/G, and the imbalance vs the pool's own
+  position mix (total variation distance, 0 = top-N looks like the pool)
+- noise: average game-to-game FP variance within a player / variance of FP/G
+  across players (lower = scores say more about the player, less about the night)
+- stability: Spearman correlation of the FP/G ranking from odd vs even games
+- churn: Spearman correlation with today's ranking (1 = same leaderboard)
+
+and returns the Pareto-best candidates (min imbalance, min noise, max stability).
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 wcc/optimize_weights.py
+    python3 wcc/optimize_weights.py --stats STL BLK PTS TO 3PM --steps -1 -0.5 0 0.5 1 --top 100
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.players import load_players, with_player_ids
+from wcc.schema import STAT_COLUMNS, read_gamelog
+from wcc.scoring import DEFAULT_RULES, load_rules, stat_matrix
+
+GAMELOG_PATH = "Gamelog/gamelog.csv"
+ROSTER_PATH = "data/wcc_concat_updated.csv"
+POSITIONS = ("G", "F", "C")
+
+
+def player_pool(gamelog, roster, stats, min_games=3, players=None):
+    """
+    Per-player stat matrices for rostered players with at least min_games games.
+
+    Gamelog rows are matched to the roster on PlayerId (wcc/players.py).
+
+    Returns:
+    - dict: ids, names, pos (primary position per player), gp, mean / odd / even (players x stats
+      FP-input means over all / odd / even games), second (players x stats x stats mean of x x^T).
+    """
+    players = players or load_players()
+    roster = roster.assign(player_id=players.ids(roster["Full Name"], roster["FullTeamName"], create=False))
+    roster = roster.dropna(subset=["player_id"]).drop_duplicates("player_id")
+    ids = roster["player_id"].astype("int64")
+    pos_map = dict(zip(ids, roster["Pos."].astype(str).str.split("/").str[0]))
+    name_map = dict(zip(ids, roster["Full Name"]))
+    gamelog = with_player_ids(gamelog, players, create=False)
+    gamelog = gamelog[gamelog["PlayerId"].isin(pos_map).to_numpy()]
+    player_ids = gamelog["PlayerId"].astype("int64")
+    gamelog = gamelog[(player_ids.groupby(player_ids).transform("size") >= min_games).to_numpy()]
+    player_ids = gamelog["PlayerId"].astype("int64")
+
+    codes, uniques = pd.factorize(player_ids)
+    X = stat_matrix(gamelog, stats)
+    n_players = len(uniques)
+    gp = np.bincount(codes, minlength=n_players).astype(float)
+
+    def means(mask):
+        sums = np.zeros((n_players, len(stats)))
+        np.add.at(sums, codes[mask], X[mask])
+        counts = np.bincount(codes[mask], minlength=n_players)[:, None]
+        return sums / np.maximum(counts, 1)
+
+    game_no = player_ids.groupby(player_ids).cumcount().to_numpy()
+    second = np.zeros((n_players, len(stats), len(stats)))
+    np.add.at(second, codes, X[:, :, None] * X[:, None, :])
+    return {
+        "ids": np.asarray(uniques),
+        "names": np.array([name_map[i] for i in uniques]),
+        "pos": np.array([pos_map[i] for i in uniques]),
+        "gp": gp,
+        "mean": means(np.ones(len(codes), dtype=bool)),
+        "odd": means(game_no % 2 == 1),
+        "even": means(game_no % 2 == 0),
+        "second": second / gp[:, None, None],
+    }
+
+
+def candidate_grid(base, search_stats, steps):
+    """(stats x candidates) weight matrix: base weights with every combination of steps added to search_stats."""
+    stats = list(base)
+    deltas = np.array(list(itertools.product(steps, repeat=len(search_stats))))
+    W = np.tile(np.array([base[s] for s in stats], dtype=float)[:, None], (1, len(deltas)))
+    for j, stat in enumerate(search_stats):
+        W[stats.index(stat)] += deltas[:, j]
+    return W
+
+
+def _ranks(A):
+    """Column-wise ranks (0 = lowest) of a (players x candidates) matrix."""
+    return np.argsort(np.argsort(A, axis=0), axis=0).astype(float)
+
+
+def _column_corr(A, B):
+    A = A - A.mean(axis=0)
+    B = B - B.mean(axis=0)
+    return (A * B).sum(axis=0) / np.sqrt((A * A).sum(axis=0) * (B * B).sum(axis=0))
+
+
+def evaluate(pool, W, top_n=50, base=None):
+    """
+    Metrics for every candidate column of W.
+
+    Returns:
+    - pd.DataFrame: one row per candidate with G/F/C top-N shares, imbalance, noise, stability, churn.
+    """
+    fpg = pool["mean"] @ W                                  # (players x candidates) FP/G
+    top_n = min(top_n, len(fpg))
+    top = np.argpartition(-fpg, top_n - 1, axis=0)[:top_n]  # (top_n x candidates) player indices
+    top_pos = pool["pos"][top]
+
+    pool_share = {p: float((pool["pos"] == p).mean()) for p in POSITIONS}
+    metrics = {f"top_{p}": (top_pos == p).mean(axis=0) for p in POSITIONS}
+    metrics["imbalance"] = 0.5 * sum(np.abs(metrics[f"top_{p}"] - pool_share[p]) for p in POSITIONS)
+
+    # E[fp^2] per player and candidate from the second moments, without scoring every game
+    second = np.einsum("pij,ic,jc->pc", pool["second"], W, W)
+    within = np.maximum(second - fpg ** 2, 0).mean(axis=0)
+    metrics["noise"] = within / fpg.var(axis=0)
+
+    metrics["stability"] = _column_corr(_ranks(pool["odd"] @ W), _ranks(pool["even"] @ W))
+    if base is not None:
+        metrics["churn"] = _column_corr(_ranks(fpg), _ranks(pool["mean"] @ base[:, None]))
+    return pd.DataFrame(metrics)
+
+
+def pareto_front(metrics, minimize=("imbalance", "noise"), maximize=("stability",)):
+    """Boolean mask of candidates no other candidate beats on every objective."""
+    objectives = np.column_stack([metrics[c].to_numpy() for c in minimize] +
+                                 [-metrics[c].to_numpy() for c in maximize])
+    order = np.lexsort(objectives.T[::-1])
+    front = []
+    for i in order:
+        if front:
+            F = objectives[front]
+            if ((F <= objectives[i]).all(axis=1) & (F < objectives[i]).any(axis=1)).any():
+                continue
+        front.append(i)
+    mask = np.zeros(len(objectives), dtype=bool)
+    mask[front] = True
+    return mask
+
+
+def optimize(gamelog, roster, base_weights, search_stats, steps, top_n=50, min_games=3, players=None):
+    """
+    Score every candidate and return the Pareto-best ones.
+
+    Parameters:
+    - gamelog (pd.DataFrame): Gamelog rows.
+    - roster (pd.DataFrame): Roster with Full Name, FullTeamName and Pos.
+    - base_weights (dict): Current stat -> points weights.
+    - search_stats (list): Stats whose weight is varied (a stat without a weight starts at 0).
+    - steps (list): Offsets tried for each searched stat (every combination).
+    - top_n (int): Size of the leaderboard the position shares are measured on.
+    - min_games (int): Players with fewer games are left out.
+    - players (Players, optional): Player dimension. Defaults to load_players().
+
+    Returns:
+    - (pd.DataFrame, pd.DataFrame): (Pareto-best candidates, all candidates), each with the
+      searched weights and the metrics, best imbalance first.
+    """
+    base_weights = {**base_weights, **{s: 0.0 for s in search_stats if s not in base_weights}}
+    stats = list(base_weights)
+    pool = player_pool(gamelog, roster, stats, min_games, players)
+    W = candidate_grid(base_weights, search_stats, steps)
+    base = np.array([base_weights[s] for s in stats], dtype=float)
+    metrics = evaluate(pool, W, top_n, base)
+    weights = pd.DataFrame(W.T, columns=stats)[list(search_stats)]
+    table = pd.concat([weights, metrics], axis=1)
+    best = table[pareto_front(table)].sort_values(["imbalance", "noise"])
+    return best, table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search scoring weights that balance positions.")
+    parser.add_argument("--rules", default=DEFAULT_RULES, help="Rules file with the starting weights")
+    parser.add_argument("--stats", nargs="+", default=["STL", "BLK", "PTS", "TO", "3PM", "AST"],
+                        help="Stats whose weights are searched")
+    parser.add_argument("--steps", nargs="+", type=float, default=[-1, -0.5, 0, 0.5, 1],
+                        help="Offsets tried on each searched weight")
+    parser.add_argument("--top", type=int, default=50, help="Top-N players the position shares are measured on")
+    parser.add_argument("--min-games", type=int, default=3)
+    parser.add_argument("--gamelog", default=GAMELOG_PATH)
+    parser.add_argument("--roster", default=ROSTER_PATH)
+    parser.add_argument("--out", default=None, help="Write every candidate's metrics to this CSV")
+    args = parser.parse_args()
+
+    rules = load_rules(args.rules)
+    unknown = [s for s in args.stats if s not in STAT_COLUMNS and s not in rules.weights]
+    if unknown:
+        parser.error(f"--stats: not a box score stat or a weight in {args.rules}: {', '.join(unknown)}")
+    players = load_players()
+    gamelog = read_gamelog(args.gamelog)
+    roster = pd.read_csv(args.roster)
+
+    t0 = time.perf_counter()
+    best, table = optimize(gamelog, roster, rules.weights, args.stats, args.steps, args.top, args.min_games, players)
+    elapsed = time.perf_counter() - t0
+
+    pool = player_pool(gamelog, roster, list(rules.weights), args.min_games, players)
+    mix = ", ".join(f"{p} {(pool['pos'] == p).mean():.0%}" for p in POSITIONS)
+    print(f"👥 Pool: {len(pool['names'])} rostered player(s) with {args.min_games}+ games ({mix})")
+
+    current = table[(table[args.stats] == pd.Series(rules.weights).reindex(args.stats, fill_value=0.0)).all(axis=1)]
+    pd.set_option("display.width", 200)
+    print(f"⏱️ Evaluated {len(table):,} candidate(s) in {elapsed:.2f}s")
+    print("\nCurrent weights:")
+    print(current.round(3).to_string(index=False))
+    print(f"\n🏆 Pareto-best ({len(best)}):")
+    print(best.head(25).round(3).to_string(index=False))
+
+    pick = best.iloc[0]
+    print("\n# Lowest-imbalance Pareto pick, as [weights] changes:")
+    for stat in args.stats:
+        print(f"{stat} = {pick[stat]:g}")
+    if args.out:
+        table.to_csv(args.out, index=False)
+        print(f"\n💾 Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Player dimension: one stable integer id per player, assigned once at ingest.
+
+    data/players.csv          player_id, name, team, source   (source: roster / espn / manual)
+    data/player_aliases.csv   alias, team, player_id, source  (every spelling seen, as clean_name)
+
+Ids are never renumbered or reused; new players and new spellings are appended.
+A name is matched on (clean_name, team) when the team is known, else on clean_name
+alone when that is unambiguous (a roster player wins over same-named non-roster ones). The gamelog sinks stamp every row's PlayerId, so
+joins and groupbys between the gamelog, rosters and draft results run on that
+integer instead of on name strings.
+
+Build the dimension from the roster and stamp the existing gamelog, run from the
+WCC_Fantasy_1231 folder:
+
+    python3 wcc/players.py sync
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+import unidecode
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.schema import CSV_WRITE_OPTIONS, read_gamelog, write_schema
+
+PLAYERS_PATH = "data/players.csv"
+ALIASES_PATH = "data/player_aliases.csv"
+ROSTER_PATH = "data/wcc_concat_updated.csv"
+GAMELOG_PATH = "Gamelog/gamelog.csv"
+
+PLAYER_COLUMNS = ["player_id", "name", "team", "source"]
+ALIAS_COLUMNS = ["alias", "team", "player_id", "source"]
+
+
+def clean_name(name):
+    """Join key for a player name: accents stripped, lowercased, spaces collapsed ("" for missing)."""
+    if not isinstance(name, str):
+        return ""
+    return " ".join(unidecode.unidecode(name).lower().split())
+
+
+def _read(path, columns):
+    if os.path.exists(path):
+        return pd.read_csv(path, dtype={"player_id": "int32"}, keep_default_na=False)
+    return pd.DataFrame(columns=columns)
+
+
+def _append(path, rows, columns):
+    """Append rows (list of dicts) to a CSV, writing the header when the file is new."""
+    if not rows:
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    new_file = not os.path.exists(path)
+    pd.DataFrame(rows, columns=columns).to_csv(path, index=False, mode="w" if new_file else "a", header=new_file)
+
+
+class Players:
+    """The player dimension. Load with load_players()."""
+
+    def __init__(self, players_path=PLAYERS_PATH, aliases_path=ALIASES_PATH):
+        self.players_path = players_path
+        self.aliases_path = aliases_path
+        self.players = _read(players_path, PLAYER_COLUMNS)
+        aliases = _read(aliases_path, ALIAS_COLUMNS)
+        self._by_team = {(a, t): int(p) for a, t, p in zip(aliases["alias"], aliases["team"], aliases["player_id"])}
+        self._by_alias = {}
+        for (alias, _), pid in self._by_team.items():
+            self._by_alias.setdefault(alias, set()).add(pid)
+        self._roster_ids = set(self.players.loc[self.players["source"] == "roster", "player_id"].astype(int))
+        self.next_id = int(self.players["player_id"].max()) + 1 if len(self.players) else 1
+
+    def __len__(self):
+        return len(self.players)
+
+    def lookup(self, name, team=None):
+        """player_id for a name (and team), or None when unknown or ambiguous."""
+        alias = clean_name(name)
+        if team:
+            return self._by_team.get((alias, team))
+        ids = self._by_alias.get(alias, set())
+        if len(ids) > 1:
+            ids = ids & self._roster_ids
+        return next(iter(ids)) if len(ids) == 1 else None
+
+    def add_alias(self, name, team, player_id, source="manual"):
+        """Record another spelling of an existing player (takes effect at once and is persisted)."""
+        alias = clean_name(name)
+        team = team or ""
+        replaced = self._by_team.get((alias, team))
+        if replaced is not None and replaced != int(player_id):
+            self._by_alias[alias].discard(replaced)
+        self._by_team[(alias, team)] = int(player_id)
+        self._by_alias.setdefault(alias, set()).add(int(player_id))
+        _append(self.aliases_path, [{"alias": alias, "team": team, "player_id": int(player_id), "source": source}],
+                ALIAS_COLUMNS)
+
+    def ids(self, names, teams=None, source="espn", create=True):
+        """
+        player_id for every name (one dictionary lookup per distinct name/team pair).
+
+        Parameters:
+        - names (pd.Series): Player names as written anywhere (ESPN, roster, draft results).
+        - teams (pd.Series, optional): Full team name per row; matching is by name alone without it.
+        - source (str): Recorded for players created here.
+        - create (bool): Give unknown names a new id. Otherwise they come back as <NA>.
+
+        Returns:
+        - pd.Series: Int32 ids aligned to names.
+        """
+        teams = pd.Series("", index=names.index) if teams is None else teams.astype("string").fillna("")
+        pairs = pd.DataFrame({"name": names.astype("string").fillna(""), "team": teams}).drop_duplicates()
+        resolved = {}
+        new_players, new_aliases = [], []
+        for name, team in zip(pairs["name"], pairs["team"]):
+            pid = self.lookup(name, team)
+            if pid is None and create and name.strip():
+                pid = self.next_id
+                self.next_id += 1
+                alias = clean_name(name)
+                new_players.append({"player_id": pid, "name": name.strip(), "team": team, "source": source})
+                new_aliases.append({"alias": alias, "team": team, "player_id": pid, "source": source})
+                self._by_team[(alias, team)] = pid
+                self._by_alias.setdefault(alias, set()).add(pid)
+            resolved[(name, team)] = pid
+        if new_players:
+            _append(self.players_path, new_players, PLAYER_COLUMNS)
+            _append(self.aliases_path, new_aliases, ALIAS_COLUMNS)
+            self.players = pd.concat([self.players, pd.DataFrame(new_players)], ignore_index=True)
+            if source == "roster":
+                self._roster_ids.update(p["player_id"] for p in new_players)
+        keys = pd.MultiIndex.from_arrays([names.astype("string").fillna(""), teams])
+        return pd.Series([resolved[k] for k in keys], index=names.index, dtype="Int32", name="PlayerId")
+
+    def sync_roster(self, roster):
+        """Give every roster player an id (roster spellings and teams are the canonical ones)."""
+        return self.ids(roster["Full Name"], roster["FullTeamName"], source="roster")
+
+
+def load_players(players_path=PLAYERS_PATH, aliases_path=ALIASES_PATH, roster_path=ROSTER_PATH):
+    """The player dimension, seeded from the roster the first time so WCC players get the low ids."""
+    players = Players(players_path, aliases_path)
+    if not len(players) and roster_path and os.path.exists(roster_path):
+        players.sync_roster(pd.read_csv(roster_path))
+    return players
+
+
+_DEFAULT = None
+
+
+def with_player_ids(df, players=None, create=True):
+    """
+    df with PlayerId filled in from Name + Team where it is missing (ids already stamped are kept).
+
+    The gamelog sinks call this on every write (create=True gives new players an id);
+    readers pass create=False so they never add to the dimension.
+    """
+    global _DEFAULT
+    if players is None:
+        if _DEFAULT is None:
+            _DEFAULT = load_players()
+        players = _DEFAULT
+    if "PlayerId" in df.columns and df["PlayerId"].notna().all():
+        return df
+    ids = players.ids(df["Name"], df["Team"] if "Team" in df.columns else None, create=create)
+    if "PlayerId" in df.columns:
+        ids = pd.to_numeric(df["PlayerId"], errors="coerce").astype("Int32").fillna(ids)
+    return df.assign(PlayerId=ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Player dimension.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sync = sub.add_parser("sync", help="Add roster players, then stamp PlayerId on gamelog CSVs")
+    sync.add_argument("gamelog", nargs="*", default=[GAMELOG_PATH])
+    sync.add_argument("--roster", default=ROSTER_PATH)
+    args = parser.parse_args()
+
+    players = load_players(roster_path=None)
+    before = len(players)
+    players.sync_roster(pd.read_csv(args.roster))
+    print(f"👥 Roster: {len(players) - before} new player(s), {len(players)} total")
+    for path in args.gamelog:
+        df = read_gamelog(path)
+        df = with_player_ids(df, players)
+        df.to_csv(path + ".tmp", index=False, **CSV_WRITE_OPTIONS)
+        os.replace(path + ".tmp", path)
+        write_schema(path, df)
+        print(f"✅ {path}: {len(df)} row(s), {df['PlayerId'].nunique()} player(s); {len(players)} in the dimension")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Fantasy roster transactions: which userteam rostered each player from which date.
+
+    data/roster_transactions.csv   date, action, Player, player_id, userteam   (append-only)
+
+action is add, drop or trade (a drop moves the player to FreeAgent). The draft itself
+is not stored: every load starts from data/draft_results.csv, dated DRAFT_DATE, so
+re-saving the draft board never leaves the ledger behind. A transaction counts from
+the start of its date, so that day's games already go to the new team; several on
+one date apply in file order.
+
+credit() gives every gamelog row the userteam that rostered the player on the game's
+date with one merge_asof on (player_id, Date), so the whole season is re-credited in
+a single vectorized pass and an add or drop never rewrites past weeks.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 wcc/rosters_ledger.py add "Ella Brubaker" UserTeam2 --date 2026-01-05
+    python3 wcc/rosters_ledger.py drop "Ella Brubaker" --date 2026-01-12
+    python3 wcc/rosters_ledger.py show --date 2026-01-05
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.players import load_players
+
+LEDGER_PATH = "data/roster_transactions.csv"
+DRAFT_RESULTS_PATH = "data/draft_results.csv"
+DRAFT_DATE = pd.Timestamp("2025-11-01")  # draft picks count from the first game of the season
+
+LEDGER_COLUMNS = ["date", "action", "Player", "player_id", "userteam"]
+ACTIONS = ("draft", "add", "drop", "trade")
+FREE_AGENT = "FreeAgent"
+
+
+def _read(path):
+    if not os.path.exists(path):
+        return pd.DataFrame({c: pd.Series(dtype="string") for c in LEDGER_COLUMNS})
+    return pd.read_csv(path, dtype={c: "string" for c in LEDGER_COLUMNS}, keep_default_na=False)
+
+
+def load_ledger(path=LEDGER_PATH, draft_results_path=DRAFT_RESULTS_PATH, players=None):
+    """
+    The draft followed by every recorded transaction, in the order they apply.
+
+    Parameters:
+    - path (str): Transactions CSV.
+    - draft_results_path (str): Draft results (Team, Player), dated DRAFT_DATE.
+    - players (Players, optional): Player dimension. Defaults to load_players().
+
+    Returns:
+    - pd.DataFrame: LEDGER_COLUMNS with date as datetime64[ns] and player_id Int32.
+    """
+    players = players or load_players()
+    draft = pd.read_csv(draft_results_path) if os.path.exists(draft_results_path) else pd.DataFrame(columns=["Team", "Player"])
+    draft = pd.DataFrame({"date": DRAFT_DATE, "action": "draft", "Player": draft["Player"],
+                          "player_id": players.ids(draft["Player"], create=False), "userteam": draft["Team"]})
+    moves = _read(path)
+    moves = pd.DataFrame({"date": pd.to_datetime(moves["date"]), "action": moves["action"], "Player": moves["Player"],
+                          "player_id": pd.to_numeric(moves["player_id"]).astype("Int32"), "userteam": moves["userteam"]})
+    ledger = pd.concat([draft, moves], ignore_index=True)
+    ledger["date"] = ledger["date"].astype("datetime64[ns]")
+    ledger["player_id"] = ledger["player_id"].astype("Int32")
+    ledger = ledger.dropna(subset=["player_id"])
+    return ledger.sort_values("date", kind="stable", ignore_index=True)  # stable: same-day moves keep file order
+
+
+def record(action, player, userteam=None, date=None, path=LEDGER_PATH, players=None):
+    """
+    Append one transaction to the ledger.
+
+    Parameters:
+    - action (str): add, drop or trade.
+    - player (str): Player name as spelled anywhere (roster, ESPN, draft board).
+    - userteam (str, optional): Team the player goes to (ignored for a drop).
+    - date (str or Timestamp, optional): Effective date. Defaults to today.
+
+    Returns:
+    - dict: The row written.
+    """
+    if action not in ACTIONS[1:]:
+        raise ValueError(f"action must be one of {', '.join(ACTIONS[1:])}, not {action!r}")
+    if action != "drop" and not userteam:
+        raise ValueError(f"{action} needs a userteam")
+    players = players or load_players()
+    player_id = players.lookup(player)
+    if player_id is None:
+        raise ValueError(f"Unknown or ambiguous player: {player!r}")
+    row = {"date": pd.Timestamp(date or "today").strftime("%Y-%m-%d"), "action": action, "Player": player,
+           "player_id": int(player_id), "userteam": FREE_AGENT if action == "drop" else userteam}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    new_file = not os.path.exists(path)
+    pd.DataFrame([row], columns=LEDGER_COLUMNS).to_csv(path, index=False, mode="w" if new_file else "a",
+                                                        header=new_file)
+    return row
+
+
+def rosters_as_of(ledger, date=None):
+    """
+    Fantasy rosters on a date, shaped like draft_results.csv.
+
+    Parameters:
+    - ledger (pd.DataFrame): From load_ledger().
+    - date (str or Timestamp, optional): Defaults to every transaction (today's rosters).
+
+    Returns:
+    - pd.DataFrame: Team, Player, player_id for every rostered player.
+    """
+    if date is not None:
+        ledger = ledger[ledger["date"] <= pd.Timestamp(date)]
+    latest = ledger.drop_duplicates("player_id", keep="last")
+    latest = latest[latest["userteam"] != FREE_AGENT]
+    return latest.rename(columns={"userteam": "Team"})[["Team", "Player", "player_id"]].reset_index(drop=True)
+
+
+def credit(gamelog, ledger):
+    """
+    userteam that rostered each gamelog row's player on its Date (FreeAgent otherwise).
+
+    Parameters:
+    - gamelog (pd.DataFrame): Rows with PlayerId and Date.
+    - ledger (pd.DataFrame): From load_ledger().
+
+    Returns:
+    - pd.Series: userteam aligned to gamelog.
+    """
+    games = pd.DataFrame({"Date": pd.to_datetime(gamelog["Date"]).astype("datetime64[ns]").to_numpy(),
+                          "player_id": gamelog["PlayerId"].astype("Int64").fillna(-1).astype("int64").to_numpy(),
+                          "row": np.arange(len(gamelog))})
+    games = games.dropna(subset=["Date"]).sort_values("Date", kind="stable")
+    moves = pd.DataFrame({"Date": ledger["date"].to_numpy(), "player_id": ledger["player_id"].astype("int64").to_numpy(),
+                          "userteam": ledger["userteam"].astype(object).to_numpy()})
+    credited = pd.merge_asof(games, moves, on="Date", by="player_id")
+    userteam = np.full(len(gamelog), FREE_AGENT, dtype=object)
+    userteam[credited["row"].to_numpy()] = credited["userteam"].fillna(FREE_AGENT).to_numpy()
+    return pd.Series(userteam, index=gamelog.index, name="userteam")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fantasy roster transactions.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for action in ("add", "trade"):
+        move = sub.add_parser(action, help=f"Record a{'n' if action == 'add' else ''} {action}")
+        move.add_argument("player")
+        move.add_argument("userteam")
+        move.add_argument("--date", help="Effective date (YYYY-MM-DD), default today")
+    drop = sub.add_parser("drop", help="Record a drop (player back to FreeAgent)")
+    drop.add_argument("player")
+    drop.add_argument("--date", help="Effective date (YYYY-MM-DD), default today")
+    show = sub.add_parser("show", help="Print the rosters on a date")
+    show.add_argument("--date", help="Default: today")
+    args = parser.parse_args()
+
+    if args.command == "show":
+        rosters = rosters_as_of(load_ledger(), args.date)
+        for team, group in rosters.groupby("Team"):
+            print(f"🧾 {team} ({len(group)}): {', '.join(group['Player'])}")
+        return
+    try:
+        row = record(args.command, args.player, getattr(args, "userteam", None), args.date)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ {row['date']}: {row['action']} {row['Player']} -> {row['userteam']} ({LEDGER_PATH})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Gamelog schema: one compact dtype per column, enforced once at ingest.
+
+The scraper casts each game's rows with enforce_schema() as soon as they are built,
+and the sinks record the dtypes in a sidecar next to the CSV (<csv>.schema.json).
+read_gamelog() reads straight into those dtypes, so consumers get typed columns and
+don't need their own pd.to_numeric / astype passes.
+
+Stamp (and check) an existing CSV, run from the WCC_Fantasy_1231 folder:
+
+    python3 wcc/schema.py stamp Gamelog/gamelog.csv
+"""
+import argparse
+import json
+import os
+
+import pandas as pd
+
+DATE_FORMAT = "%m/%d/%y"  # how Date is written in the gamelog CSVs
+
+STAT_COLUMNS = ["MIN", "OREB", "DREB", "REB", "AST", "STL", "BLK", "TO", "PF",
+                "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "PTS"]
+
+# "date" is datetime64 (written as DATE_FORMAT). Stats are nullable so a DNP "--" becomes <NA>.
+GAMELOG_SCHEMA = {
+    "Name": "string",
+    "Jersey #": "category",
+    "Team": "category",
+    "Opponent": "category",
+    "didWin": "int8",
+    "Date": "date",
+    **{stat: "Int16" for stat in STAT_COLUMNS},
+    "efg%": "float32",
+    "FantasyPts": "float32",
+    "isWCC": "bool",
+    "weeknum": "Int8",
+    "GameId": "Int64",
+    "PlayerId": "Int32",  # wcc/players.py
+}
+
+CSV_WRITE_OPTIONS = {"date_format": DATE_FORMAT}
+
+# One row per player per game: ESPN game id + team + player + jersey (see Scraper/sinks.py)
+GAMELOG_KEY = ("GameId", "Team", "Name", "Jersey #")
+
+
+class SchemaError(ValueError):
+    pass
+
+
+def _matches(series, dtype):
+    if dtype == "date":
+        return pd.api.types.is_datetime64_any_dtype(series)
+    if dtype == "string":
+        return isinstance(series.dtype, pd.StringDtype)
+    return str(series.dtype) == dtype
+
+
+def _cast(series, dtype):
+    if dtype == "date":
+        out = pd.to_datetime(series, format=DATE_FORMAT, errors="coerce")
+        missed = out.isna() & series.notna()
+        if missed.any():  # other spellings, e.g. 2026-01-04
+            out[missed] = pd.to_datetime(series[missed], format="mixed", errors="coerce")
+        return out
+    if dtype in ("string", "category"):
+        return series.astype("string").str.strip().astype(dtype)
+    if dtype == "bool":
+        if pd.api.types.is_bool_dtype(series):
+            return series
+        text = series.astype("string").str.strip().str.lower()
+        out = text.map({"true": True, "false": False, "1": True, "0": False}).astype("boolean")
+        return out.astype(bool) if not out.isna().any() else out
+    numeric = pd.to_numeric(series, errors="coerce")
+    if dtype.lower().startswith("int"):
+        fractional = numeric.notna() & (numeric % 1 != 0)
+        numeric = numeric.mask(fractional)
+        if not dtype.startswith("I"):  # numpy ints can't hold NA
+            return numeric.astype(dtype) if not numeric.isna().any() else numeric
+    return numeric.astype(dtype)
+
+
+def enforce_schema(df, schema=GAMELOG_SCHEMA, strict=False, label="gamelog"):
+    """
+    Cast df's columns to the schema (columns not in the schema are left alone).
+
+    Columns that already have the right dtype are skipped, so calling this again on
+    typed frames is cheap. Values that can't be parsed become NA and are reported.
+
+    Parameters:
+    - df (pd.DataFrame): Rows to cast.
+    - schema (dict): column -> dtype.
+    - strict (bool): Raise SchemaError instead of reporting unparseable values.
+
+    Returns:
+    - pd.DataFrame: A typed copy of df.
+    """
+    out = df.copy()
+    problems = []
+    for col, dtype in schema.items():
+        if col not in out.columns or _matches(out[col], dtype):
+            continue
+        before = out[col]
+        after = _cast(before, dtype)
+        bad = after.isna() & before.notna()
+        if bad.any():  # blanks aren't parse failures
+            bad &= ~before.astype("string").str.strip().isin(["", "nan", "<NA>"]).fillna(True)
+        if bad.any():
+            problems.append(f"{col}: {int(bad.sum())} value(s) like {before[bad].iloc[0]!r}")
+        if not _matches(after, dtype) and dtype in ("int8", "bool"):
+            # NA in a non-nullable column: keep the nullable cast and report it
+            problems.append(f"{col}: has missing values, stored as {after.dtype}")
+        out[col] = after
+    if problems:
+        message = f"{label} schema: " + "; ".join(problems)
+        if strict:
+            raise SchemaError(message)
+        print(f"⚠️ {message} (set to NA)")
+    return out
+
+
+def schema_of(df, schema=GAMELOG_SCHEMA):
+    """column -> dtype for the columns of df: the schema's dtype for known columns, else df's own."""
+    out = {}
+    for col in df.columns:
+        if col in schema:
+            out[col] = schema[col]
+        elif pd.api.types.is_datetime64_any_dtype(df[col]):
+            out[col] = "date"
+        elif isinstance(df[col].dtype, pd.StringDtype) or df[col].dtype == object:
+            out[col] = "string"
+        else:
+            out[col] = str(df[col].dtype)
+    return out
+
+
+def schema_path(csv_path):
+    return csv_path + ".schema.json"
+
+
+def write_schema(csv_path, df):
+    """Record df's dtypes next to the CSV it was written to."""
+    with open(schema_path(csv_path), "w", encoding="utf-8") as f:
+        json.dump({"date_format": DATE_FORMAT, "columns": schema_of(df)}, f, indent=2)
+
+
+def read_schema(csv_path):
+    """column -> dtype from the CSV's sidecar, or GAMELOG_SCHEMA when there isn't one."""
+    path = schema_path(csv_path)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)["columns"]
+    return GAMELOG_SCHEMA
+
+
+def read_gamelog(path="Gamelog/gamelog.csv", columns=None, chunksize=None, schema=None):
+    """
+    Read a gamelog CSV straight into its schema dtypes.
+
+    Parameters:
+    - path (str): Gamelog CSV.
+    - columns (list, optional): Only read these columns.
+    - chunksize (int, optional): Return an iterator of typed chunks.
+    - schema (dict, optional): column -> dtype. Defaults to the CSV's sidecar, else GAMELOG_SCHEMA.
+
+    Returns:
+    - pd.DataFrame (or an iterator of them with chunksize).
+    """
+    schema = schema or read_schema(path)
+    header = list(pd.read_csv(path, nrows=0).columns)
+    wanted = [c for c in header if columns is None or c in columns]
+    # Ints are parsed as float64 and narrowed below: the C parser reads floats natively,
+    # while nullable-int columns go through a much slower string path in read_csv
+    dtype = {c: "float64" if schema[c].lower().startswith("int") else schema[c]
+             for c in wanted if c in schema and schema[c] not in ("date", "bool")}
+    dates = [c for c in wanted if schema.get(c) == "date"]
+    reader = pd.read_csv(path, usecols=wanted, dtype=dtype, parse_dates=dates, date_format=DATE_FORMAT,
+                         chunksize=chunksize)
+    typed = {c: schema[c] for c in wanted if c in schema}
+    if chunksize:
+        return (enforce_schema(chunk, typed, label=path) for chunk in reader)
+    return enforce_schema(reader, typed, label=path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gamelog schema.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    stamp = sub.add_parser("stamp", help="Check CSVs against the gamelog schema and write their sidecars")
+    stamp.add_argument("csv", nargs="+")
+    stamp.add_argument("--strict", action="store_true", help="Fail on values that don't parse")
+    args = parser.parse_args()
+
+    for path in args.csv:
+        raw = pd.read_csv(path, dtype=str, keep_default_na=False)
+        typed = enforce_schema(raw, strict=args.strict, label=path)
+        write_schema(path, typed)
+        before = pd.read_csv(path).memory_usage(deep=True).sum() / 1e6
+        after = read_gamelog(path).memory_usage(deep=True).sum() / 1e6
+        print(f"✅ {path}: {len(typed)} rows, {before:.2f} MB -> {after:.2f} MB in memory")
+
+
+if __name__ == "__main__":
+    main()
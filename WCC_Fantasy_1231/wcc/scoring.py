@@ -0,0 +1,147 @@
+"""
+Fantasy points scoring.
+
+Scoring rules live in a TOML file (wcc/rules/default.toml is the league's):
+
+    [weights]              points per unit of a stat          PTS = 1.5
+    [[bonuses]]            flat points when stats reach a threshold
+        name, points, stats = [...], at_least = 10, count = 2 (default: all stats)
+    [positions]            multiplier on the total by Pos.    C = 1.1
+    [rounding]             decimals = 0, mode = "half_even" | "half_up" | "floor" | "ceil" | "none"
+
+load_rules() compiles a file into a ScoringRules whose score() evaluates a whole
+gamelog at once: the linear part is one stat-matrix @ weight-vector product and each
+bonus is one vectorized comparison over the matrix, with no per-row Python. The
+scraper and the rescoring scripts all score through here.
+"""
+import os
+import tomllib
+
+import numpy as np
+import pandas as pd
+
+RULES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules")
+DEFAULT_RULES = os.path.join(RULES_DIR, "default.toml")
+
+ROUNDING_MODES = {
+    "half_even": np.round,  # same as Python's round(), what the scraper always used
+    "half_up": lambda x, d: np.floor(x * 10.0 ** d + 0.5) / 10.0 ** d,
+    "floor": lambda x, d: np.floor(x * 10.0 ** d) / 10.0 ** d,
+    "ceil": lambda x, d: np.ceil(x * 10.0 ** d) / 10.0 ** d,
+    "none": lambda x, d: x,
+}
+
+
+def stat_matrix(df, stats, suffix=""):
+    """
+    Numeric (n_rows, n_stats) float matrix of df[stat + suffix] for each stat.
+
+    Bad strings and NaN count as 0, and a missing column is all zeros.
+    """
+    out = np.zeros((len(df), len(stats)))
+    for j, stat in enumerate(stats):
+        col = stat + suffix
+        if col in df.columns:
+            values = df[col]
+            if not pd.api.types.is_numeric_dtype(values):
+                values = pd.to_numeric(values, errors="coerce")
+            out[:, j] = np.nan_to_num(values.to_numpy(dtype=float, na_value=np.nan))
+    return out
+
+
+class ScoringRules:
+    """A compiled scoring spec. Build with load_rules() or ScoringRules(spec_dict)."""
+
+    def __init__(self, spec, name=None):
+        self.name = name or spec.get("name", "rules")
+        self.weights = {stat: float(w) for stat, w in spec.get("weights", {}).items()}
+        self.bonuses = []
+        for bonus in spec.get("bonuses", []):
+            stats = list(bonus["stats"])
+            self.bonuses.append({
+                "name": bonus.get("name", "+".join(stats)),
+                "points": float(bonus["points"]),
+                "stats": stats,
+                "at_least": float(bonus["at_least"]),
+                "count": int(bonus.get("count", len(stats))),
+            })
+        self.positions = {pos: float(m) for pos, m in spec.get("positions", {}).items()}
+        rounding = spec.get("rounding", {})
+        self.decimals = int(rounding.get("decimals", 0))
+        self.rounding = rounding.get("mode", "half_even")
+        if self.rounding not in ROUNDING_MODES:
+            raise ValueError(f"Unknown rounding mode {self.rounding!r} (use one of {', '.join(ROUNDING_MODES)})")
+
+        # Compile: one column per stat the rules read, bonuses as column-index arrays
+        self.stats = list(dict.fromkeys(list(self.weights) + [s for b in self.bonuses for s in b["stats"]]))
+        column = {stat: j for j, stat in enumerate(self.stats)}
+        self._weight_vector = np.array([self.weights.get(stat, 0.0) for stat in self.stats])
+        self._bonus_columns = [np.array([column[s] for s in b["stats"]]) for b in self.bonuses]
+
+    def position_multipliers(self, positions):
+        """Multiplier per row from a Pos. series ("G/F" uses G). Unknown or missing -> 1."""
+        positions = positions.fillna("").astype(str)
+        lookup = {pos: self.positions.get(pos, self.positions.get(pos.split("/")[0], 1.0))
+                  for pos in positions.unique()}
+        return positions.map(lookup).to_numpy(dtype=float)
+
+    def score(self, df, positions=None, suffix="", breakdown=False):
+        """
+        Score every row of df.
+
+        Parameters:
+        - df (pd.DataFrame): Gamelog rows (or per-player sums with suffix="_sum").
+        - positions (pd.Series, optional): Pos. per row for [positions] multipliers.
+          Defaults to df["Pos."] when present.
+        - suffix (str): Column suffix, e.g. "_sum" for aggregated stats (bonuses are
+          per game, so they are skipped when a suffix is used).
+        - breakdown (bool): Return a DataFrame with the linear, bonus and multiplier parts too.
+
+        Returns:
+        - pd.Series: Fantasy points, aligned to df.index (or a DataFrame with breakdown=True).
+        """
+        X = stat_matrix(df, self.stats, suffix)
+        linear = X @ self._weight_vector
+        bonus = np.zeros(len(df))
+        parts = {}
+        if not suffix:
+            for rule, cols in zip(self.bonuses, self._bonus_columns):
+                hit = (X[:, cols] >= rule["at_least"]).sum(axis=1) >= rule["count"]
+                parts[rule["name"]] = hit
+                bonus += hit * rule["points"]
+
+        multiplier = np.ones(len(df))
+        if self.positions:
+            if positions is None and "Pos." in df.columns:
+                positions = df["Pos."]
+            if positions is not None:
+                multiplier = self.position_multipliers(pd.Series(positions, index=df.index))
+
+        points = ROUNDING_MODES[self.rounding]((linear + bonus) * multiplier, self.decimals)
+        points = pd.Series(points, index=df.index, name="FantasyPts")
+        if not breakdown:
+            return points
+        out = pd.DataFrame({"linear": linear, "bonus": bonus, "multiplier": multiplier}, index=df.index)
+        for name, hit in parts.items():
+            out[name] = hit
+        out["FantasyPts"] = points
+        return out
+
+
+def load_rules(path=DEFAULT_RULES):
+    """Read and compile a TOML scoring spec."""
+    with open(path, "rb") as f:
+        spec = tomllib.load(f)
+    return ScoringRules(spec, name=spec.get("name", os.path.splitext(os.path.basename(path))[0]))
+
+
+DEFAULT = load_rules()
+
+
+def score(df, rules=None, **kwargs):
+    """Score df with rules (a ScoringRules or a TOML path); the league rules by default."""
+    if rules is None:
+        rules = DEFAULT
+    elif isinstance(rules, str):
+        rules = load_rules(rules)
+    return rules.score(df, **kwargs)
@@ -0,0 +1,234 @@
+"""
+Incremental player x week stat cube: running sums and counts of the gamelog stats.
+
+    data/fantasy/season_agg.csv         PlayerId, weeknum + <stat>_sum / <stat>_count per stat, didWin_sum
+    data/fantasy/season_agg_games.csv   game, Date   (every team box score already applied)
+
+Each cell is one player's totals for one week (weeknum NO_WEEK for games outside the
+schedule). Any week window is a slice-and-sum over the cube: table(weeks) gives the
+same <stat>_sum / <stat>_mean / FantasyPts_count frame a groupby over those weeks'
+gamelog rows would, and weekly() pivots one stat to player x week.
+
+A "game" is one team's box score: GameId + Team, or Date + Team + Opponent for rows
+scraped before GameId existed. update() reads the gamelog from the watermark (the
+latest applied Date) on, drops the games already applied and adds only the rest, so
+a new night of games costs O(new rows). Writes into the league gamelog also apply
+their games as they land (CubeSink in Scraper/sinks.py).
+
+Games that change after they were applied (a re-scraped box score, a backfill of
+older dates, PlayerIds re-stamped by wcc/name_resolver.py) are not picked up: run
+`rebuild`, or `update_fantasy_stats.py --verify` to check.
+
+Run from the WCC_Fantasy_1231 folder:
+
+    python3 wcc/season_agg.py update
+    python3 wcc/season_agg.py rebuild
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.gamelog_store import GAMELOG_CSV, load_gamelog
+from wcc.players import with_player_ids
+from wcc.weeks import add_week_num_from_date
+
+STATE_PATH = "data/fantasy/season_agg.csv"
+GAMES_PATH = "data/fantasy/season_agg_games.csv"
+NO_WEEK = -1  # cube weeknum for games without one
+
+# Stats summed and averaged per player in fantasy_stats (wcc/fantasy_stats.py)
+AGG_STATS = ["FantasyPts", "MIN", "OREB", "DREB", "REB", "AST", "STL", "BLK", "TO",
+             "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "PTS"]
+STATE_COLUMNS = [f"{s}_{k}" for s in AGG_STATS for k in ("sum", "count")] + ["didWin_sum"]
+CUBE_INDEX = ["PlayerId", "weeknum"]
+
+
+def game_keys(df):
+    """One key per team box score: "<GameId>|<Team>", or "<Date>|<Team>|<Opponent>" for legacy rows."""
+    team = df["Team"].astype("string").fillna("")
+    legacy = (df["Date"].dt.strftime("%Y-%m-%d").astype("string").fillna("") + "|" + team + "|" +
+              df["Opponent"].astype("string").fillna(""))
+    if "GameId" not in df.columns:
+        return legacy
+    return (df["GameId"].astype("string") + "|" + team).fillna(legacy)
+
+
+def partial_sums(rows, by="PlayerId"):
+    """STATE_COLUMNS for rows, one row per group of by (sums skip NA; counts are non-NA values)."""
+    grouped = rows.groupby(by)
+    sums = grouped[AGG_STATS].sum().astype("float64").add_suffix("_sum")
+    counts = grouped[AGG_STATS].count().astype("float64").add_suffix("_count")
+    wins = grouped["didWin"].sum().astype("float64").rename("didWin_sum")
+    return pd.concat([sums, counts, wins], axis=1)[STATE_COLUMNS]
+
+
+def _empty_cube():
+    index = pd.MultiIndex.from_arrays([pd.Series(dtype="int64"), pd.Series(dtype="int64")], names=CUBE_INDEX)
+    return pd.DataFrame(columns=STATE_COLUMNS, index=index, dtype="float64")
+
+
+class SeasonAgg:
+    """The player x week cube plus the games it includes. Load with SeasonAgg.load()."""
+
+    def __init__(self, sums=None, games=None):
+        self.sums = sums if sums is not None else _empty_cube()
+        self.games = games if games is not None else pd.DataFrame({"game": pd.Series(dtype="string"),
+                                                                   "Date": pd.Series(dtype="datetime64[ns]")})
+        self._applied = set(self.games["game"])
+
+    @classmethod
+    def load(cls, path=STATE_PATH, games_path=GAMES_PATH):
+        """The saved state, or an empty one when there is none."""
+        if not (os.path.exists(path) and os.path.exists(games_path)):
+            return cls()
+        sums = pd.read_csv(path, dtype={c: "float64" for c in STATE_COLUMNS}).set_index(CUBE_INDEX)
+        games = pd.read_csv(games_path, dtype={"game": "string"}, parse_dates=["Date"])
+        return cls(sums, games)
+
+    def save(self, path=STATE_PATH, games_path=GAMES_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        for frame, target, index in ((self.sums, path, True), (self.games, games_path, False)):
+            frame.to_csv(target + ".tmp", index=index)
+            os.replace(target + ".tmp", target)
+
+    @property
+    def watermark(self):
+        """Latest game Date applied (None when empty)."""
+        return None if self.games.empty else self.games["Date"].max()
+
+    @property
+    def weeks(self):
+        """Weeknums in the cube, in order (NO_WEEK left out)."""
+        return sorted(w for w in self.sums.index.get_level_values("weeknum").unique() if w != NO_WEEK)
+
+    def new_rows(self, gamelog):
+        """Rows of gamelog from games not applied yet."""
+        return gamelog[~game_keys(gamelog).isin(self._applied).to_numpy()]
+
+    def apply(self, rows, players=None, create=True):
+        """
+        Add rows (whole games not applied yet) to the cube.
+
+        Parameters:
+        - rows (pd.DataFrame): Typed gamelog rows, e.g. from new_rows() (weeknum is computed from Date if absent).
+        - players (Players, optional): Player dimension for rows without a PlayerId.
+        - create (bool): Give players missing from the dimension a new id (readers pass False).
+
+        Returns:
+        - int: Games applied.
+        """
+        if rows.empty:
+            return 0
+        rows = with_player_ids(rows, players, create=create)
+        known = rows[rows["PlayerId"].notna().to_numpy()]
+        ids = known["PlayerId"].astype("int64")
+        weeks = known["weeknum"] if "weeknum" in known.columns else add_week_num_from_date(known["Date"])
+        weeks = weeks.astype("Int64").fillna(NO_WEEK).astype("int64").rename("weeknum")
+        part = partial_sums(known, [ids, weeks])
+        self.sums = self.sums.add(part, fill_value=0)[STATE_COLUMNS]
+        games = pd.DataFrame({"game": game_keys(rows), "Date": rows["Date"]}).drop_duplicates("game")
+        self.games = pd.concat([self.games, games], ignore_index=True)
+        self._applied.update(games["game"])
+        return len(games)
+
+    def totals(self, weeks=None):
+        """Per-player STATE_COLUMNS summed over weeks (all weeks, NO_WEEK included, by default)."""
+        cube = self.sums
+        if weeks is not None:
+            cube = cube[cube.index.get_level_values("weeknum").isin(list(weeks))]
+        totals = cube.groupby(level="PlayerId").sum()
+        totals.index = totals.index.astype("int64")
+        return totals
+
+    def table(self, weeks=None):
+        """The aggregate table over weeks (see agg_table())."""
+        return agg_table(self.totals(weeks))
+
+    def weekly(self, stat="FantasyPts", kind="sum"):
+        """One stat as a PlayerId x weeknum frame (0 where a player had no games that week)."""
+        return self.sums[f"{stat}_{kind}"].unstack("weeknum", fill_value=0).drop(columns=NO_WEEK, errors="ignore")
+
+
+def agg_table(sums):
+    """
+    Per-player running sums -> PlayerId, <stat>_sum, <stat>_mean, FantasyPts_count, didWin_sum.
+
+    Dtypes match a groupby over the typed gamelog (int sums stay nullable Int64), so
+    fantasy_stats built from either is written byte for byte the same.
+    """
+    out = {"PlayerId": sums.index.astype("Int32")}
+    for stat in AGG_STATS:
+        total = sums[f"{stat}_sum"]
+        out[f"{stat}_sum"] = total.astype("float32" if stat == "FantasyPts" else "Int64").array
+        out[f"{stat}_mean"] = (total / sums[f"{stat}_count"].where(sums[f"{stat}_count"] > 0)).to_numpy()
+        if stat == "FantasyPts":
+            out["FantasyPts_count"] = sums["FantasyPts_count"].astype("int64").to_numpy()
+    out["didWin_sum"] = sums["didWin_sum"].astype("int64").to_numpy()
+    return pd.DataFrame(out).sort_values("PlayerId", ignore_index=True)
+
+
+def aggregate(rows, players=None):
+    """agg_table() of rows in one pass, without keeping any state."""
+    return agg_table(partial_sums(with_player_ids(rows, players)))
+
+
+def update(agg=None, players=None, since=None, csv_path=GAMELOG_CSV, create=True):
+    """
+    Apply every gamelog game not yet in agg (read from the watermark on).
+
+    Parameters:
+    - agg (SeasonAgg, optional): State to update. Defaults to the saved state.
+    - players (Players, optional): Player dimension.
+    - since (str or Timestamp, optional): Rescan from this date instead of the watermark.
+    - csv_path (str): Gamelog CSV, read when the Parquet store isn't current.
+    - create (bool): Give players missing from the dimension a new id (readers pass False).
+
+    Returns:
+    - (SeasonAgg, pd.DataFrame): The updated state and the rows it added.
+    """
+    agg = agg or SeasonAgg.load()
+    start = pd.Timestamp(since) if since is not None else agg.watermark
+    rows = agg.new_rows(load_gamelog(csv_path=csv_path, since=start))
+    agg.apply(rows, players, create=create)
+    return agg, rows
+
+
+def current_cube(csv_path=GAMELOG_CSV, players=None):
+    """The saved cube brought up to date in memory, for readers such as the Streamlit pages (nothing is saved)."""
+    return update(players=players, csv_path=csv_path, create=False)[0]
+
+
+def rebuild(gamelog=None, players=None):
+    """A fresh SeasonAgg over the whole gamelog."""
+    agg = SeasonAgg()
+    agg.apply(gamelog if gamelog is not None else load_gamelog(), players)
+    return agg
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental player x week stat cube.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    upd = sub.add_parser("update", help="Apply games not applied yet")
+    upd.add_argument("--since", help="Rescan from this date (YYYY-MM-DD) instead of the watermark")
+    sub.add_parser("rebuild", help="Recompute the cube from the whole gamelog")
+    args = parser.parse_args()
+
+    before = 0
+    if args.command == "update":
+        agg, _ = update(since=args.since)
+        before = len(SeasonAgg.load().games)
+    else:
+        agg = rebuild()
+    agg.save()
+    if agg.watermark is None:
+        print("✅ gamelog is empty")
+    else:
+        print(f"✅ {len(agg.games) - before} game(s) applied; {len(agg.sums)} player-week cell(s), "
+              f"{len(agg.games)} game(s) through {agg.watermark:%Y-%m-%d} -> {STATE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
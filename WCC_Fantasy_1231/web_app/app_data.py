@@ -0,0 +1,164 @@
+"""
+Shared data access for the Streamlit pages: every page loads its frames from here.
+
+    from web_app.app_data import fantasy_stats, gamelog
+    df = fantasy_stats()
+
+Each loader parses its sources once per process (st.cache_resource), keyed on the
+sources' mtime and size (version()). Widget reruns and other sessions reuse the parsed
+frames, and a new scrape or update_fantasy_stats.py run shows up on the next rerun
+without restarting the app. Dtypes are normalized once at load: the gamelog is typed by
+wcc/schema.py and stamped with PlayerId, and name/team columns are stripped. PlayerIds
+come from a player dimension loaded with the same version() keys (not the process-wide
+default in wcc/players.py), so an alias added while the app runs is picked up too.
+
+Pages get shallow copies. With copy-on-write (always on from pandas 3.0), whatever a
+page does to its copy never reaches the cached frame.
+"""
+import os
+import sys
+
+import pandas as pd
+import streamlit as st
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # WCC_Fantasy_1231, for wcc/
+from wcc.fantasy_stats import OUTPUT_PATH, build_fantasy_stats, load_sources, team_week_points
+from wcc.gamelog_store import GAMELOG_CSV, STORE_PATH, load_gamelog
+from wcc.league_ledger import SCORING_PATH, SNAPSHOTS_PATH, standings_as_of
+from wcc.players import ALIASES_PATH, PLAYERS_PATH, ROSTER_PATH, load_players, with_player_ids
+from wcc.rosters_ledger import DRAFT_RESULTS_PATH, LEDGER_PATH, credit, load_ledger
+from wcc.season_agg import GAMES_PATH, STATE_PATH, current_cube
+
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)  # the default from pandas 3.0
+
+DRAFT_BOARD_PATH = "data/fantasy/fantasy_stats_2025-12-27.csv"
+
+PLAYER_SOURCES = (PLAYERS_PATH, ALIASES_PATH)
+GAMELOG_SOURCES = (GAMELOG_CSV, STORE_PATH, *PLAYER_SOURCES)
+ROSTER_SOURCES = (DRAFT_RESULTS_PATH, LEDGER_PATH, PLAYERS_PATH, ALIASES_PATH)
+TEXT_COLUMNS = ("Full Name", "FullTeamName", "userteam", "Player", "Team")
+
+
+def version(*paths):
+    """(mtime_ns, size) of each source file (None when missing), the cache key of whatever is read from them."""
+    out = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            out.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            out.append(None)
+    return tuple(out)
+
+
+def _view(df):
+    """A page's copy of a cached frame (shallow: nothing is copied until the page writes to it)."""
+    return df.copy(deep=False)
+
+
+def _strip(df):
+    for col in TEXT_COLUMNS:
+        if col in df.columns and pd.api.types.is_string_dtype(df[col]):
+            df[col] = df[col].str.strip()
+    return df
+
+
+# --- cached loaders (keyed on version()) ---
+
+@st.cache_resource(max_entries=4)
+def _csv(path, data_version):
+    return _strip(pd.read_csv(path))
+
+
+@st.cache_resource(max_entries=2)
+def _players(data_version):
+    return load_players()
+
+
+def _current_players():
+    return _players(version(*PLAYER_SOURCES))
+
+
+@st.cache_resource(max_entries=2)
+def _gamelog(data_version):
+    return with_player_ids(load_gamelog(), _current_players(), create=False)
+
+
+@st.cache_resource(max_entries=2)
+def _sources(data_version):
+    return tuple(_strip(df) for df in load_sources())
+
+
+@st.cache_resource(max_entries=2)
+def _cube(data_version):
+    return current_cube(GAMELOG_CSV, players=_current_players())
+
+
+@st.cache_resource(max_entries=16)
+def _fantasy_stats_for(weeks, data_version):
+    roster, draft_results = _sources(version(ROSTER_PATH, *ROSTER_SOURCES))
+    agg = _cube(version(*GAMELOG_SOURCES, STATE_PATH, GAMES_PATH)).table(list(weeks) or None)
+    return build_fantasy_stats(None, roster, draft_results, players=_current_players(), agg=agg)
+
+
+@st.cache_resource(max_entries=2)
+def _team_week_points(data_version):
+    gl = _gamelog(version(*GAMELOG_SOURCES))
+    return team_week_points(gl, credit(gl, load_ledger(players=_current_players())))
+
+
+@st.cache_resource(max_entries=16)
+def _standings(week, data_version):
+    return standings_as_of(week, players=_current_players())
+
+
+# --- what the pages call ---
+
+def csv(path):
+    """Any CSV under data/, parsed once per version of the file."""
+    return _view(_csv(path, version(path)))
+
+
+def fantasy_stats():
+    """data/fantasy/fantasy_stats_latest.csv."""
+    return csv(OUTPUT_PATH)
+
+
+def fantasy_stats_for(weeks=()):
+    """fantasy_stats over those weeks (all when empty), computed in-process from the stat cube."""
+    return _view(_fantasy_stats_for(tuple(weeks), version(*GAMELOG_SOURCES, STATE_PATH, GAMES_PATH, ROSTER_PATH,
+                                                           *ROSTER_SOURCES)))
+
+
+def gamelog(columns=None):
+    """The typed gamelog with PlayerId (from the Parquet store when it is current)."""
+    gl = _gamelog(version(*GAMELOG_SOURCES))
+    return _view(gl if columns is None else gl[columns])
+
+
+def sources():
+    """(roster, draft_results): the WCC rosters and today's fantasy rosters (wcc/fantasy_stats.load_sources)."""
+    roster, draft_results = _sources(version(ROSTER_PATH, *ROSTER_SOURCES))
+    return _view(roster), _view(draft_results)
+
+
+def cube():
+    """The player x week stat cube, up to date with the gamelog (shared: don't modify it)."""
+    return _cube(version(*GAMELOG_SOURCES, STATE_PATH, GAMES_PATH))
+
+
+def userteam_week_points():
+    """(userteam x week points, season totals) with each game credited to whoever rostered the player that day."""
+    weekly, season = _team_week_points(version(*GAMELOG_SOURCES, *ROSTER_SOURCES))
+    return _view(weekly), season.copy(deep=False)
+
+
+def standings(week):
+    """Standings as of week (wcc/league_ledger.py)."""
+    return _view(_standings(week, version(*GAMELOG_SOURCES, *ROSTER_SOURCES, SCORING_PATH, SNAPSHOTS_PATH)))
+
+
+def weeks():
+    """Weeknums with games, in order."""
+    return [int(w) for w in cube().weeks]
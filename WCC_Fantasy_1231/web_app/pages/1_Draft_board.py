@@ -1,15 +1,21 @@
+import os
+import sys
+
 import streamlit as st
 import pandas as pd
 import glob
 import random
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # WCC_Fantasy_1231, for wcc/
+from web_app.app_data import DRAFT_BOARD_PATH, csv
+
 
 st.set_page_config(page_title="WCC Analytics Dashboard", layout="wide")
 st.title("🏀 WCC Analytics Dashboard")
 
 # --- Load conference player list ---
-all_players = pd.read_csv("data/wcc_concat_updated.csv")
-draft_board = pd.read_csv("data/fantasy/fantasy_stats_2025-12-27.csv")
+all_players = csv("data/wcc_concat_updated.csv")
+draft_board = csv(DRAFT_BOARD_PATH)
 
 
 # --- ADP based on FantasyPts_mean up to 2025-12-27 ---
@@ -1,16 +1,17 @@
+import os
+import sys
+
 import streamlit as st
-import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # WCC_Fantasy_1231, for wcc/
+from web_app.app_data import fantasy_stats, standings, weeks
 
 st.set_page_config(page_title="Standings", page_icon="📊")
 
 st.title("📊 Global Standings")
 #also want to add fantasy individual leaders
 # --- Load Data ---
-@st.cache_data
-def load_fantasy_stats():
-    return pd.read_csv("data/fantasy/fantasy_stats_latest.csv")
-
-df = load_fantasy_stats()
+df = fantasy_stats()
 
 
 
@@ -53,6 +54,20 @@ st.dataframe(team_stats, use_container_width=True)
 # Optional: Bar chart
 st.bar_chart(data=team_stats, x="Team", y="Total Fantasy Points")
 
+st.divider()
+st.subheader("📅 Standings as of a Week")
+st.caption("Each game counts for whoever rostered the player that day, scored with the rules in effect "
+           "(wcc/league_ledger.py).")
+
+# --- Replayed from the league event log, starting at the nearest snapshot ---
+week_options = weeks()
+if week_options:
+    week = st.selectbox("Week", week_options, index=len(week_options) - 1)
+    week_standings = standings(week)
+    week_standings.columns = ["Team", "Total Fantasy Points", "Games Played", "FP/Game"]
+    st.dataframe(week_standings.style.format({"Total Fantasy Points": "{:,.1f}", "FP/Game": "{:.2f}"}),
+                 use_container_width=True)
+
 st.divider()
 cols = ["Full Name","#", "Pos.", "FullTeamName","GP", "FantasyPts_sum", "FantasyPts_mean", 
          "PTS_mean", "REB_mean", "AST_mean", "STL_mean", "BLK_mean",'rank_pos', 'rank_global']
@@ -1,52 +1,46 @@
+import os
+import sys
+
 import streamlit as st
 import pandas as pd
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # WCC_Fantasy_1231, for wcc/
+from web_app.app_data import fantasy_stats_for, gamelog, weeks as gamelog_weeks
+
 st.set_page_config(page_title="My Team", page_icon="🧍", layout="wide")
 st.title("🧍 My Team Roster")
 
 # -----------------------------
 # Load Data
 # -----------------------------
-@st.cache_data
-def load_data():
-    fantasy = pd.read_csv("data/fantasy/fantasy_stats_latest.csv")
-    gamelog = pd.read_csv("Gamelog/gamelog.csv")
-    teams = fantasy["userteam"].unique().tolist()
-    if "FreeAgent" in teams:
-        teams.remove("FreeAgent")
-    return fantasy, gamelog, teams
-
-df, gl, teams = load_data()
+# fantasy_stats is computed in-process (wcc/fantasy_stats.py) for any week window
+gl = gamelog()
+teams = [t for t in fantasy_stats_for()["userteam"].unique().tolist() if t != "FreeAgent"]
 
 # -----------------------------
-# Select Team
+# Select Team / weeks
 # -----------------------------
 team = st.selectbox("Select your team:", teams)
+weeks_available = gamelog_weeks()
+weeks = st.multiselect("Weeks (all when empty):", weeks_available)
+df = fantasy_stats_for(weeks)
+if weeks:
+    gl = gl[gl["weeknum"].isin(weeks).to_numpy()]
 
 roster = df[df["userteam"] == team].copy()
 roster["FantasyPts_sum"] = pd.to_numeric(roster["FantasyPts_sum"], errors="coerce").fillna(0)
 roster = roster.sort_values("FantasyPts_sum", ascending=False)
 
 my_players = roster["Full Name"].astype(str).str.strip().unique().tolist()
-my_players_set = set(my_players)
+player_ids = dict(zip(roster["Full Name"].astype(str).str.strip(), roster["player_id"]))
 
 # -----------------------------
 # (A) Team-level season averages from gamelog (for THIS userteam)
 # -----------------------------
 st.subheader("📊 Team Season Averages (from Game Log)")
 
-# clean + parse
-gl["Name"] = gl["Name"].astype(str).str.strip()
-gl["Date_dt"] = pd.to_datetime(gl["Date"], errors="coerce")
-
 # filter to your roster players
-team_gl = gl[gl["Name"].isin(my_players_set)].copy()
-
-# ensure numeric
-num_cols = ["MIN","PTS","REB","AST","STL","BLK","TO","FGM","FGA","3PM","3PA","FTM","FTA","FantasyPts"]
-for c in num_cols:
-    if c in team_gl.columns:
-        team_gl[c] = pd.to_numeric(team_gl[c], errors="coerce")
+team_gl = gl[gl["PlayerId"].isin(player_ids.values())].copy()
 
 def safe_mean(col):
     if col in team_gl.columns and len(team_gl):
@@ -147,8 +141,7 @@ st.subheader("📈 Player Game Log Tracker")
 
 player = st.selectbox("Player", my_players)
 
-player_logs = gl[gl["Name"] == player].copy()
-player_logs["Date_dt"] = pd.to_datetime(player_logs["Date"], errors="coerce")
+player_logs = gl[gl["PlayerId"] == player_ids[player]].copy()
 
 if not player_logs.empty and 'ImageURL' in df.columns:
     player_image_url = df[df['Full Name'] == player]['ImageURL'].iloc[0]
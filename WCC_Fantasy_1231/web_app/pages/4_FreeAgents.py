@@ -1,16 +1,17 @@
+import os
+import sys
+
 import streamlit as st
-import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # WCC_Fantasy_1231, for wcc/
+from web_app.app_data import fantasy_stats
 
 st.set_page_config(page_title="Free Agents", page_icon="🧾")
 
 st.title("🧾 Available Free Agents")
 
 # --- Load Data ---
-@st.cache_data
-def load_fantasy_stats():
-    return pd.read_csv("data/fantasy/fantasy_stats_latest.csv")
-
-df = load_fantasy_stats()
+df = fantasy_stats()
 
 free_agents = df[df["userteam"] == "FreeAgent"].sort_values("FantasyPts_mean", ascending=False)
 top_free_agents = free_agents.head(5)
@@ -1,30 +1,33 @@
+import os
+import sys
+
 import streamlit as st
 import pandas as pd
-from unidecode import unidecode
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # WCC_Fantasy_1231, for wcc/
+from web_app.app_data import fantasy_stats as load_fantasy_stats, gamelog as load_gamelog
+from wcc.db import DB_PATH, FantasyDB, is_current
+from wcc.gamelog_store import GAMELOG_CSV, STORE_PATH
 
 st.set_page_config(page_title="Player Game Logs", page_icon="📅")
 
 st.title("📅 Player Game Logs")
 
 # --- Load Data ---
-@st.cache_data
-def load_data():
-    fantasy_stats = pd.read_csv("data/fantasy/fantasy_stats_latest.csv")
-    gamelog = pd.read_csv("Gamelog/gamelog.csv")
-    return fantasy_stats, gamelog
+fantasy_stats, gamelog = load_fantasy_stats(), load_gamelog()
 
-fantasy_stats, gamelog = load_data()
-
-# --- Clean and prep ---
-def make_clean_name(name):
-    return unidecode(name.strip().lower()) if isinstance(name, str) else ""
+@st.cache_resource
+def league_db(db_exists):
+    # Keyed on whether the file exists, so a database imported while the app runs is picked up
+    # (one open connection already sees every later write)
+    return FantasyDB(readonly=True) if db_exists else None
 
 # --- 1️⃣ Master Game Log Viewer ---
 st.subheader("📜 All Game Logs")
 
 # Convert Date column
 if "Date" in gamelog.columns:
-    gamelog["Date"] = pd.to_datetime(gamelog["Date"], errors="coerce").dt.date
+    gamelog["Date"] = gamelog["Date"].dt.date
 
 
 # Date range filter
@@ -75,9 +78,16 @@ jerseynum = fantasy_stats.loc[
 jersey_display = f" #{int(jerseynum)}" if pd.notna(jerseynum) else ""
 
 
-clean_player = make_clean_name(player)
+player_id = fantasy_stats.loc[fantasy_stats["Full Name"] == player, "player_id"].iloc[0]
 
-player_logs = gamelog[gamelog["Name"].apply(make_clean_name) == clean_player]
+db = league_db(os.path.exists(DB_PATH))
+if db is not None and pd.notna(player_id) and is_current(DB_PATH, (GAMELOG_CSV, STORE_PATH)):
+    # Indexed lookup in the league database (wcc/db.py) instead of scanning the gamelog,
+    # as long as it has everything the gamelog has
+    player_logs = db.player_games_by_id(player_id)
+    player_logs["Date"] = player_logs["Date"].dt.date
+else:
+    player_logs = gamelog[gamelog["PlayerId"] == player_id]
 # Display player image if available
 if not player_logs.empty and 'ImageURL' in fantasy_stats.columns:
     player_image_url = fantasy_stats[fantasy_stats['Full Name'] == player]['ImageURL'].iloc[0]
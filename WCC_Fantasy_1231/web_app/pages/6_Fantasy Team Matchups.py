@@ -1,11 +1,19 @@
 # 6_UserTeam_Matchups.py
 # Future schedule (Weeks 1..9) independent of gamelog.
-# Weekly scoring pulls from gamelog when available (weeknum), otherwise 0.
+# Weekly scoring comes from one userteam x week points table (0 for weeks not played yet);
+# games count for whoever rostered the player that day (wcc/rosters_ledger.py).
 # Global standings uses gamelog season-to-date totals.
 
+import os
+import random
+import sys
+
+import numpy as np
 import streamlit as st
 import pandas as pd
-import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # WCC_Fantasy_1231, for wcc/
+from web_app.app_data import fantasy_stats, userteam_week_points
 
 st.set_page_config(page_title="User Team Matchups", page_icon="🗓️", layout="wide")
 st.title("🗓️ Fantasy League Matchups & Scoreboard")
@@ -18,28 +26,12 @@ TOTAL_WEEKS = 9  # future schedule weeks 1..9
 # -----------------------------
 # Load data
 # -----------------------------
-fantasystats = pd.read_csv("data/fantasy/fantasy_stats_latest.csv")
-gamelog = pd.read_csv("Gamelog/gamelog.csv")
+fantasystats = fantasy_stats()
 
 
 # fantasy_stats_latest mapping columns
-fs_player = "Full Name"
 fs_userteam = "userteam"
 
-# gamelog columns
-gl_player = "Name"
-gl_fpts   = "FantasyPts"
-gl_week   = "weeknum"
-
-
-# Normalize
-fantasystats[fs_player] = fantasystats[fs_player].astype(str).str.strip()
-fantasystats[fs_userteam] = fantasystats[fs_userteam].astype(str).str.strip()
-
-gamelog[gl_player] = gamelog[gl_player].astype(str).str.strip()
-gamelog[gl_week] = pd.to_numeric(gamelog[gl_week], errors="coerce").astype("Int64")
-gamelog[gl_fpts] = pd.to_numeric(gamelog[gl_fpts], errors="coerce").fillna(0)
-
 # User teams list (exclude FreeAgent)
 
 user_teams = sorted([t for t in fantasystats[fs_userteam].unique().tolist() if t != "FreeAgent"])
@@ -48,18 +40,10 @@ if len(user_teams) < 2:
     st.stop()
 
 # -----------------------------
-# Map Player -> userteam (from fantasy_stats_latest)
+# Points per userteam x week, computed once per data version. Each game is credited to
+# the userteam that rostered the player on its date (wcc/rosters_ledger.py).
 # -----------------------------
-# we want this to depend on the weekly rostered team 
-player_to_userteam = dict(
-    fantasystats[fantasystats[fs_userteam] != "FreeAgent"]
-    .dropna(subset=[fs_player, fs_userteam])
-    .drop_duplicates(subset=[fs_player])[[fs_player, fs_userteam]]
-    .values
-)
-
-# Attach userteam to gamelog (unrostered -> FreeAgent)
-gamelog["userteam"] = gamelog[gl_player].map(player_to_userteam).fillna("FreeAgent")
+week_points, season_points = userteam_week_points()
 
 # -----------------------------
 # Global standings (season-to-date from gamelog)
@@ -67,11 +51,8 @@ gamelog["userteam"] = gamelog[gl_player].map(player_to_userteam).fillna("FreeAge
 st.subheader("🌍 Global Standings (Season-to-date)")
 
 season_totals = (
-    gamelog[gamelog["userteam"] != "FreeAgent"]
-    .groupby("userteam", dropna=False)[gl_fpts]
-    .sum()
+    season_points.rename("FantasyPts_total")
     .reset_index()
-    .rename(columns={gl_fpts: "FantasyPts_total"})
     .sort_values("FantasyPts_total", ascending=False)
 )
 
@@ -119,33 +100,24 @@ if "matchups_full" not in st.session_state:
 matchups_df = st.session_state.matchups_full.copy()
 
 # -----------------------------
-# Weekly scoring from gamelog (if week exists yet, else 0)
+# Weekly scoring: lookups into the points table (if week exists yet, else 0; BYE scores 0)
 # -----------------------------
-def team_points_for_week(team_name: str, week: int) -> float:
-    if team_name in (None, "", "BYE"):
-        return 0.0
-    df = gamelog[(gamelog["userteam"] == team_name) & (gamelog[gl_week] == week)]
-    return float(df[gl_fpts].sum())
+points_by_team_week = week_points.stack()
 
-matchups_df["Team A Pts"] = matchups_df.apply(lambda r: team_points_for_week(r["Team A"], int(r["Week"])), axis=1)
-matchups_df["Team B Pts"] = matchups_df.apply(lambda r: team_points_for_week(r["Team B"], int(r["Week"])), axis=1)
+def team_points(teams: pd.Series, weeks: pd.Series) -> np.ndarray:
+    keys = pd.MultiIndex.from_arrays([teams, weeks.astype("int64")])
+    return points_by_team_week.reindex(keys).fillna(0.0).to_numpy()
 
-def pick_winner(row):
-    # If no games yet, you can optionally show None instead of Tie
-    if row["Team A"] == "BYE":
-        return row["Team B"]
-    if row["Team B"] == "BYE":
-        return row["Team A"]
-    if row["Team A Pts"] > row["Team B Pts"]:
-        return row["Team A"]
-    if row["Team B Pts"] > row["Team A Pts"]:
-        return row["Team B"]
-    # If both are 0 and it’s future, you might prefer blank:
-    if row["Team A Pts"] == 0 and row["Team B Pts"] == 0:
-        return ""
-    return "Tie"
+matchups_df["Team A Pts"] = team_points(matchups_df["Team A"], matchups_df["Week"])
+matchups_df["Team B Pts"] = team_points(matchups_df["Team B"], matchups_df["Week"])
 
-matchups_df["Winner"] = matchups_df.apply(pick_winner, axis=1)
+a, b = matchups_df["Team A"], matchups_df["Team B"]
+a_pts, b_pts = matchups_df["Team A Pts"], matchups_df["Team B Pts"]
+matchups_df["Winner"] = np.select(
+    [a == "BYE", b == "BYE", a_pts > b_pts, b_pts > a_pts, (a_pts == 0) & (b_pts == 0)],
+    [b, a, a, b, ""],  # both 0: week not played yet, left blank
+    default="Tie",
+)
 
 # Full schedule table
 st.dataframe(
@@ -175,11 +147,10 @@ st.dataframe(
 st.subheader(f"📈 Weekly Standings — Week {week_input}")
 
 weekly_totals = (
-    gamelog[(gamelog["userteam"] != "FreeAgent") & (gamelog[gl_week] == week_input)]
-    .groupby("userteam", dropna=False)[gl_fpts]
-    .sum()
+    (week_points[week_input] if week_input in week_points.columns else pd.Series(dtype="float64"))
+    .rename("FantasyPts_week")
+    .rename_axis("userteam")
     .reset_index()
-    .rename(columns={gl_fpts: "FantasyPts_week"})
     .sort_values("FantasyPts_week", ascending=False)
 )
 
@@ -1,15 +1,21 @@
 # 7_WCC_Team_Rosters.py
 # CSV-only version with TWO stat views (toggle):
-#   1) "Fantasy" (computed from Gamelog aggregates, season-to-date or selected weeks)
+#   1) "Fantasy" (from the player x week stat cube, season-to-date or selected weeks)
 #   2) "Season averages" (directly from fantasy_stats_latest.csv)
 #
 # Uses:
-#   - Gamelog/gamelog.csv
+#   - data/fantasy/season_agg.csv, brought up to date with Gamelog/gamelog.csv (see wcc/season_agg.py)
 #   - data/fantasy/fantasy_stats_latest.csv
 
+import os
+import sys
+
 import pandas as pd
 import streamlit as st
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))  # WCC_Fantasy_1231, for wcc/
+from web_app.app_data import cube as stat_cube, fantasy_stats
+
 # -----------------------------
 # Config
 # -----------------------------
@@ -31,11 +37,6 @@ WCC_FULLTEAMNAMES = {
     "San Diego Toreros",
 }
 
-# Week rules
-WEEK0_END = pd.Timestamp("2025-12-27")
-WEEK1_START = pd.Timestamp("2025-12-28")  # Sunday
-SEASON_END = pd.Timestamp("2026-02-28")   # Saturday
-
 st.set_page_config(page_title="WCC Team Rosters", layout="wide")
 
 
@@ -49,60 +50,17 @@ def _pick_col(df: pd.DataFrame, candidates: list[str]) -> str | None:
     return None
 
 
-def add_weeknum_from_date(date_series: pd.Series) -> pd.Series:
-    d = pd.to_datetime(date_series, errors="coerce")
-    weeknum = pd.Series(pd.NA, index=d.index, dtype="Int64")
-
-    weeknum[d.le(WEEK0_END)] = 0
-
-    in_season = d.ge(WEEK1_START) & d.le(SEASON_END)
-    weeknum[in_season] = ((d[in_season] - WEEK1_START).dt.days // 7) + 1
-
-    return weeknum
-
-
-def aggregate_gamelog(
-    gl: pd.DataFrame,
-    player_col: str,
-    team_col: str,
-    fpts_col: str,
-    mp_col: str | None,
-    weeks: list[int] | None = None,
-) -> pd.DataFrame:
-    df = gl.copy()
-
-    if weeks is not None:
-        df = df[df["weeknum"].isin(weeks)]
-
-    df[fpts_col] = pd.to_numeric(df[fpts_col], errors="coerce").fillna(0)
-
-    if mp_col:
-        df[mp_col] = pd.to_numeric(df[mp_col], errors="coerce")
-
-    group_cols = [player_col, team_col]
-
-    agg_dict = {fpts_col: "sum"}
-    if mp_col:
-        agg_dict[mp_col] = "sum"
-
-    out = (
-        df.groupby(group_cols, dropna=False)
-        .agg(agg_dict)
-        .reset_index()
-        .rename(columns={
-            fpts_col: "FantasyPts_sum",
-            **({mp_col: "MP_sum"} if mp_col else {}),
-        })
-    )
-
-    games = df.groupby(group_cols, dropna=False).size().reset_index(name="Games")
-    out = out.merge(games, on=group_cols, how="left")
-
+def cube_view(cube, weeks: list[int] | None = None) -> pd.DataFrame:
+    """PlayerId, FantasyPts_sum, Games, FantasyPts_per_game, MP_sum, MP_per_game over weeks (all when None)."""
+    totals = cube.totals(weeks)
+    out = pd.DataFrame({
+        "PlayerId": totals.index.to_numpy(),
+        "FantasyPts_sum": totals["FantasyPts_sum"].to_numpy(),
+        "Games": totals["FantasyPts_count"].to_numpy(),
+        "MP_sum": totals["MIN_sum"].to_numpy(),
+    })
     out["FantasyPts_per_game"] = (out["FantasyPts_sum"] / out["Games"]).where(out["Games"] > 0, 0)
-
-    if mp_col:
-        out["MP_per_game"] = (out["MP_sum"] / out["Games"]).where(out["Games"] > 0, 0)
-
+    out["MP_per_game"] = (out["MP_sum"] / out["Games"]).where(out["Games"] > 0, 0)
     return out
 
 
@@ -113,32 +71,22 @@ st.title("WCC Team Rosters")
 st.caption("Browse rosters by team and view either Fantasy totals (from gamelog) or Season averages (from fantasy_stats_latest).")
 
 try:
-    gamelog = pd.read_csv(GAMELOG_CSV)
+    cube = stat_cube()
 except Exception as e:
     st.error(f"Could not read {GAMELOG_CSV}: {e}")
     st.stop()
 
 try:
-    latest = pd.read_csv(FANTASY_LATEST_CSV)
+    latest = fantasy_stats()
 except Exception as e:
     st.error(f"Could not read {FANTASY_LATEST_CSV}: {e}")
     st.stop()
 
 # Identify key columns
-gl_player = _pick_col(gamelog, [ "Name"])
-gl_team   = _pick_col(gamelog, ["Team"])
-gl_date   = _pick_col(gamelog, ["Date"])
-gl_fpts   = _pick_col(gamelog, ["FantasyPts"])
-gl_mp     = _pick_col(gamelog, ["MP"])
-
 lt_player = _pick_col(latest, ["Full Name"])
 lt_team   = _pick_col(latest, ["FullTeamName" ])
 
 missing = []
-if not gl_player: missing.append("gamelog player column")
-if not gl_team:   missing.append("gamelog team column")
-if not gl_date:   missing.append("gamelog date column")
-if not gl_fpts:   missing.append("gamelog fantasy points column")
 if not lt_player: missing.append("fantasy_stats_latest player column")
 if not lt_team:   missing.append("fantasy_stats_latest team column")
 
@@ -146,23 +94,9 @@ if missing:
     st.error("Missing required columns:\n- " + "\n- ".join(missing))
     st.stop()
 
-# Normalize strings
-gamelog[gl_player] = gamelog[gl_player].astype(str).str.strip()
-gamelog[gl_team] = gamelog[gl_team].astype(str).str.strip()
-latest[lt_player] = latest[lt_player].astype(str).str.strip()
-latest[lt_team] = latest[lt_team].astype(str).str.strip()
-
-# weeknum (use existing if present, else compute)
-wk_col = _pick_col(gamelog, ["weeknum", "week_num", "Week", "week"])
-if wk_col:
-    if wk_col != "weeknum":
-        gamelog = gamelog.rename(columns={wk_col: "weeknum"})
-else:
-    gamelog["weeknum"] = add_weeknum_from_date(gamelog[gl_date])
-
 # Build roster list for each team from fantasy_stats_latest
-rosters = latest[[lt_player, lt_team]].dropna().drop_duplicates().rename(
-    columns={lt_player: "Player", lt_team: "Team"}
+rosters = latest[[lt_player, lt_team, "player_id"]].dropna().drop_duplicates().rename(
+    columns={lt_player: "Player", lt_team: "Team", "player_id": "PlayerId"}
 )
 rosters["Player"] = rosters["Player"].astype(str).str.strip()
 rosters["Team"] = rosters["Team"].astype(str).str.strip()
@@ -189,7 +123,7 @@ if wcc_only:
 with c3:
     selected_team = st.selectbox("Team", team_list, index=0 if team_list else None)
 
-weeks_available = sorted([int(x) for x in gamelog["weeknum"].dropna().unique().tolist()])
+weeks_available = [int(w) for w in cube.weeks]
 with c4:
     selected_weeks = None
     if (not show_season_avgs) and week_mode:
@@ -210,9 +144,7 @@ if show_season_avgs:
         # fallback: just let user pick any numeric column besides identifiers
         metric_options = [c for c in latest.columns if c not in {lt_player, lt_team, "Player", "Team"}]
 else:
-    metric_options = ["FantasyPts_sum", "FantasyPts_per_game", "Games"]
-    if gl_mp:
-        metric_options += ["MP_sum", "MP_per_game"]
+    metric_options = ["FantasyPts_sum", "FantasyPts_per_game", "Games", "MP_sum", "MP_per_game"]
 
 with c5:
     sort_metric = st.selectbox("Sort by", metric_options, index=0 if metric_options else None)
@@ -234,20 +166,11 @@ if show_season_avgs:
     out = team_roster.merge(team_latest, on=["Player", "Team"], how="left")
 
 else:
-    # Fantasy view from gamelog aggregates
-    gl_team_df = gamelog[gamelog[gl_team] == selected_team].copy()
-
-    agg = aggregate_gamelog(
-        gl=gl_team_df,
-        player_col=gl_player,
-        team_col=gl_team,
-        fpts_col=gl_fpts,
-        mp_col=gl_mp,
-        weeks=selected_weeks if week_mode else None,
-    ).rename(columns={gl_player: "Player", gl_team: "Team"})
+    # Fantasy view: slice the cube to the selected weeks
+    agg = cube_view(cube, selected_weeks if week_mode else None)
 
     team_roster = rosters[rosters["Team"] == selected_team].copy()
-    out = team_roster.merge(agg, on=["Player", "Team"], how="left")
+    out = team_roster.merge(agg, on="PlayerId", how="left")
 
     # Fill missing for players with no games in the window
     for col in ["FantasyPts_sum", "FantasyPts_per_game", "Games", "MP_sum", "MP_per_game"]: